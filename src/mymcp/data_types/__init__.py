@@ -5,6 +5,15 @@
     数据结构
 
     Log:
+        2026-10-19 0.2.1 Me2sY  TextComponent 使用 NBT 字符串快速解码
+                                新增 skip 及 LazyNBT，支持延迟解码
+                                VarLong 修正为 64 位，新增 VarInt.unpack_many 批量解码
+                                BitSet 位查询
+                                新增 VarInt.pack_many 批量编码，修正 Position 负 x 编码
+                                String/TextComponent/OptionalX/IDOrX 按长度跳过，VarInt 解码去除 struct 转换
+                                修正无字段 Combined 编码读取父类注解
+                                OptionalGroupField 缺省时解码为 None
+
         2025-05-27 0.2.0 Me2sY  重构结构
 
         2025-05-17 0.1.0 Me2sY  创建
@@ -22,7 +31,7 @@ __all__ = [
     'Float', 'Double',
     'VarInt', 'VarLong',
     'String', 'TextComponent', 'JsonTextComponent',
-    'Identifier', 'NBT', 'Position', 'Angle', 'UUID',
+    'Identifier', 'NBT', 'LazyNBT', 'Position', 'Angle', 'UUID',
     'BitSet', 'FixedBitSet', 'IDSet', 'TeleportFlags',
 
     'DataPacket', 'Field', 'InnerField', 'OptionalGroupField', 'Combined',
@@ -42,13 +51,12 @@ from dataclasses import dataclass, field
 from inspect import isclass
 from io import BytesIO
 import json
+import os
 from socket import socket
 import struct
-from typing import IO, ClassVar, Self, Any, Sized, Optional, TypeVar, Generic
+from typing import IO, ClassVar, Self, Any, Sized, Optional, TypeVar, Generic, Iterable, Iterator
 import uuid
 
-from mutf8 import decode_modified_utf8
-
 from mymcp.data_types.nbt import TagString, TagCompound, TagCompoundNet, NBTFile
 
 
@@ -94,6 +102,19 @@ class DataType:
         """
         return cls.decode(BytesIO(bytes_data))
 
+    @classmethod
+    def skip(cls, bytes_io: IO, *args, **kwargs) -> None:
+        """
+            跳过，仅移动指针，用于计算长度/延迟解码
+            定长类型直接移动，其余解码后丢弃
+        :param bytes_io:
+        :return:
+        """
+        if cls.BYTES_LENGTH > 0:
+            bytes_io.seek(cls.BYTES_LENGTH, os.SEEK_CUR)
+        else:
+            cls.decode(bytes_io, *args, **kwargs)
+
     def __call__(self, *args, **kwargs):
         return self.value
 
@@ -298,11 +319,60 @@ class VarInt(DataType):
                 break
 
             bytes_encountered += 1
-            if bytes_encountered == 5:
+            if bytes_encountered == cls.MAX_BYTES:
                 raise ValueError("Tried to read too long of a VarInt")
-        return cls(value=struct.unpack(cls.BYTE_ORDER + cls.DECODE_FORMAT,
-            int(number).to_bytes(int(cls.INT_BITS / 8), 'big')
-        )[0])
+
+        # 补码转有符号
+        number &= (1 << cls.INT_BITS) - 1
+        return cls(value=number - (1 << cls.INT_BITS) if number >> (cls.INT_BITS - 1) else number)
+
+    @classmethod
+    def unpack_many(cls, buffer: bytes, count: int, offset: int = 0) -> tuple[list[int], int]:
+        """
+            批量解码连续 count 个 VarInt，不创建对象
+        :param buffer:
+        :param count:
+        :param offset:
+        :return: ([value, ...], 结束偏移)
+        """
+        values = []
+        sign_bit = 1 << (cls.INT_BITS - 1)
+        mask = (1 << cls.INT_BITS) - 1
+        max_shift = 7 * cls.MAX_BYTES
+        append = values.append
+        for _ in range(count):
+            number = 0
+            shift = 0
+            while True:
+                byte = buffer[offset]
+                offset += 1
+                number |= (byte & 0x7F) << shift
+                if not byte & 0x80:
+                    break
+                shift += 7
+                if shift >= max_shift:
+                    raise ValueError("Tried to read too long of a VarInt")
+            number &= mask
+            append(number - mask - 1 if number & sign_bit else number)
+        return values, offset
+
+    @classmethod
+    def pack_many(cls, values: Iterable[int]) -> bytes:
+        """
+            批量编码为连续 VarInt，unpack_many 的逆操作
+        :param values:
+        :return:
+        """
+        mask = (1 << cls.INT_BITS) - 1
+        buffer = bytearray()
+        append = buffer.append
+        for value in values:
+            value = int(value) & mask
+            while value > 0x7F:
+                append((value & 0x7F) | 0x80)
+                value >>= 7
+            append(value)
+        return bytes(buffer)
 
     @classmethod
     def size(cls, value: int | Self) -> int:
@@ -319,6 +389,21 @@ class VarInt(DataType):
                 return size
         raise ValueError("Integer too large")
 
+    @classmethod
+    def skip(cls, bytes_io: IO, *args, **kwargs) -> None:
+        """
+            跳过 VarInt
+        :param bytes_io:
+        :return:
+        """
+        for _ in range(cls.MAX_BYTES):
+            byte = bytes_io.read(1)
+            if len(byte) < 1:
+                raise EOFError("Unexpected end of message.")
+            if not byte[0] & 0x80:
+                return
+        raise ValueError("Tried to read too long of a VarInt")
+
     def __len__(self) -> int:
         """
             self bytes size
@@ -332,7 +417,10 @@ class VarLong(VarInt):
         Variable-length data encoding a two's complement signed 64-bit integer
     """
 
-    MAX_BYTES: ClassVar[int] = 5
+    DECODE_FORMAT: ClassVar[str] = 'q'
+
+    MAX_BYTES: ClassVar[int] = 10
+    INT_BITS: ClassVar[int] = 64
     value: int
 
 
@@ -371,6 +459,10 @@ class String(DataType):
             ).decode('utf-8')
         )
 
+    @classmethod
+    def skip(cls, bytes_io: IO, *args, **kwargs) -> None:
+        bytes_io.seek(VarInt.decode(bytes_io).value, os.SEEK_CUR)
+
 
 class TextComponent(DataType):
     """
@@ -402,10 +494,17 @@ class TextComponent(DataType):
         if bytes_io.read(1) == b'\x08':
             # TagString
             l = UnsignedShort.decode(bytes_io)
-            return cls(value=decode_modified_utf8(bytes_io.read(l.value)))
+            return cls(value=TagString.VALUE_INTERN.decode(bytes_io.read(l.value)))
         else:
             return cls(value=TagCompoundNet.decode(bytes_io))
 
+    @classmethod
+    def skip(cls, bytes_io: IO, *args, **kwargs) -> None:
+        if bytes_io.read(1) == b'\x08':
+            bytes_io.seek(UnsignedShort.decode(bytes_io).value, os.SEEK_CUR)
+        else:
+            TagCompoundNet.skip_value(bytes_io)
+
 
 class JsonTextComponent(DataType):
     """
@@ -467,6 +566,63 @@ class NBT(DataType):
         """
         return value.encode()
 
+    @classmethod
+    def skip(cls, bytes_io: IO, *args, **kwargs) -> None:
+        NBTFile.skip_net(bytes_io)
+
+
+class LazyNBT(NBT):
+    """
+        延迟解码 NBT
+        解码时仅记录原始 bytes，首次访问 value 时才解码
+        未访问过时编码直接返回原始 bytes
+    """
+
+    def __init__(self, value: TagCompoundNet | None = None, raw: bytes | None = None):
+        self._value = value
+        self.raw = raw
+
+    @property
+    def value(self) -> TagCompoundNet:
+        if self._value is None and self.raw is not None:
+            self._value = NBTFile.decode_net(BytesIO(self.raw))
+        return self._value
+
+    @value.setter
+    def value(self, value: TagCompoundNet) -> None:
+        self._value = value
+        self.raw = None
+
+    @property
+    def decoded(self) -> bool:
+        return self._value is not None
+
+    def __repr__(self):
+        if self._value is None:
+            return f"<{self.__class__.__name__}>({len(self.raw)} bytes)"
+        return super().__repr__()
+
+    def __bytes__(self) -> bytes:
+        # 已解码则可能被修改，以 value 为准
+        return self.raw if self._value is None else self.encode(self._value)
+
+    @property
+    def bytes(self) -> bytes:
+        return self.__bytes__()
+
+    @classmethod
+    def decode(cls, bytes_io: IO, *args, **kwargs) -> Self:
+        """
+            跳过并记录原始 bytes
+        :param bytes_io:
+        :return:
+        """
+        start = bytes_io.tell()
+        NBTFile.skip_net(bytes_io)
+        end = bytes_io.tell()
+        bytes_io.seek(start, os.SEEK_SET)
+        return cls(raw=bytes_io.read(end - start))
+
 
 class Position(DataType):
     """
@@ -476,6 +632,8 @@ class Position(DataType):
         followed by y as a 12-bit integer,
     """
 
+    BYTES_LENGTH: ClassVar[int] = 8
+
     value: tuple[int, int, int]
 
     @classmethod
@@ -517,7 +675,7 @@ class Position(DataType):
         else:
             raise ValueError(f"{value} Error.")
 
-        return Long.encode((((x & 0x3FFFFFF) << 38) | ((z & 0x3FFFFFF) << 12) | (y & 0xFFF)))
+        return UnsignedLong.encode((((x & 0x3FFFFFF) << 38) | ((z & 0x3FFFFFF) << 12) | (y & 0xFFF)))
 
     @property
     def x(self) -> int:
@@ -612,6 +770,56 @@ class BitSet(DataType):
         _len = VarInt.decode(bytes_io).value
         return cls(value=[Long.decode(bytes_io).value for _ in range(_len)])
 
+    def get(self, index: int) -> bool:
+        """
+            位 index 是否置位
+        :param index:
+        :return:
+        """
+        long_index = index >> 6
+        if index < 0 or long_index >= len(self.value):
+            return False
+        return bool((self.value[long_index] >> (index & 63)) & 1)
+
+    def rank(self, index: int) -> int:
+        """
+            index 之前置位数量，即该位对应数据在数组中的下标
+        :param index:
+        :return:
+        """
+        long_index = index >> 6
+        count = sum((_ & 0xFFFFFFFFFFFFFFFF).bit_count() for _ in self.value[:long_index])
+        if long_index < len(self.value):
+            count += (self.value[long_index] & ((1 << (index & 63)) - 1) & 0xFFFFFFFFFFFFFFFF).bit_count()
+        return count
+
+    def indexes(self) -> Iterator[int]:
+        """
+            按顺序遍历置位下标
+        :return:
+        """
+        for long_index, long in enumerate(self.value):
+            long &= 0xFFFFFFFFFFFFFFFF
+            while long:
+                low_bit = long & -long
+                yield long_index * 64 + low_bit.bit_length() - 1
+                long ^= low_bit
+
+    @classmethod
+    def from_indexes(cls, indexes: Iterable[int]) -> Self:
+        """
+            由置位下标构建
+        :param indexes:
+        :return:
+        """
+        longs = []
+        for index in indexes:
+            long_index = index >> 6
+            if long_index >= len(longs):
+                longs.extend([0] * (long_index + 1 - len(longs)))
+            longs[long_index] |= 1 << (index & 63)
+        return cls(value=[_ - (1 << 64) if _ >> 63 else _ for _ in longs])
+
 
 class FixedBitSet(DataType):
     """
@@ -869,7 +1077,7 @@ class Combined:
         bs = bytes()
         optional_key_cls = dict()
 
-        for key, key_struct in self.__annotations__.items():
+        for key, key_struct in self.__class__.__annotations__.items():
             value = getattr(self, key)
 
             field_type, data_type = key_struct.__args__
@@ -938,6 +1146,9 @@ class Combined:
                     else:
                         values[key] = data_type.decode(bytes_io)
 
+                else:
+                    values[key] = None
+
             else:
                 if hasattr(data_type, '__origin__') and data_type.__origin__ == list:
                     array_length, values[key] = cls.bytes_to_list(bytes_io, data_type.__args__[0])
@@ -946,6 +1157,15 @@ class Combined:
 
         return cls(**values)
 
+    @classmethod
+    def skip(cls, bytes_io: IO, *args, **kwargs) -> None:
+        """
+            跳过，默认解码后丢弃
+        :param bytes_io:
+        :return:
+        """
+        cls.decode(bytes_io, *args, **kwargs)
+
     @classmethod
     def encode(cls, *args, **kwargs) -> bytes:
         """
@@ -966,7 +1186,7 @@ class Combined:
         :return:
         """
         return {
-            key_name: getattr(self, key_name) for key_name in self.__annotations__.keys()
+            key_name: getattr(self, key_name) for key_name in self.__class__.__annotations__.keys()
         }
 
     @property
@@ -975,7 +1195,7 @@ class Combined:
             Get Tuple
         :return:
         """
-        return tuple(getattr(self, key_name) for key_name in self.__annotations__.keys())
+        return tuple(getattr(self, key_name) for key_name in self.__class__.__annotations__.keys())
 
     @property
     def bytes(self) -> bytes:
@@ -1159,6 +1379,11 @@ class IDOrX(DataType):
         else:
             return cls(_id=_id)
 
+    @classmethod
+    def skip(cls, bytes_io: IO, *args, **kwargs) -> None:
+        if VarInt.decode(bytes_io).value == 0:
+            cls.ITEM_CLS.skip(bytes_io)
+
 
 class IDOrSoundEvent(IDOrX):
     ITEM_CLS: ClassVar[DataType] = SoundEvent
@@ -1197,6 +1422,11 @@ class OptionalX(DataType):
         else:
             return cls(value=None)
 
+    @classmethod
+    def skip(cls, bytes_io: IO, *args, **kwargs) -> None:
+        if Boolean.decode(bytes_io):
+            cls.ITEM_CLS.skip(bytes_io)
+
     def __bytes__(self) -> bytes:
         return Boolean.FALSE if self.value is None else Boolean.TRUE + self.value.bytes
 
@@ -4,6 +4,21 @@
     ~~~~~~~~~~~~~~~~~~
     
     Log:
+        2026-10-19 0.2.1 Me2sY  PalettedContainer to_array/from_array
+                                支持 NumPy 向量化
+                                data_array 改为 PackedLongArray，保存原始 bytes
+                                ChunkData 延迟解码模式，Section/Heightmaps/BlockEntity 按需解码
+                                ContentInterner 按内容共享 Section/LightArray
+                                单值 PalettedContainer 共享实例
+                                LightArray 改为 2048 bytes Nibble 数组，LightData 按 Mask 查询，向量化展开
+                                Heightmap 整体解包/打包
+                                BlockEntity NBT 延迟解码
+                                ContentInterner 仅将实际驻留的 ndarray 置为只读
+                                单值 PalettedContainer 不再共享全局实例
+                                整个 Section 由 ContentInterner 共享
+                                ContentInterner 驻留实例只读化，只读标记保存在实例自身
+                                ContentInterner 按 LRU 淘汰
+
         2025-05-26 0.2.0 Me2sY  重构结构
 
         2025-05-22 0.1.0 Me2sY  创建
@@ -14,16 +29,416 @@ __version__ = '0.2.0'
 
 __all__ = [
     'ChunkData', 'LightData', 'ChunkSection', 'BlockEntity',
-    'PalettedContainer', 'PalettedContainerBiomes', 'PalettedContainerBlocks'
+    'PalettedContainer', 'PalettedContainerBiomes', 'PalettedContainerBlocks',
+    'PackedLongArray', 'LazyArray', 'ContentInterner', 'unpack_longs', 'pack_longs',
+    'expand_nibbles', 'nibble_at', 'heightmap_bits', 'unpack_heightmap', 'pack_heightmap'
 ]
 
+from array import array
+from collections import OrderedDict
 from dataclasses import dataclass
+import hashlib
 from io import BytesIO
-from typing import ClassVar, Self, Union
+import os
+import struct
+from typing import ClassVar, Self, Union, Sequence, Any, IO, Iterator, Callable
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 from mymcp.data_types import (
-    UnsignedByte, VarInt, Short, NBT, BitSet, Combined, Field, UnsignedLong, InnerField, Byte, DataPacket
+    UnsignedByte, VarInt, Short, NBT, LazyNBT, BitSet, Combined, Field, UnsignedLong, InnerField, Byte, DataPacket,
+    DataType
 )
+from mymcp.data_types.frozen import freeze, is_frozen
+from mymcp.data_types.nbt import TagLongArray
+
+
+# Block State ID 最大 15 bits，使用 uint16 存储
+ARRAY_TYPECODE = 'H'
+
+
+def unpack_longs(longs: bytes | Sequence[int], bits: int, count: int) -> Any:
+    """
+        解包 Long 数组，每个 Long 存放 64 // bits 个值，值不跨 Long (1.16+)
+        longs 可为大端原始 bytes 或 int 序列
+        有 NumPy 时返回 ndarray(uint16)，否则返回 array('H')
+    :param longs:
+    :param bits:
+    :param count:
+    :return:
+    """
+    values_per_long = 64 // bits
+    mask = (1 << bits) - 1
+
+    if np is not None:
+        if isinstance(longs, (bytes, bytearray, memoryview)):
+            longs = np.frombuffer(longs, dtype='>u8')
+        else:
+            # NBT TagLongArray 为有符号 Long
+            try:
+                longs = np.asarray(longs, dtype=np.int64).view(np.uint64)
+            except OverflowError:
+                longs = np.asarray(longs, dtype=np.uint64)
+        shifts = np.arange(values_per_long, dtype=np.uint64) * np.uint64(bits)
+        values = (np.asarray(longs, dtype=np.uint64)[:, None] >> shifts) & np.uint64(mask)
+        return values.reshape(-1)[:count].astype(np.uint16)
+
+    if isinstance(longs, (bytes, bytearray, memoryview)):
+        longs = struct.unpack(f'>{len(longs) // 8}Q', longs)
+
+    shifts = [_ * bits for _ in range(values_per_long)]
+    values = array(ARRAY_TYPECODE, [(long >> shift) & mask for long in longs for shift in shifts])
+    del values[count:]
+    return values
+
+
+def pack_longs(values: Sequence[int], bits: int) -> bytes:
+    """
+        打包为大端 Long 数组 bytes，unpack_longs 逆操作
+    :param values:
+    :param bits:
+    :return:
+    """
+    values_per_long = 64 // bits
+    longs_count = -(-len(values) // values_per_long)
+
+    if np is not None:
+        padded = np.zeros(longs_count * values_per_long, dtype=np.uint64)
+        padded[:len(values)] = values
+        shifts = np.arange(values_per_long, dtype=np.uint64) * np.uint64(bits)
+        longs = np.bitwise_or.reduce(padded.reshape(longs_count, values_per_long) << shifts, axis=1)
+        return longs.astype('>u8').tobytes()
+
+    longs = []
+    for start in range(0, len(values), values_per_long):
+        long = 0
+        for shift, value in enumerate(values[start: start + values_per_long]):
+            long |= value << (shift * bits)
+        longs.append(long)
+    return struct.pack(f'>{longs_count}Q', *longs)
+
+
+# 16 * 16 列
+HEIGHTMAP_ENTRIES = 256
+
+
+def heightmap_bits(height: int) -> int:
+    """
+        Heightmap 每值位数 ceil(log2(height + 1))
+    :param height: 维度高度
+    :return:
+    """
+    return height.bit_length()
+
+
+def unpack_heightmap(longs: Sequence[int], height: int) -> Any:
+    """
+        解包 Heightmap TagLongArray，下标为 z * 16 + x
+        值为最高方块相对维度底部的高度 + 1，0 表示该列没有方块
+    :param longs:
+    :param height: 维度高度
+    :return:
+    """
+    return unpack_longs(longs, heightmap_bits(height), HEIGHTMAP_ENTRIES)
+
+
+def pack_heightmap(values: Sequence[int], height: int) -> tuple[int, ...]:
+    """
+        打包为 TagLongArray 有符号 Long
+    :param values:
+    :param height:
+    :return:
+    """
+    raw = pack_longs(values, heightmap_bits(height))
+    return struct.unpack(f'>{len(raw) // 8}q', raw)
+
+
+def nibble_at(buffer: bytes, index: int) -> int:
+    """
+        Nibble 数组取值，偶数下标为低 4 位
+    :param buffer:
+    :param index: (y * 16 + z) * 16 + x
+    :return:
+    """
+    return (buffer[index >> 1] >> ((index & 1) << 2)) & 0xF
+
+
+def expand_nibbles(buffer: bytes) -> Any:
+    """
+        2048 bytes Nibble 数组展开为 4096 长度数组
+        有 NumPy 时返回 ndarray(uint8)，否则返回 array('B')
+    :param buffer:
+    :return:
+    """
+    if np is not None:
+        packed = np.frombuffer(buffer, dtype=np.uint8)
+        values = np.empty(packed.size * 2, dtype=np.uint8)
+        values[0::2] = packed & 0xF
+        values[1::2] = packed >> 4
+        return values
+
+    values = array('B', bytes(len(buffer) * 2))
+    values[0::2] = array('B', [_ & 0xF for _ in buffer])
+    values[1::2] = array('B', [_ >> 4 for _ in buffer])
+    return values
+
+
+class PackedLongArray(DataType):
+    """
+        Prefixed Array of Long
+        以一段不可变大端 bytes 保存，避免为每个 Long 创建 UnsignedLong 对象
+        按下标访问时才生成 UnsignedLong
+    """
+
+    value: bytes
+
+    @classmethod
+    def encode(cls, value: bytes, *args, **kwargs) -> bytes:
+        """
+            编码
+        :param value:
+        :return:
+        """
+        return VarInt.encode(len(value) // 8) + value
+
+    @classmethod
+    def decode(cls, bytes_io: IO, *args, **kwargs) -> Self:
+        """
+            解码，直接切片原始 bytes
+        :param bytes_io:
+        :return:
+        """
+        return cls(value=bytes_io.read(VarInt.decode(bytes_io).value * 8))
+
+    @classmethod
+    def skip(cls, bytes_io: IO, *args, **kwargs) -> None:
+        bytes_io.seek(VarInt.decode(bytes_io).value * 8, os.SEEK_CUR)
+
+    @classmethod
+    def from_longs(cls, longs: Sequence[int | UnsignedLong]) -> Self:
+        """
+            由 Long 序列创建，兼容 list[UnsignedLong]
+        :param longs:
+        :return:
+        """
+        return cls(value=struct.pack(
+            f'>{len(longs)}Q', *((_.value if isinstance(_, DataType) else _) & 0xFFFFFFFFFFFFFFFF for _ in longs)
+        ))
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}>({len(self)} Longs)"
+
+    def __len__(self) -> int:
+        return len(self.value) // 8
+
+    def __bool__(self) -> bool:
+        return len(self.value) > 0
+
+    def __getitem__(self, item: int) -> UnsignedLong:
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError(item)
+        return UnsignedLong(value=struct.unpack_from('>Q', self.value, item * 8)[0])
+
+    def __iter__(self) -> Iterator[UnsignedLong]:
+        for long in self.longs:
+            yield UnsignedLong(value=long)
+
+    @property
+    def longs(self) -> tuple[int, ...]:
+        """
+            全部 Long 值
+        :return:
+        """
+        return struct.unpack(f'>{len(self)}Q', self.value)
+
+
+class LazyArray(Sequence):
+    """
+        延迟解码数组
+        保存原始 bytes，首次访问某项时才解码该项
+        编码时未访问过的项直接写回原始 bytes
+    """
+
+    def __init__(self, raw: bytes, count: int, item_cls: Any, offsets: list[int] | None = None):
+        self.raw = raw
+        self.item_cls = item_cls
+        self._items: list[Any] = [None] * count
+        self._offsets = offsets
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}({self.item_cls.__name__})>({self.decoded_count}/{len(self)} Decoded)"
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, item: int | slice) -> Any:
+        if isinstance(item, slice):
+            return [self[_] for _ in range(*item.indices(len(self)))]
+
+        value = self._items[item]
+        if value is None:
+            bytes_io = BytesIO(self.raw)
+            bytes_io.seek(self.offsets[item if item >= 0 else item + len(self)])
+            value = self._items[item] = self.item_cls.decode(bytes_io)
+        return value
+
+    def __setitem__(self, item: int, value: Any) -> None:
+        self._items[item] = value
+
+    @property
+    def offsets(self) -> list[int]:
+        """
+            各项起始位置，末尾为总长度，首次使用时跳过计算
+        :return:
+        """
+        if self._offsets is None:
+            bytes_io = BytesIO(self.raw)
+            offsets = [0]
+            for _ in range(len(self)):
+                self.item_cls.skip(bytes_io)
+                offsets.append(bytes_io.tell())
+            self._offsets = offsets
+        return self._offsets
+
+    @property
+    def decoded_count(self) -> int:
+        return sum(1 for _ in self._items if _ is not None)
+
+    def is_decoded(self, item: int) -> bool:
+        return self._items[item] is not None
+
+    @property
+    def bytes(self) -> bytes:
+        """
+            编码 (不含数组长度)
+        :return:
+        """
+        if all(_ is None for _ in self._items):
+            return self.raw
+
+        offsets = self.offsets
+        return b''.join(
+            self.raw[offsets[index]: offsets[index + 1]] if value is None else value.bytes
+            for index, value in enumerate(self._items)
+        )
+
+    @classmethod
+    def decode(cls, bytes_io: IO, count: int, item_cls: Any) -> Self:
+        """
+            跳过 count 项，记录原始 bytes 及偏移
+        :param bytes_io:
+        :param count:
+        :param item_cls:
+        :return:
+        """
+        start = bytes_io.tell()
+        offsets = [0]
+        for _ in range(count):
+            item_cls.skip(bytes_io)
+            offsets.append(bytes_io.tell() - start)
+        bytes_io.seek(start, os.SEEK_SET)
+        return cls(bytes_io.read(offsets[-1]), count, item_cls, offsets)
+
+
+class ContentInterner:
+    """
+        内容哈希驻留
+        内容相同的 ChunkSection/LightArray/ID 数组共享同一只读实例 (见 frozen.freeze)
+        只读标记保存在实例自身，清空驻留表后仍有效，修改前须由 frozen.thaw 复制
+        超过 max_size 时按 LRU 淘汰，淘汰的实例仍只读
+        由仍引用它的 Chunk 持有，卸载后即可回收
+    """
+
+    DIGEST_SIZE: ClassVar[int] = 16
+
+    def __init__(self, max_size: int = 4096):
+        """
+        :param max_size: 最大驻留数量
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._objects: OrderedDict[tuple[Any, bytes], Any] = OrderedDict()
+
+    def __repr__(self):
+        return f"<ContentInterner>({len(self._objects)} hits={self.hits} misses={self.misses})"
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    @classmethod
+    def digest(cls, raw: Any) -> bytes:
+        """
+            内容哈希，raw 为任意连续 buffer
+        :param raw:
+        :return:
+        """
+        return hashlib.blake2b(raw, digest_size=cls.DIGEST_SIZE).digest()
+
+    def intern(self, kind: Any, raw: Any, factory: Callable[[], Any]) -> Any:
+        """
+            按 (kind, 内容哈希) 查找共享实例，未命中时由 factory 创建，驻留的实例只读化
+        :param kind:
+        :param raw:
+        :param factory:
+        :return:
+        """
+        key = (kind, self.digest(raw))
+        obj = self._objects.get(key)
+        if obj is not None:
+            self.hits += 1
+            self._objects.move_to_end(key)
+            return obj
+
+        self.misses += 1
+        obj = self._objects[key] = freeze(factory())
+        if len(self._objects) > self.max_size:
+            self._objects.popitem(last=False)
+        return obj
+
+    def decode(self, item_cls: Any, bytes_io: IO) -> Any:
+        """
+            读取 item_cls 原始 bytes 并驻留，命中时不解码
+        :param item_cls: 须实现 skip
+        :param bytes_io:
+        :return:
+        """
+        start = bytes_io.tell()
+        item_cls.skip(bytes_io)
+        end = bytes_io.tell()
+        bytes_io.seek(start, os.SEEK_SET)
+        raw = bytes_io.read(end - start)
+        return self.intern(item_cls, raw, lambda: item_cls.decode(BytesIO(raw)))
+
+    def intern_buffer(self, value: Any) -> Any:
+        """
+            驻留 ID 数组 (ndarray/array) 或 bytes，int 原样返回
+            驻留的 ndarray 置为只读，array 替换为 FrozenArray
+        :param value:
+        :return:
+        """
+        if isinstance(value, int):
+            return value
+        return self.intern(array if isinstance(value, array) else value.__class__, value, lambda: value)
+
+    @staticmethod
+    def is_shared(obj: Any) -> bool:
+        """
+            是否为只读共享实例
+        :param obj:
+        :return:
+        """
+        return is_frozen(obj)
+
+    def clear(self) -> None:
+        self._objects.clear()
+        self.hits = 0
+        self.misses = 0
 
 
 @dataclass
@@ -38,20 +453,39 @@ class PalettedContainer(Combined):
     TYPE_INDIRECT: ClassVar[int] = 1
     TYPE_DIRECT: ClassVar[int] = 2
 
+    # 16 * 16 * 16 Blocks
+    ENTRIES: ClassVar[int] = 4096
+
     bits_per_entry: Field | UnsignedByte
     palette: Field | Union[VarInt, list[VarInt], None] = None
-    data_array: Field | list[UnsignedLong] = None
+    data_array: Field | PackedLongArray = None
     paletted_type: InnerField | int = -1
 
+    def __post_init__(self):
+        # 兼容 list[UnsignedLong]
+        if isinstance(self.data_array, list):
+            self.data_array = PackedLongArray.from_longs(self.data_array)
+
     def __bytes__(self) -> bytes:
         """
             编码
         :return:
         """
         bs = self.bits_per_entry.bytes
-        if self.palette is not None:
+        if isinstance(self.palette, list):
+            bs += self.list_to_bytes(self.palette)
+        elif self.palette is not None:
             bs += self.palette.bytes
-        return bs + self.list_to_bytes(self.data_array)
+        return bs + self.data_array.bytes
+
+    @classmethod
+    def single_value(cls, value: int) -> Self:
+        """
+            单值容器，每次返回新实例
+        :param value:
+        :return:
+        """
+        return cls(UnsignedByte(0), VarInt(value), PackedLongArray(b''), cls.TYPE_SINGLE_VALUE)
 
     @classmethod
     def decode(cls, bytes_source: bytes | BytesIO, *args, **kwargs) -> Self:
@@ -67,7 +501,10 @@ class PalettedContainer(Combined):
 
         if bits_per_entry.value == cls.SINGLE_VALUED:
             palette = VarInt.decode(bytes_io)
-            paletted_type = cls.TYPE_SINGLE_VALUE
+            data_array = PackedLongArray.decode(bytes_io)
+            if not data_array:
+                return cls.single_value(palette.value)
+            return cls(bits_per_entry, palette, data_array, cls.TYPE_SINGLE_VALUE)
 
         elif cls.INDIRECT_MIN <= bits_per_entry.value <= cls.INDIRECT_MAX:
             palette = cls.bytes_to_list(bytes_io, VarInt)[1]
@@ -80,7 +517,80 @@ class PalettedContainer(Combined):
         else:
             raise ValueError(f'Invalid bits_per_entry {bits_per_entry}')
 
-        return cls(bits_per_entry, palette, cls.bytes_to_list(bytes_io, UnsignedLong)[1], paletted_type)
+        return cls(bits_per_entry, palette, PackedLongArray.decode(bytes_io), paletted_type)
+
+    @classmethod
+    def skip(cls, bytes_io: IO, *args, **kwargs) -> None:
+        """
+            跳过
+        :param bytes_io:
+        :return:
+        """
+        bits_per_entry = bytes_io.read(1)[0]
+
+        if bits_per_entry == cls.SINGLE_VALUED:
+            VarInt.skip(bytes_io)
+
+        elif cls.INDIRECT_MIN <= bits_per_entry <= cls.INDIRECT_MAX:
+            for _ in range(VarInt.decode(bytes_io).value):
+                VarInt.skip(bytes_io)
+
+        PackedLongArray.skip(bytes_io)
+
+    def to_array(self) -> Any:
+        """
+            解包为 ENTRIES 长度的 ID 数组，下标为 (y * 16 + z) * 16 + x (Biomes 为 4 * 4 * 4)
+            有 NumPy 时返回 ndarray(uint16)，否则返回 array('H')
+        :return:
+        """
+        if self.paletted_type == self.TYPE_SINGLE_VALUE:
+            if np is not None:
+                return np.full(self.ENTRIES, self.palette.value, dtype=np.uint16)
+            return array(ARRAY_TYPECODE, [self.palette.value]) * self.ENTRIES
+
+        indices = unpack_longs(self.data_array.value, self.bits_per_entry.value, self.ENTRIES)
+
+        if self.paletted_type == self.TYPE_DIRECT:
+            return indices
+
+        if np is not None:
+            return np.asarray([_.value for _ in self.palette], dtype=np.uint16)[indices]
+
+        palette = [_.value for _ in self.palette]
+        return array(ARRAY_TYPECODE, [palette[_] for _ in indices])
+
+    @classmethod
+    def from_array(cls, values: Sequence[int]) -> Self:
+        """
+            由 ID 数组构建，自动选择最优 palette 类型及 bits_per_entry
+        :param values:
+        :return:
+        """
+        if len(values) != cls.ENTRIES:
+            raise ValueError(f'{cls.__name__} needs {cls.ENTRIES} entries, got {len(values)}')
+
+        if np is not None:
+            palette, indices = np.unique(np.asarray(values, dtype=np.uint16), return_inverse=True)
+            palette = palette.tolist()
+        else:
+            palette = sorted(set(values))
+            lookup = {value: index for index, value in enumerate(palette)}
+            indices = [lookup[_] for _ in values]
+
+        if len(palette) == 1:
+            return cls.single_value(palette[0])
+
+        bits = max(cls.INDIRECT_MIN, (len(palette) - 1).bit_length())
+        if bits <= cls.INDIRECT_MAX:
+            return cls(
+                UnsignedByte(bits), [VarInt(_) for _ in palette],
+                PackedLongArray(pack_longs(indices, bits)), cls.TYPE_INDIRECT
+            )
+
+        return cls(
+            UnsignedByte(cls.DIRECT), None,
+            PackedLongArray(pack_longs(values, cls.DIRECT)), cls.TYPE_DIRECT
+        )
 
 
 @dataclass
@@ -94,6 +604,9 @@ class PalettedContainerBiomes(PalettedContainer):
     INDIRECT_MAX: ClassVar[int] = 3
     DIRECT: ClassVar[int] = 6
 
+    # 4 * 4 * 4 Biomes
+    ENTRIES: ClassVar[int] = 64
+
 
 @dataclass
 class ChunkSection(Combined):
@@ -102,43 +615,150 @@ class ChunkSection(Combined):
     block_states: Field | PalettedContainerBlocks
     biomes: Field | PalettedContainerBiomes
 
+    @classmethod
+    def skip(cls, bytes_io: IO, *args, **kwargs) -> None:
+        bytes_io.seek(Short.BYTES_LENGTH, os.SEEK_CUR)
+        PalettedContainerBlocks.skip(bytes_io)
+        PalettedContainerBiomes.skip(bytes_io)
+
 
 @dataclass
 class BlockEntity(Combined):
+    """
+        data 解码为 LazyNBT，首次访问 value 时才解码
+    """
 
     packed_xz: Field | UnsignedByte
     y: Field | Short
     type_: Field | VarInt
     data: Field | NBT
 
+    def position(self, chunk_x: int, chunk_z: int) -> tuple[int, int, int]:
+        """
+            世界坐标
+        :param chunk_x:
+        :param chunk_z:
+        :return: (x, y, z)
+        """
+        packed_xz = self.packed_xz.value
+        return (chunk_x << 4) | (packed_xz >> 4), self.y.value, (chunk_z << 4) | (packed_xz & 15)
+
+    @classmethod
+    def create(cls, x: int, y: int, z: int, type_: int, data: NBT) -> Self:
+        """
+            由世界坐标创建
+        :param x:
+        :param y:
+        :param z:
+        :param type_:
+        :param data:
+        :return:
+        """
+        return cls(UnsignedByte(((x & 15) << 4) | (z & 15)), Short(y), VarInt(type_), data)
+
+    @classmethod
+    def decode(cls, bytes_io: IO, *args, **kwargs) -> Self:
+        return cls(
+            UnsignedByte.decode(bytes_io), Short.decode(bytes_io), VarInt.decode(bytes_io), LazyNBT.decode(bytes_io)
+        )
+
+    @classmethod
+    def skip(cls, bytes_io: IO, *args, **kwargs) -> None:
+        bytes_io.seek(UnsignedByte.BYTES_LENGTH + Short.BYTES_LENGTH, os.SEEK_CUR)
+        VarInt.skip(bytes_io)
+        NBT.skip(bytes_io)
+
 
 @dataclass
 class ChunkData(Combined):
+    """
+        lazy 模式下 heightmaps 为 LazyNBT，chunk_sections/block_entities 为 LazyArray，访问时才解码
+    """
 
     heightmaps: Field | NBT
     chunk_byte_size: Field | VarInt
-    chunk_sections: Field | list[ChunkSection]
-    block_entities: Field | list[BlockEntity]
+    chunk_sections: Field | list[ChunkSection] | LazyArray
+    block_entities: Field | list[BlockEntity] | LazyArray
     dimension_chunk_size: InnerField | int = 24
 
     def __repr__(self):
         return f"<ChunkData>({self.chunk_byte_size} {len(self.chunk_sections)})"
 
     def __bytes__(self) -> bytes:
-        bs = self.heightmaps.bytes + self.chunk_byte_size.bytes + b''.join(_.bytes for _ in self.chunk_sections)
+        if isinstance(self.chunk_sections, LazyArray):
+            sections = self.chunk_sections.bytes
+        else:
+            sections = b''.join(_.bytes for _ in self.chunk_sections)
+
+        bs = self.heightmaps.bytes + VarInt.encode(len(sections)) + sections
+
+        if isinstance(self.block_entities, LazyArray):
+            return bs + VarInt.encode(len(self.block_entities)) + self.block_entities.bytes
         return bs + self.list_to_bytes(self.block_entities)
 
+    @property
+    def lazy(self) -> bool:
+        return isinstance(self.chunk_sections, LazyArray)
+
+    def heightmap(self, name: str = 'MOTION_BLOCKING') -> Any:
+        """
+            解包 Heightmap，见 unpack_heightmap
+        :param name: MOTION_BLOCKING / WORLD_SURFACE ...
+        :return: 不存在时为 None
+        """
+        tag = self.heightmaps.value.get(name)
+        if tag is None:
+            return None
+        return unpack_heightmap(tag.value, self.dimension_chunk_size * 16)
+
+    def set_heightmap(self, name: str, values: Sequence[int]) -> None:
+        """
+            打包写回 Heightmap
+        :param name:
+        :param values:
+        :return:
+        """
+        longs = pack_heightmap(values, self.dimension_chunk_size * 16)
+        compound = self.heightmaps.value
+        tag = compound.get(name)
+        if tag is None:
+            compound.value.append(TagLongArray(name=name, value=longs))
+        else:
+            tag.value = longs
+
     @classmethod
     def decode(
-            cls, bytes_source: bytes | BytesIO | DataPacket, dimension_chunk_size: int = 24, *args, **kwargs
+            cls, bytes_source: bytes | BytesIO | DataPacket, dimension_chunk_size: int = 24, *args,
+            lazy: bool = False, interner: ContentInterner | None = None, **kwargs
     ) -> Self:
+        """
+            解码
+        :param bytes_source:
+        :param dimension_chunk_size:
+        :param lazy: 延迟解码，仅记录原始 bytes
+        :param interner: 非 lazy 模式下按内容共享 ChunkSection
+        :return:
+        """
         bytes_io = cls.to_bytes_io(bytes_source)
-        heightmaps = NBT.decode(bytes_io)
-        chunk_byte_size = VarInt.decode(bytes_io)
-        chunk_sections = [
-            ChunkSection.decode(bytes_io) for _ in range(dimension_chunk_size)
-        ]
-        block_entities = cls.bytes_to_list(bytes_io, BlockEntity)[1]
+
+        if lazy:
+            heightmaps = LazyNBT.decode(bytes_io)
+            chunk_byte_size = VarInt.decode(bytes_io)
+            chunk_sections = LazyArray(bytes_io.read(chunk_byte_size.value), dimension_chunk_size, ChunkSection)
+            block_entities = LazyArray.decode(bytes_io, VarInt.decode(bytes_io).value, BlockEntity)
+        else:
+            heightmaps = NBT.decode(bytes_io)
+            chunk_byte_size = VarInt.decode(bytes_io)
+            if interner is None:
+                chunk_sections = [
+                    ChunkSection.decode(bytes_io) for _ in range(dimension_chunk_size)
+                ]
+            else:
+                chunk_sections = [
+                    interner.decode(ChunkSection, bytes_io) for _ in range(dimension_chunk_size)
+                ]
+            block_entities = cls.bytes_to_list(bytes_io, BlockEntity)[1]
+
         return cls(
             heightmaps, chunk_byte_size, chunk_sections, block_entities, dimension_chunk_size=dimension_chunk_size
         )
@@ -146,10 +766,37 @@ class ChunkData(Combined):
 
 @dataclass(slots=True)
 class LightData(Combined):
+    """
+        Mask 位 i 对应 Section 下标 i - 1 (位 0 为世界最低 Section 下方一层)
+        Light 数组按 Mask 置位顺序排列，每个为 2048 bytes Nibble 数组
+    """
 
     @dataclass(slots=True)
     class LightArray(Combined):
-        lights: Field | list[Byte]
+
+        SIZE = 2048
+
+        lights: Field | bytes
+
+        def __post_init__(self):
+            # 兼容 list[Byte]
+            if isinstance(self.lights, list):
+                self.lights = bytes(_.value & 0xFF for _ in self.lights)
+
+        def __bytes__(self) -> bytes:
+            return VarInt.encode(len(self.lights)) + self.lights
+
+        @classmethod
+        def decode(cls, bytes_source: bytes | BytesIO, *args, **kwargs) -> Self:
+            bytes_io = cls.to_bytes_io(bytes_source)
+            return cls(bytes_io.read(VarInt.decode(bytes_io).value))
+
+        @classmethod
+        def skip(cls, bytes_io: IO, *args, **kwargs) -> None:
+            bytes_io.seek(VarInt.decode(bytes_io).value, os.SEEK_CUR)
+
+    # 全 0 Nibble 数组
+    EMPTY = bytes(LightArray.SIZE)
 
     sky_light_mask: Field | BitSet
     block_light_mask: Field | BitSet
@@ -157,3 +804,83 @@ class LightData(Combined):
     empty_block_light_mask: Field | BitSet
     sky_light_arrays: Field | list[LightArray]
     block_light_arrays: Field | list[LightArray]
+
+    @staticmethod
+    def lookup(mask: BitSet, empty_mask: BitSet, arrays: list[LightArray], index: int) -> bytes | None:
+        """
+            按 Mask 查找 Light 数组
+        :param mask:
+        :param empty_mask:
+        :param arrays:
+        :param index: Mask 位下标
+        :return: 未包含时为 None，empty 时为 EMPTY
+        """
+        if mask.get(index):
+            return arrays[mask.rank(index)].lights
+        if empty_mask.get(index):
+            return LightData.EMPTY
+        return None
+
+    @staticmethod
+    def sections(mask: BitSet, empty_mask: BitSet, arrays: list[LightArray]) -> dict[int, bytes]:
+        """
+            Mask 位下标 -> Nibble 数组，empty 位为 EMPTY
+        :param mask:
+        :param empty_mask:
+        :param arrays:
+        :return:
+        """
+        result = dict.fromkeys(empty_mask.indexes(), LightData.EMPTY)
+        result.update(zip(mask.indexes(), (_.lights for _ in arrays)))
+        return result
+
+    def sky_light(self, section_index: int) -> bytes | None:
+        """
+        :param section_index: Section 下标，0 为世界最低 Section
+        :return:
+        """
+        return self.lookup(self.sky_light_mask, self.empty_sky_light_mask, self.sky_light_arrays, section_index + 1)
+
+    def block_light(self, section_index: int) -> bytes | None:
+        return self.lookup(
+            self.block_light_mask, self.empty_block_light_mask, self.block_light_arrays, section_index + 1
+        )
+
+    def sky_light_at(self, x: int, y: int, z: int, min_y: int = -64) -> int | None:
+        """
+            方块坐标亮度 (Chunk 内，x/z 取低 4 位)
+        :param x:
+        :param y:
+        :param z:
+        :param min_y:
+        :return:
+        """
+        lights = self.sky_light((y - min_y) >> 4)
+        return None if lights is None else nibble_at(lights, ((y & 15) << 8) | ((z & 15) << 4) | (x & 15))
+
+    def block_light_at(self, x: int, y: int, z: int, min_y: int = -64) -> int | None:
+        lights = self.block_light((y - min_y) >> 4)
+        return None if lights is None else nibble_at(lights, ((y & 15) << 8) | ((z & 15) << 4) | (x & 15))
+
+    @classmethod
+    def decode(
+            cls, bytes_source: bytes | BytesIO | DataPacket, *args, interner: ContentInterner | None = None, **kwargs
+    ) -> Self:
+        """
+            解码
+        :param bytes_source:
+        :param interner: 按内容共享 LightArray
+        :return:
+        """
+        if interner is None:
+            return super(LightData, cls).decode(bytes_source)
+
+        bytes_io = cls.to_bytes_io(bytes_source)
+        masks = [BitSet.decode(bytes_io) for _ in range(4)]
+        sky_light_arrays = [
+            interner.decode(cls.LightArray, bytes_io) for _ in range(VarInt.decode(bytes_io).value)
+        ]
+        block_light_arrays = [
+            interner.decode(cls.LightArray, bytes_io) for _ in range(VarInt.decode(bytes_io).value)
+        ]
+        return cls(*masks, sky_light_arrays, block_light_arrays)
@@ -4,6 +4,10 @@
     ~~~~~~~~~~~~~~~~~~
     
     Log:
+        2026-10-19 0.2.1 Me2sY  元数据类型按 int 分发，按长度跳过
+                                LazyEntityMetadata 延迟解码/按下标过滤解码
+                                修正 Particles 类型编码判断
+
         2025-05-27 0.2.0 Me2sY  重构
 
         2025-05-22 0.1.3 Me2sY  完成，注意！未充分测试！
@@ -15,16 +19,19 @@ __author__ = 'Me2sY'
 __version__ = '0.2.0'
 
 __all__ = [
-    'EntityMetadata'
+    'METADATA_TYPES', 'EntityMetadata', 'LazyEntityMetadata'
 ]
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from io import BytesIO
-from typing import Self, ClassVar, Optional, Any
+import os
+from typing import Self, ClassVar, Optional, Any, IO, Iterable, Iterator
 
 from mymcp.data_types import (
     Combined, VarInt, Byte, VarLong, Float, String, TextComponent, OptionalTextComponent, Boolean, Position,
-    OptionalPosition, OptionalUUID, NBT, Identifier, IDSet, Int, IDOrX, OptionalIdentifier, UnsignedByte, Field
+    OptionalPosition, OptionalUUID, NBT, Identifier, IDSet, Int, IDOrX, OptionalIdentifier, UnsignedByte, Field,
+    DataPacket, DataType
 )
 from mymcp.data_types.particle import Particle
 from mymcp.data_types.slot import Slot
@@ -56,43 +63,60 @@ class IDOrPaintingVariant(IDOrX):
     ITEM_CLS: ClassVar[PaintingVariant] = PaintingVariant
 
 
-EntityMetadataFormatMap = {
-    VarInt(0): (Byte,),
-    VarInt(1): (VarInt,),
-    VarInt(2): (VarLong,),
-    VarInt(3): (Float,),
-    VarInt(4): (String,),
-    VarInt(5): (TextComponent,),
-    VarInt(6): (OptionalTextComponent,),
-    VarInt(7): (Slot,),
-    VarInt(8): (Boolean,),
-    VarInt(9): (Float, Float, Float,),
-    VarInt(10): (Position,),
-    VarInt(11): (OptionalPosition,),
-    VarInt(12): (VarInt,),
-    VarInt(13): (OptionalUUID,),
-    VarInt(14): (VarInt,),
-    VarInt(15): (VarInt,),
-    VarInt(16): (NBT,),
-    VarInt(17): (Particle,),
-    VarInt(18): (VarInt, Particle,),
-    VarInt(19): (VarInt, VarInt, VarInt,),
-    VarInt(20): (VarInt,),
-    VarInt(21): (VarInt,),
-    VarInt(22): (VarInt,),
-    VarInt(23): (IDOrWolfVariant,),
-    VarInt(24): (VarInt,),
-    VarInt(25): (Boolean, OptionalIdentifier, OptionalPosition),
-    VarInt(26): (IDOrPaintingVariant,),
-    VarInt(27): (VarInt,),
-    VarInt(28): (VarInt,),
-    VarInt(29): (Float, Float, Float,),
-    VarInt(30): (Float, Float, Float, Float,),
+# 元数据类型 ID -> 数据结构
+METADATA_TYPES: dict[int, tuple[Any, ...]] = {
+    0: (Byte,),
+    1: (VarInt,),
+    2: (VarLong,),
+    3: (Float,),
+    4: (String,),
+    5: (TextComponent,),
+    6: (OptionalTextComponent,),
+    7: (Slot,),
+    8: (Boolean,),
+    9: (Float, Float, Float,),
+    10: (Position,),
+    11: (OptionalPosition,),
+    12: (VarInt,),
+    13: (OptionalUUID,),
+    14: (VarInt,),
+    15: (VarInt,),
+    16: (NBT,),
+    17: (Particle,),
+    18: (VarInt, Particle,),
+    19: (VarInt, VarInt, VarInt,),
+    20: (VarInt,),
+    21: (VarInt,),
+    22: (VarInt,),
+    23: (IDOrWolfVariant,),
+    24: (VarInt,),
+    25: (Boolean, OptionalIdentifier, OptionalPosition),
+    26: (IDOrPaintingVariant,),
+    27: (VarInt,),
+    28: (VarInt,),
+    29: (Float, Float, Float,),
+    30: (Float, Float, Float, Float,),
+}
+
+# 定长类型 -> 字节数，跳过时直接移动
+METADATA_FIXED_SIZES: dict[int, int] = {
+    type_id: sum(_.BYTES_LENGTH for _ in data_struct)
+    for type_id, data_struct in METADATA_TYPES.items()
+    if all(getattr(_, 'BYTES_LENGTH', -1) > 0 for _ in data_struct)
 }
 
+METADATA_TYPE_PARTICLES = 18
+METADATA_END = 0xFF
+
+# 兼容旧接口
+EntityMetadataFormatMap = {VarInt(type_id): data_struct for type_id, data_struct in METADATA_TYPES.items()}
+
 
 @dataclass(slots=True)
 class EntityMetadata(Combined):
+    """
+        单个元数据项
+    """
 
     index: Field | UnsignedByte
     type_: Field | Optional[VarInt] = None
@@ -104,13 +128,13 @@ class EntityMetadata(Combined):
         :return:
         """
         bs = self.index.bytes
-        if self.index.value == 255:
+        if self.index.value == METADATA_END:
             return bs
 
         bs += self.type_.bytes
 
         # particles
-        if self.index.value == 18:
+        if self.type_.value == METADATA_TYPE_PARTICLES:
             bs += VarInt.encode(len(self.values))
             for particle in self.values:
                 bs += particle.bytes
@@ -124,6 +148,17 @@ class EntityMetadata(Combined):
 
         return bs
 
+    @property
+    def value(self) -> Any:
+        """
+            单值基础类型返回其 value，单个复合类型返回该对象，其余返回 tuple
+        :return:
+        """
+        if self.values is None or len(self.values) != 1 or self.type_.value == METADATA_TYPE_PARTICLES:
+            return self.values
+        item = self.values[0]
+        return item.value if isinstance(item, DataType) and not isinstance(item, IDOrX) else item
+
     @classmethod
     def decode(cls, bytes_source: BytesIO | bytes, *args, **kwargs) -> Self:
         """
@@ -137,18 +172,18 @@ class EntityMetadata(Combined):
 
         index = UnsignedByte.decode(bytes_io)
 
-        if index.value == 255:
+        if index.value == METADATA_END:
             return cls(index, None, tuple())
 
         else:
             type_ = VarInt.decode(bytes_io)
 
-            if type_.value == 18:
+            if type_.value == METADATA_TYPE_PARTICLES:
                 array_length = VarInt.decode(bytes_io)
                 values = [Particle.decode(bytes_io) for _ in range(array_length.value)]
                 return cls(index, type_, tuple(values))
 
-            data_struct = EntityMetadataFormatMap.get(type_, None)
+            data_struct = METADATA_TYPES.get(type_.value, None)
             if data_struct is None:
                 raise TypeError(f"{type_} is not a valid entity type")
 
@@ -157,3 +192,160 @@ class EntityMetadata(Combined):
                 data.append(_.decode(bytes_io))
 
             return cls(index, type_, tuple(data))
+
+    @staticmethod
+    def skip_value(bytes_io: IO, type_id: int) -> None:
+        """
+            跳过数据部分
+        :param bytes_io:
+        :param type_id:
+        :return:
+        """
+        size = METADATA_FIXED_SIZES.get(type_id)
+        if size is not None:
+            bytes_io.seek(size, os.SEEK_CUR)
+
+        elif type_id == METADATA_TYPE_PARTICLES:
+            for _ in range(VarInt.decode(bytes_io).value):
+                Particle.skip(bytes_io)
+
+        else:
+            data_struct = METADATA_TYPES.get(type_id, None)
+            if data_struct is None:
+                raise TypeError(f"{type_id} is not a valid entity type")
+            for _ in data_struct:
+                _.skip(bytes_io)
+
+    @classmethod
+    def skip(cls, bytes_io: IO, *args, **kwargs) -> None:
+        if UnsignedByte.decode(bytes_io).value != METADATA_END:
+            cls.skip_value(bytes_io, VarInt.decode(bytes_io).value)
+
+    @classmethod
+    def decode_many(
+            cls, bytes_source: BytesIO | bytes | DataPacket, indexes: Iterable[int] | None = None
+    ) -> dict[int, Self]:
+        """
+            解码以 0xFF 结尾的元数据数组，仅解码 indexes 中的项，其余按长度跳过
+        :param bytes_source:
+        :param indexes: 需要的元数据下标，None 为全部
+        :return: {index: EntityMetadata}
+        """
+        bytes_io = cls.to_bytes_io(bytes_source)
+        wanted = None if indexes is None else frozenset(indexes)
+
+        entries = {}
+        while True:
+            start = bytes_io.tell()
+            index = bytes_io.read(1)[0]
+            if index == METADATA_END:
+                return entries
+
+            if wanted is None or index in wanted:
+                bytes_io.seek(start, os.SEEK_SET)
+                entries[index] = cls.decode(bytes_io)
+            else:
+                cls.skip_value(bytes_io, VarInt.decode(bytes_io).value)
+
+
+class LazyEntityMetadata(Mapping):
+    """
+        延迟解码元数据数组 (以 0xFF 结尾)
+        解码时仅记录各项类型及范围，首次访问某项时才解码
+        编码时未修改直接写回原始 bytes
+    """
+
+    def __init__(self, raw: bytes, extents: dict[int, tuple[int, int, int]]):
+        """
+        :param raw: 含结尾 0xFF
+        :param extents: index -> (type_id, start, end)
+        """
+        self.raw = raw
+        self.extents = extents
+        self._items: dict[int, EntityMetadata] = {}
+        self._modified = False
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}>({len(self._items)}/{len(self)} Decoded)"
+
+    def __len__(self) -> int:
+        return len(self.extents)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.extents)
+
+    def __contains__(self, index: object) -> bool:
+        return index in self.extents
+
+    def __getitem__(self, index: int) -> EntityMetadata:
+        item = self._items.get(index)
+        if item is None:
+            _, start, end = self.extents[index]
+            item = self._items[index] = EntityMetadata.decode(BytesIO(self.raw[start:end]))
+        return item
+
+    def __setitem__(self, index: int, item: EntityMetadata) -> None:
+        self._items[index] = item
+        self.extents.setdefault(index, (item.type_.value, -1, -1))
+        self._modified = True
+
+    def type_id(self, index: int) -> int | None:
+        """
+            元数据类型，不解码
+        :param index:
+        :return:
+        """
+        extent = self.extents.get(index)
+        return None if extent is None else extent[0]
+
+    def value(self, index: int, default: Any = None) -> Any:
+        """
+            元数据值，见 EntityMetadata.value
+        :param index:
+        :param default:
+        :return:
+        """
+        return self[index].value if index in self.extents else default
+
+    @property
+    def decoded_count(self) -> int:
+        return len(self._items)
+
+    def __bytes__(self) -> bytes:
+        if not self._modified:
+            return self.raw
+        return b''.join(
+            self[index].bytes if index in self._items or start < 0 else self.raw[start:end]
+            for index, (_, start, end) in self.extents.items()
+        ) + bytes((METADATA_END,))
+
+    @property
+    def bytes(self) -> bytes:
+        return self.__bytes__()
+
+    @classmethod
+    def decode(cls, bytes_io: IO, *args, **kwargs) -> Self:
+        """
+            跳过各项并记录范围
+        :param bytes_io:
+        :return:
+        """
+        start = bytes_io.tell()
+        extents = {}
+        while True:
+            entry_start = bytes_io.tell() - start
+            index = bytes_io.read(1)[0]
+            if index == METADATA_END:
+                break
+            type_id = VarInt.decode(bytes_io).value
+            EntityMetadata.skip_value(bytes_io, type_id)
+            extents[index] = (type_id, entry_start, bytes_io.tell() - start)
+
+        end = bytes_io.tell()
+        bytes_io.seek(start, os.SEEK_SET)
+        return cls(bytes_io.read(end - start), extents)
+
+    @classmethod
+    def skip(cls, bytes_io: IO, *args, **kwargs) -> None:
+        while bytes_io.read(1)[0] != METADATA_END:
+            EntityMetadata.skip_value(bytes_io, VarInt.decode(bytes_io).value)
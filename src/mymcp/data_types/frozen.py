@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+    frozen
+    ~~~~~~~~~~~~~~~~~~
+    驻留共享实例的只读化
+    DataType/Combined 等 dataclass 实例原位替换为只读子类
+    list 转为 FrozenList，array 转为 FrozenArray，ndarray 置为只读，需修改时由 thaw 复制
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+__all__ = [
+    'FrozenList', 'FrozenArray', 'freeze', 'thaw', 'is_frozen'
+]
+
+from array import array
+from dataclasses import FrozenInstanceError, fields, is_dataclass
+from typing import Any, Iterator
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _readonly(self, *args, **kwargs):
+    raise TypeError(f"{self.__class__.__name__} is read-only")
+
+
+class FrozenList(list):
+    """
+        只读 list，isinstance(_, list) 仍成立
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+
+    def __reduce_ex__(self, protocol):
+        return self.__class__, (list(self),)
+
+
+class FrozenArray(array):
+    """
+        只读 array
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = reverse = byteswap = _readonly
+    frombytes = fromfile = fromlist = fromunicode = _readonly
+
+    def __reduce_ex__(self, protocol):
+        return self.__class__, (self.typecode, self.tobytes())
+
+
+# 只读子类 -> 原类
+_BASES: dict[type, type] = {}
+# 原类 -> 只读子类
+_FROZEN: dict[type, type] = {}
+
+
+def _frozen_setattr(self, name: str, value: Any) -> None:
+    raise FrozenInstanceError(f"cannot assign to field {name!r} of a frozen {self.__class__.__name__}")
+
+
+def _frozen_delattr(self, name: str) -> None:
+    raise FrozenInstanceError(f"cannot delete field {name!r} of a frozen {self.__class__.__name__}")
+
+
+def _frozen_class(cls: type) -> type:
+    """
+        cls 的只读子类，名称/注解与 cls 相同，编码及 repr 不变
+    :param cls:
+    :return:
+    """
+    frozen = _FROZEN.get(cls)
+    if frozen is not None:
+        return frozen
+
+    def __eq__(self, other: Any) -> bool:
+        result = cls.__eq__(self, other)
+        # dataclass 生成的 __eq__ 要求类型相同，与未冻结实例按字段比较
+        if result is NotImplemented and isinstance(other, cls):
+            return all(getattr(self, _.name) == getattr(other, _.name) for _ in fields(cls) if _.compare)
+        return result
+
+    def __reduce_ex__(self, protocol):
+        return freeze, (thaw(self),)
+
+    frozen = type(cls.__name__, (cls,), {
+        '__slots__': (),
+        '__module__': cls.__module__,
+        '__qualname__': cls.__qualname__,
+        '__annotations__': getattr(cls, '__annotations__', {}),
+        '__setattr__': _frozen_setattr,
+        '__delattr__': _frozen_delattr,
+        '__eq__': __eq__,
+        '__hash__': cls.__hash__,
+        '__reduce_ex__': __reduce_ex__,
+    })
+    _FROZEN[cls] = frozen
+    _BASES[frozen] = cls
+    return frozen
+
+
+def _slots(obj: Any) -> Iterator[tuple[str, Any]]:
+    """
+        实例属性 (名称, 存储描述符)，直接读写存储，不经 property
+    :param obj:
+    :return:
+    """
+    for cls in type(obj).__mro__:
+        names = cls.__dict__.get('__slots__', ())
+        for name in (names,) if isinstance(names, str) else names:
+            if name not in ('__dict__', '__weakref__'):
+                yield name, cls.__dict__[name]
+
+
+def _convert(obj: Any, func) -> None:
+    """
+        func 转换全部实例属性
+    :param obj:
+    :param func:
+    :return:
+    """
+    attributes = getattr(obj, '__dict__', None)
+    if attributes is not None:
+        for name, value in attributes.items():
+            attributes[name] = func(value)
+
+    for name, descriptor in _slots(obj):
+        try:
+            value = descriptor.__get__(obj, type(obj))
+        except AttributeError:
+            continue
+        descriptor.__set__(obj, func(value))
+
+
+def is_frozen(value: Any) -> bool:
+    if type(value) in _BASES or isinstance(value, (FrozenList, FrozenArray)):
+        return True
+    return np is not None and isinstance(value, np.ndarray) and not value.flags.writeable
+
+
+def freeze(value: Any) -> Any:
+    """
+        只读化，dataclass 实例及 ndarray 原位修改，list/array 返回只读副本
+        dict 等其余可变对象保持不变
+    :param value:
+    :return:
+    """
+    if type(value) in _BASES:
+        return value
+
+    if isinstance(value, list):
+        if isinstance(value, FrozenList):
+            return value
+        return FrozenList([freeze(_) for _ in value])
+
+    if type(value) is tuple:
+        return tuple([freeze(_) for _ in value])
+
+    if isinstance(value, array):
+        if isinstance(value, FrozenArray):
+            return value
+        return FrozenArray(value.typecode, value.tobytes())
+
+    if np is not None and isinstance(value, np.ndarray):
+        value.setflags(write=False)
+        return value
+
+    if is_dataclass(value) and not isinstance(value, type):
+        _convert(value, freeze)
+        object.__setattr__(value, '__class__', _frozen_class(type(value)))
+
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """
+        只读实例 -> 可修改副本，未冻结部分不复制
+    :param value:
+    :return:
+    """
+    if isinstance(value, FrozenList):
+        return [thaw(_) for _ in value]
+
+    if type(value) is tuple:
+        return tuple([thaw(_) for _ in value])
+
+    if isinstance(value, FrozenArray):
+        return array(value.typecode, value.tobytes())
+
+    if np is not None and isinstance(value, np.ndarray) and not value.flags.writeable:
+        return value.copy()
+
+    base = _BASES.get(type(value))
+    if base is None:
+        return value
+
+    obj = object.__new__(base)
+    attributes = getattr(value, '__dict__', None)
+    if attributes is not None:
+        obj.__dict__.update({name: thaw(item) for name, item in attributes.items()})
+    for name, descriptor in _slots(value):
+        try:
+            item = descriptor.__get__(value, type(value))
+        except AttributeError:
+            continue
+        descriptor.__set__(obj, thaw(item))
+    return obj
@@ -4,6 +4,9 @@
     ~~~~~~~~~~~~~~~~~~
     
     Log:
+        2026-10-19 0.2.1 Me2sY  ASCII 快速解码，Tag Name 驻留表
+                                skip_value 跳过 Tag，不创建对象
+
         2025-05-29 0.2.0 Me2sY  修复 TagEnd
 
         2025-05-16 0.1.0 Me2sY 想了想还是自己写吧，替代pyNBT
@@ -18,16 +21,80 @@ __all__ = [
     'TagByteArray', 'TagString', 'TagList',
     'TagCompound', 'TagCompoundNet',
     'TagIntArray', 'TagLongArray',
-    'NBTFile'
+    'NBTFile',
+    'InternTable', 'decode_mutf8', 'encode_mutf8'
 ]
 
 from dataclasses import dataclass
+import os
 import struct
 from typing import Any, Self, IO, ClassVar, Iterator
 
 from mutf8 import decode_modified_utf8, encode_modified_utf8
 
 
+def decode_mutf8(raw: bytes) -> str:
+    """
+        解码 Modified UTF-8
+        绝大多数 Key/Value 为纯 ASCII，直接解码，跳过 mutf8
+    :param raw:
+    :return:
+    """
+    if raw.isascii():
+        return raw.decode('ascii')
+    return decode_modified_utf8(raw)
+
+
+def encode_mutf8(value: str) -> bytes:
+    """
+        编码 Modified UTF-8
+        注意 \\x00 在 Modified UTF-8 中编码为 C0 80，不可走 ASCII 快速路径
+    :param value:
+    :return:
+    """
+    if value.isascii() and '\x00' not in value:
+        return value.encode('ascii')
+    return encode_modified_utf8(value)
+
+
+class InternTable:
+    """
+        字符串驻留表
+        以原始 bytes 为 Key，相同 Key 返回同一 str 对象，减少解码及内存占用
+        表满后不再写入，已驻留内容保持有效
+    """
+
+    def __init__(self, max_size: int = 4096, max_length: int = 64):
+        """
+        :param max_size: 最大驻留数量
+        :param max_length: 可驻留 bytes 最大长度，超出则直接解码
+        """
+        self.max_size = max_size
+        self.max_length = max_length
+        self.table: dict[bytes, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def decode(self, raw: bytes) -> str:
+        """
+            解码并驻留
+        :param raw:
+        :return:
+        """
+        value = self.table.get(raw)
+        if value is not None:
+            return value
+
+        value = decode_mutf8(raw)
+        if len(raw) <= self.max_length and len(self.table) < self.max_size:
+            self.table[raw] = value
+        return value
+
+    def clear(self) -> None:
+        self.table.clear()
+
+
 @dataclass
 class Tag:
     """
@@ -36,6 +103,9 @@ class Tag:
     tag_format: ClassVar[str] = None
     tag_type_id: ClassVar[int] = -1
 
+    # Tag Name 驻留表，Compound Key 大量重复 (id, x, y, z, Items ...)
+    NAME_INTERN: ClassVar[InternTable] = InternTable(max_size=4096, max_length=64)
+
     value: Any
     name: str = None
 
@@ -79,7 +149,7 @@ class Tag:
         :return:
         """
         if self.name:
-            name_bytes = encode_modified_utf8(self.name)
+            name_bytes = encode_mutf8(self.name)
             return struct.pack('>H', len(name_bytes)) + name_bytes
         else:
             return b'\x00\x00'
@@ -99,8 +169,8 @@ class Tag:
 
         return cls(name=name, value=value)
 
-    @staticmethod
-    def decode_name(bytes_io: IO) -> str | None:
+    @classmethod
+    def decode_name(cls, bytes_io: IO) -> str | None:
         """
             解码 Tag Name
         :param bytes_io:
@@ -108,7 +178,7 @@ class Tag:
         """
         name_len = struct.unpack('>H', bytes_io.read(2))[0]
         if name_len > 0:
-            return decode_modified_utf8(bytes_io.read(name_len))
+            return cls.NAME_INTERN.decode(bytes_io.read(name_len))
         else:
             return None
 
@@ -121,6 +191,24 @@ class Tag:
         """
         return struct.unpack(cls.tag_format, bytes_io.read(struct.calcsize(cls.tag_format)))[0]
 
+    @staticmethod
+    def skip_name(bytes_io: IO) -> None:
+        """
+            跳过 Tag Name
+        :param bytes_io:
+        :return:
+        """
+        bytes_io.seek(struct.unpack('>H', bytes_io.read(2))[0], os.SEEK_CUR)
+
+    @classmethod
+    def skip_value(cls, bytes_io: IO) -> None:
+        """
+            跳过 值，仅移动指针，用于计算长度/延迟解码
+        :param bytes_io:
+        :return:
+        """
+        bytes_io.seek(struct.calcsize(cls.tag_format), os.SEEK_CUR)
+
 
 @dataclass
 class TagEnd(Tag):
@@ -146,6 +234,10 @@ class TagEnd(Tag):
     def encode_value(self) -> bytes:
         return b'\x00'
 
+    @classmethod
+    def skip_value(cls, bytes_io: IO) -> None:
+        return None
+
 
 class TagByte(Tag):
     """
@@ -229,6 +321,11 @@ class TagArray(Tag):
         array_format = f'>{array_len}{cls.tag_format[-1]}'
         return struct.unpack(array_format, bytes_io.read(struct.calcsize(array_format)))
 
+    @classmethod
+    def skip_value(cls, bytes_io: IO) -> None:
+        array_len = struct.unpack('>i', bytes_io.read(4))[0]
+        bytes_io.seek(array_len * struct.calcsize(cls.tag_format), os.SEEK_CUR)
+
     @property
     def encode_value(self) -> bytes:
         """
@@ -255,6 +352,9 @@ class TagString(Tag):
     """
     tag_type_id = 8
 
+    # 短字符串值驻留表 (颜色、物品ID等)，max_size 设为 0 可关闭
+    VALUE_INTERN: ClassVar[InternTable] = InternTable(max_size=4096, max_length=32)
+
     @classmethod
     def decode_value(cls, bytes_io: IO) -> str:
         """
@@ -266,7 +366,11 @@ class TagString(Tag):
         if string_len == 0:
             return ''
         else:
-            return decode_modified_utf8(bytes_io.read(string_len))
+            return cls.VALUE_INTERN.decode(bytes_io.read(string_len))
+
+    @classmethod
+    def skip_value(cls, bytes_io: IO) -> None:
+        bytes_io.seek(struct.unpack('>H', bytes_io.read(2))[0], os.SEEK_CUR)
 
     @property
     def encode_value(self) -> bytes:
@@ -274,7 +378,7 @@ class TagString(Tag):
             UTF8
         :return:
         """
-        string_bytes = encode_modified_utf8(self.value)
+        string_bytes = encode_mutf8(self.value)
         return struct.pack('>H', len(string_bytes)) + string_bytes
 
 
@@ -314,6 +418,20 @@ class TagList(Tag):
                 value.append(items_type(value=items_type.decode_value(bytes_io)))
             return cls(name=name, value=value, items_type=items_type)
 
+    @classmethod
+    def skip_value(cls, bytes_io: IO) -> None:
+        items_type = NBTFile.TAG_MAPPER.get(struct.unpack('>b', bytes_io.read(1))[0])
+        child_len = struct.unpack('>i', bytes_io.read(4))[0]
+        if child_len <= 0:
+            return
+
+        if items_type.tag_format and not issubclass(items_type, TagArray):
+            # 定长类型，直接跳过
+            bytes_io.seek(child_len * struct.calcsize(items_type.tag_format), os.SEEK_CUR)
+        else:
+            for _ in range(child_len):
+                items_type.skip_value(bytes_io)
+
     @property
     def encode_value(self) -> bytes:
         if len(self.value) == 0:
@@ -335,6 +453,18 @@ class TagCompound(Tag):
     def __repr__(self):
         return f"<{self.__class__.__name__} {self.name}>({len(self.value)} Tags)"
 
+    def get(self, name: str, default: Any = None) -> Tag | Any:
+        """
+            按名称获取子 Tag
+        :param name:
+        :param default:
+        :return:
+        """
+        for tag in self.value:
+            if tag.name == name:
+                return tag
+        return default
+
     @classmethod
     def decode_value(cls, bytes_io: IO) -> list[Tag]:
         """
@@ -352,6 +482,15 @@ class TagCompound(Tag):
             else:
                 tags.append(tag_cls.decode(bytes_io))
 
+    @classmethod
+    def skip_value(cls, bytes_io: IO) -> None:
+        while True:
+            tag_cls = NBTFile.TAG_MAPPER.get(struct.unpack('>b', bytes_io.read(1))[0])
+            if tag_cls == TagEnd:
+                return
+            tag_cls.skip_name(bytes_io)
+            tag_cls.skip_value(bytes_io)
+
 
     @property
     def encode_value(self) -> bytes:
@@ -459,6 +598,22 @@ class NBTFile:
 
         return TagCompoundNet.decode(bytes_io)
 
+    @classmethod
+    def skip_net(cls, bytes_io: IO) -> None:
+        """
+            跳过网络格式TagCompound
+        :param bytes_io:
+        :return:
+        """
+        fb = bytes_io.read(1)
+        if fb == b'\x00':
+            return
+
+        elif fb != b'\n':
+            raise ValueError(r"NBTFile skip error. Start Must Be TagCompoundNet Type ID b'\n'")
+
+        TagCompoundNet.skip_value(bytes_io)
+
     @classmethod
     def encode(cls, tag_compound: TagCompound | TagCompoundNet) -> bytes:
         """
@@ -5,6 +5,8 @@
     粒子效果 Protocol Version 769
 
     Log:
+        2026-10-19 0.2.1 Me2sY  Particle 按长度跳过
+
         2025-05-27 0.2.0 Me2sY  重构
 
         2025-05-22 0.1.3 Me2sY  完成 1.21.4 编解码功能
@@ -100,6 +102,11 @@ class Particle(Combined):
             data.append(_.decode(bytes_io))
         return cls(particle_id, tuple(data))
 
+    @classmethod
+    def skip(cls, bytes_io: IO, *args, **kwargs) -> None:
+        for _ in DATA_TYPE_MAP.get(VarInt.decode(bytes_io).value, ()):
+            _.skip(bytes_io)
+
     def __bytes__(self) -> bytes:
         bs = self.particle.bytes
         for _ in self.particle_data:
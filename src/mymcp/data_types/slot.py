@@ -4,6 +4,14 @@
     ~~~~~~~~~~~~~~~~~~
     
     Log:
+        2026-10-19 0.2.1 Me2sY  LazyComponent 延迟解码 Component，Slot.decode(lazy=)
+                                修正数组类 Component 编码缺少长度
+                                Slot.decode 未指定 lazy 时使用已安装的 SlotCache
+                                只读 LazyComponent 解码结果保存于 frozen_data 缓存，不回写实例
+
+        2026-10-19 0.2.1 Me2sY  SlotCache 按 wire bytes 驻留已解码 Slot，Component 按 int 查找结构
+                                SlotCache 驻留的 Slot 只读化
+
         2025-05-27 0.2.0 Me2sY  架构重构，未充分测试.
 
         2025-05-22 0.1.3 Me2sY  完成 1.21.4 编写，类别格式太多。。。未充分测试
@@ -15,10 +23,13 @@ __author__ = 'Me2sY'
 __version__ = '0.2.0'
 
 __all__ = [
-    'Slot', 'ComponentDataStructMap', 'Component', 'SlotDisplay', 'RecipeDisplay'
+    'Slot', 'SlotCache', 'ComponentDataStructMap', 'Component', 'LazyComponent', 'SlotDisplay', 'RecipeDisplay'
 ]
 
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
+from io import BytesIO
 from typing import Optional, IO, Self, ClassVar, Any, Union
 
 from mymcp.data_types import (
@@ -26,6 +37,7 @@ from mymcp.data_types import (
     Int, IDOrX, Byte, Position, Combined, Field, OptionalVarInt, OptionalInt, OptionalIdentifier, OptionalFloat,
     OptionalBoolean, OptionalIDSet, OptionalString, OptionalTextComponent, OptionalUUID
 )
+from mymcp.data_types.frozen import freeze, is_frozen
 
 
 @dataclass(slots=True)
@@ -467,45 +479,170 @@ class Component(Combined):
     type_: Field | VarInt
     data: Field | Any = None
 
-    def __bytes__(self) -> bytes:
-        bs = self.type_.bytes
-
-        if self.data is None:
-            return bs
+    @property
+    def name(self) -> str:
+        return ComponentDataStructs[self.type_.value].name
 
-        if isinstance(self.data, tuple):
-            for _ in self.data:
+    def __bytes__(self) -> bytes:
+        return self.type_.bytes + self.data_bytes(self.type_.value, self.data)
+
+    @staticmethod
+    def data_bytes(type_id: int, data: Any) -> bytes:
+        """
+            编码 Component 数据部分
+        :param type_id:
+        :param data:
+        :return:
+        """
+        if data is None:
+            return b''
+
+        if isinstance(data, tuple):
+            bs = VarInt.encode(len(data)) if isinstance(ComponentDataStructs[type_id].data_struct, list) else b''
+            for _ in data:
                 try:
                     bs += _.bytes
                 except AttributeError:
                     bs += _.encode()
             return bs
 
-        return bs + self.data.bytes
+        return data.bytes
+
+    @staticmethod
+    def data_struct(type_id: int) -> Any:
+        cds: ComponentDataStruct = ComponentDataStructs.get(type_id, None)
+        if cds is None:
+            raise TypeError(f"Unknown component type: {type_id}")
+        return cds.data_struct
+
+    @classmethod
+    def decode_data(cls, type_id: int, bytes_io: IO) -> Any:
+        """
+            解码 Component 数据部分
+        :param type_id:
+        :param bytes_io:
+        :return:
+        """
+        data_struct = cls.data_struct(type_id)
+
+        if data_struct is None:
+            return None
+
+        if isinstance(data_struct, tuple):
+            return tuple([_.decode(bytes_io) for _ in data_struct])
+
+        if isinstance(data_struct, list):
+            array_length = VarInt.decode(bytes_io)
+            return tuple([data_struct[0].decode(bytes_io) for _ in range(array_length.value)])
+
+        return data_struct.decode(bytes_io)
 
     @classmethod
     def decode(cls, bytes_io: IO, *args, **kwargs) -> Self:
         ct = VarInt.decode(bytes_io)
+        return cls(ct, cls.decode_data(ct.value, bytes_io))
 
-        cds: ComponentDataStruct = ComponentDataStructMap.get(ct, None)
-        if cds is None:
-            raise TypeError(f"Unknown component type: {ct.value}")
+    @classmethod
+    def skip(cls, bytes_io: IO, *args, **kwargs) -> None:
+        cls.skip_data(VarInt.decode(bytes_io).value, bytes_io)
 
-        if cds.data_struct is None:
-            return cls(ct, None)
+    @classmethod
+    def skip_data(cls, type_id: int, bytes_io: IO) -> None:
+        """
+            按长度跳过 Component 数据部分
+        :param type_id:
+        :param bytes_io:
+        :return:
+        """
+        data_struct = cls.data_struct(type_id)
+
+        if data_struct is None:
+            return
+
+        if isinstance(data_struct, tuple):
+            for _ in data_struct:
+                _.skip(bytes_io)
+
+        elif isinstance(data_struct, list):
+            for _ in range(VarInt.decode(bytes_io).value):
+                data_struct[0].skip(bytes_io)
 
-        if isinstance(cds.data_struct, tuple):
-            data = []
-            for _ in cds.data_struct:
-                data.append(_.decode(bytes_io))
-            return cls(ct, tuple(data))
+        else:
+            data_struct.skip(bytes_io)
 
-        if isinstance(cds.data_struct, list):
-            data_struct = cds.data_struct[0]
-            array_length = VarInt.decode(bytes_io)
-            return cls(ct, tuple([data_struct.decode(bytes_io) for _ in range(array_length.value)]))
 
-        return cls(ct, cds.data_struct.decode(bytes_io))
+class LazyComponent(Component):
+    """
+        延迟解码 Component
+        解码时仅记录数据部分原始 bytes，首次访问 data 时才解码
+        未访问过时编码直接写回原始 bytes，嵌套 Slot (container/bundle_contents) 同样不展开
+        只读 (SlotCache 共享) 实例不回写解码结果，由 frozen_data 按 (type, raw) 缓存只读结果
+    """
+
+    __slots__ = ('raw', '_data')
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def frozen_data(type_id: int, raw: bytes) -> Any:
+        """
+            只读实例的解码结果，lru_cache 线程安全
+        :param type_id:
+        :param raw:
+        :return:
+        """
+        return freeze(Component.decode_data(type_id, BytesIO(raw)))
+
+    def __init__(self, type_: VarInt, data: Any = None, raw: bytes | None = None):
+        self.type_ = type_
+        self._data = data
+        self.raw = raw
+
+    @property
+    def data(self) -> Any:
+        if self.raw is not None and self._data is None:
+            if is_frozen(self):
+                return self.frozen_data(self.type_.value, self.raw)
+            self._data = self.decode_data(self.type_.value, BytesIO(self.raw))
+        return self._data
+
+    @data.setter
+    def data(self, value: Any) -> None:
+        self._data = value
+        self.raw = None
+
+    @property
+    def decoded(self) -> bool:
+        return self.raw is None or self._data is not None
+
+    def __repr__(self):
+        if not self.decoded:
+            return f"<{self.__class__.__name__}>({self.name} {len(self.raw)} bytes)"
+        return f"{self.__class__.__name__}(type_={self.type_!r}, data={self._data!r})"[:self.PRINT_LENGTH]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Component):
+            return self.bytes == other.bytes
+        return NotImplemented
+
+    def __bytes__(self) -> bytes:
+        # 已解码则可能被修改，以 data 为准
+        if not self.decoded:
+            return self.type_.bytes + self.raw
+        return self.type_.bytes + self.data_bytes(self.type_.value, self._data)
+
+    @classmethod
+    def decode(cls, bytes_io: IO, *args, **kwargs) -> Self:
+        """
+            跳过并记录数据部分原始 bytes
+        :param bytes_io:
+        :return:
+        """
+        ct = VarInt.decode(bytes_io)
+        start = bytes_io.tell()
+        cls.skip_data(ct.value, bytes_io)
+        end = bytes_io.tell()
+        bytes_io.seek(start)
+        return cls(ct, raw=bytes_io.read(end - start))
 
 
 @dataclass(slots=True)
@@ -517,6 +654,12 @@ class Slot(Combined):
     components_to_add: Field | list[Component] = None
     components_to_remove: Field | list[VarInt] = None
 
+    # 已安装的 SlotCache，见 SlotCache.install
+    CACHE = None
+
+    # decode 未指定 lazy 时的默认值，True 时 components_to_add 为 LazyComponent
+    LAZY_COMPONENTS = False
+
     def __bytes__(self) -> bytes:
         bs = self.item_count.bytes
         if self.item_count.value > 0:
@@ -530,7 +673,21 @@ class Slot(Combined):
         return bs
 
     @classmethod
-    def decode(cls, bytes_io: IO, *args, **kwargs) -> Self:
+    def decode(cls, bytes_io: IO, *args, lazy: bool | None = None, **kwargs) -> Self:
+        """
+            解码
+        :param bytes_io:
+        :param lazy: 延迟解码 Component，None 时由已安装的 SlotCache 决定
+                     未安装时使用 Slot.LAZY_COMPONENTS
+        :return:
+        """
+        cache = Slot.CACHE
+        if cache is not None and (lazy is None or cache.lazy == lazy):
+            return cache.decode(bytes_io)
+        return cls.decode_uncached(bytes_io, lazy=Slot.LAZY_COMPONENTS if lazy is None else lazy)
+
+    @classmethod
+    def decode_uncached(cls, bytes_io: IO, *args, lazy: bool = False, **kwargs) -> Self:
         item_count = VarInt.decode(bytes_io)
         if item_count.value == 0:
             return cls(item_count)
@@ -539,9 +696,10 @@ class Slot(Combined):
         number_of_components_to_add = VarInt.decode(bytes_io)
         number_of_components_to_remove = VarInt.decode(bytes_io)
 
+        component_cls = LazyComponent if lazy else Component
         components_to_add = []
         for _ in range(number_of_components_to_add.value):
-            components_to_add.append(Component.decode(bytes_io))
+            components_to_add.append(component_cls.decode(bytes_io))
 
         components_to_remove = []
         for _ in range(number_of_components_to_remove.value):
@@ -552,6 +710,25 @@ class Slot(Combined):
             number_of_components_to_remove, components_to_add, components_to_remove
         )
 
+    @classmethod
+    def skip(cls, bytes_io: IO, *args, **kwargs) -> None:
+        if isinstance(bytes_io, BytesIO):
+            with bytes_io.getbuffer() as buffer:
+                end = SlotCache.slot_end(bytes_io, buffer, bytes_io.tell())
+            bytes_io.seek(end)
+            return
+
+        if VarInt.decode(bytes_io).value == 0:
+            return
+
+        VarInt.skip(bytes_io)
+        number_of_components_to_add = VarInt.decode(bytes_io).value
+        number_of_components_to_remove = VarInt.decode(bytes_io).value
+        for _ in range(number_of_components_to_add):
+            Component.skip(bytes_io)
+        for _ in range(number_of_components_to_remove):
+            VarInt.skip(bytes_io)
+
 
 @dataclass
 class ComponentDataStruct:
@@ -671,7 +848,7 @@ ComponentDataStructMap = {
     VarInt(31): ComponentDataStruct(name='tooltip_style', tid=31, data_struct=Identifier),
 
     # Makes the item function like a totem of undying.
-    VarInt(32): ComponentDataStruct(name='death_protection', tid=32, data_struct=list[ConsumeEffect]),
+    VarInt(32): ComponentDataStruct(name='death_protection', tid=32, data_struct=[ConsumeEffect]),
 
     # # TODO: add
     # VarInt(33): ComponentDataStruct(name='blocks_attacks', tid=33, data_struct=None),
@@ -793,6 +970,144 @@ ComponentDataStructMap = {
     VarInt(66): ComponentDataStruct(name='container_loot', tid=66, data_struct=NBT),
 }
 
+# int -> ComponentDataStruct，避免以 VarInt 为键查找
+ComponentDataStructs: dict[int, ComponentDataStruct] = {
+    key.value: value for key, value in ComponentDataStructMap.items()
+}
+
+
+class SlotCache:
+    """
+        Slot 驻留缓存，以完整 wire bytes 为键，LRU 淘汰
+        BytesIO 直接在 buffer 上扫描 Slot 长度
+        命中时返回共享的只读 Slot (见 frozen.freeze)，需修改时由 frozen.thaw 复制
+    """
+
+    # component type -> 数据长度，-1 为 VarInt，其余类型按 Component.skip 跳过
+    COMPONENT_SIZES: ClassVar[dict[int, int]] = {
+        type_id: {None: 0, VarInt: -1, Boolean: 1, Int: 4, Float: 4, Double: 8}[cds.data_struct]
+        for type_id, cds in ComponentDataStructs.items()
+        if cds.data_struct in (None, VarInt, Boolean, Int, Float, Double)
+    }
+
+    def __init__(self, max_size: int = 4096, lazy: bool = False):
+        """
+        :param max_size: 最大缓存数量
+        :param lazy: 缓存的 Slot 使用 LazyComponent
+        """
+        self.max_size = max_size
+        self.lazy = lazy
+        self.slots: OrderedDict[bytes, Slot] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return f"<SlotCache>({len(self.slots)} Slots hits={self.hits} misses={self.misses})"
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def install(self) -> Self:
+        """
+            设为 Slot.decode 使用的全局缓存，未指定 lazy 的解码均经此缓存
+        :return:
+        """
+        Slot.CACHE = self
+        return self
+
+    def uninstall(self) -> None:
+        if Slot.CACHE is self:
+            Slot.CACHE = None
+
+    def clear(self) -> None:
+        self.slots.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, raw: bytes) -> Slot:
+        """
+            wire bytes -> Slot
+        :param raw: 单个 Slot 的完整 bytes
+        :return:
+        """
+        slot = self.slots.get(raw)
+        if slot is not None:
+            self.hits += 1
+            self.slots.move_to_end(raw)
+            return slot
+
+        self.misses += 1
+        slot = self.slots[raw] = freeze(Slot.decode_uncached(BytesIO(raw), lazy=self.lazy))
+        if len(self.slots) > self.max_size:
+            self.slots.popitem(last=False)
+        return slot
+
+    @staticmethod
+    def _varint(buffer: memoryview, position: int) -> tuple[int, int]:
+        value = shift = 0
+        while True:
+            byte = buffer[position]
+            position += 1
+            value |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return value, position
+            shift += 7
+
+    @classmethod
+    def slot_end(cls, bytes_io: BytesIO, buffer: memoryview, position: int) -> int:
+        """
+            Slot 结束位置，定长/VarInt Component 直接计算，其余 seek 后按 Component.skip 跳过
+        :param bytes_io:
+        :param buffer: bytes_io.getbuffer()
+        :param position: Slot 起始位置
+        :return:
+        """
+        varint = cls._varint
+        item_count, position = varint(buffer, position)
+        if item_count == 0:
+            return position
+
+        _, position = varint(buffer, position)
+        number_to_add, position = varint(buffer, position)
+        number_to_remove, position = varint(buffer, position)
+
+        sizes = cls.COMPONENT_SIZES
+        for _ in range(number_to_add):
+            start = position
+            component_type, position = varint(buffer, position)
+            size = sizes.get(component_type)
+            if size is None:
+                bytes_io.seek(start)
+                Component.skip(bytes_io)
+                position = bytes_io.tell()
+            elif size < 0:
+                _, position = varint(buffer, position)
+            else:
+                position += size
+
+        for _ in range(number_to_remove):
+            _, position = varint(buffer, position)
+        return position
+
+    def decode(self, bytes_io: IO) -> Slot:
+        """
+            自 bytes_io 解码一个 Slot，非 BytesIO 时需可 seek
+        :param bytes_io:
+        :return:
+        """
+        start = bytes_io.tell()
+        if isinstance(bytes_io, BytesIO):
+            with bytes_io.getbuffer() as buffer:
+                end = self.slot_end(bytes_io, buffer, start)
+                raw = bytes(buffer[start:end])
+            bytes_io.seek(end)
+            return self.get(raw)
+
+        Slot.skip(bytes_io)
+        end = bytes_io.tell()
+        bytes_io.seek(start)
+        return self.get(bytes_io.read(end - start))
+
 
 @dataclass(slots=True)
 class SlotDisplay(Combined):
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+    session
+    ~~~~~~~~~~~~~~~~~~
+    协议会话状态机
+    根据已解码的包自动维护两个方向的 Status、压缩阈值与当前维度高度
+    数据流可一次性解码
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建
+                                OBSERVED 会话关注的包，供选择性解码使用
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+__all__ = [
+    'ProtocolSession'
+]
+
+from typing import Any, ClassVar, Iterable
+
+from mymcp.data_types import DataPacket
+from mymcp.data_types.chunk import ContentInterner
+from mymcp.packets import Codec, Packet
+from mymcp.packets.enums import Enums
+from mymcp.packets.v769 import PacketsV769, PacketFactoryV769
+
+
+class ProtocolSession:
+    """
+        协议会话
+        Status 按方向分别切换，与切换包所在方向一致:
+            HSIntention                 双向 -> STATUS / LOGIN
+            LCLoginFinished             CLIENT -> CONFIGURATION
+            LSLoginAcknowledged         SERVER -> CONFIGURATION
+            CCFinishConfiguration       CLIENT -> PLAY
+            CSFinishConfiguration       SERVER -> PLAY
+            PCStartConfiguration        CLIENT -> CONFIGURATION
+            PSConfigurationAcknowledged SERVER -> CONFIGURATION
+        LCLoginCompression 设置全部 attach 的 Codec 压缩阈值
+        CCRegistryData(minecraft:dimension_type) 记录维度高度，PCLogin/PCRespawn 切换当前维度
+    """
+
+    DIMENSION_TYPE_REGISTRY = 'minecraft:dimension_type'
+
+    # 未附带 NBT (使用内置数据包) 时的维度 (min_y, height)
+    DIMENSION_HEIGHTS: ClassVar[dict[str, tuple[int, int]]] = {
+        'minecraft:overworld': (-64, 384),
+        'minecraft:overworld_caves': (-64, 384),
+        'minecraft:the_nether': (0, 256),
+        'minecraft:the_end': (0, 256),
+    }
+
+    DEFAULT_DIMENSION: ClassVar[tuple[int, int]] = (-64, 384)
+
+    TRANSITIONS: ClassVar[dict[type, tuple[Enums.BoundTo | None, Enums.Status]]] = {
+        PacketsV769.LCLoginFinished: (Enums.BoundTo.CLIENT, Enums.Status.CONFIGURATION),
+        PacketsV769.LSLoginAcknowledged: (Enums.BoundTo.SERVER, Enums.Status.CONFIGURATION),
+        PacketsV769.CCFinishConfiguration: (Enums.BoundTo.CLIENT, Enums.Status.PLAY),
+        PacketsV769.CSFinishConfiguration: (Enums.BoundTo.SERVER, Enums.Status.PLAY),
+        PacketsV769.PCStartConfiguration: (Enums.BoundTo.CLIENT, Enums.Status.CONFIGURATION),
+        PacketsV769.PSConfigurationAcknowledged: (Enums.BoundTo.SERVER, Enums.Status.CONFIGURATION),
+    }
+
+    # observe 使用的包，选择性解码时始终需要解码
+    OBSERVED: ClassVar[frozenset[type]] = frozenset(TRANSITIONS) | {
+        PacketsV769.HSIntention, PacketsV769.LCLoginCompression, PacketsV769.CCRegistryData,
+        PacketsV769.PCLogin, PacketsV769.PCRespawn
+    }
+
+    # HSIntention.next_state -> Status
+    INTENTIONS: ClassVar[dict[int, Enums.Status]] = {
+        Enums.HandShaking.STATUS.value: Enums.Status.STATUS,
+        Enums.HandShaking.LOGIN.value: Enums.Status.LOGIN,
+        Enums.HandShaking.TRANSFER.value: Enums.Status.LOGIN,
+    }
+
+    def __init__(
+            self, status: Enums.Status = Enums.Status.HANDSHAKING,
+            lazy_chunks: bool = False, interner: ContentInterner | None = None
+    ):
+        """
+        :param status: 初始 Status (双向)
+        :param lazy_chunks: PCLevelChunkWithLight 延迟解码
+        :param interner: PCLevelChunkWithLight 按内容共享 ChunkSection/LightArray
+        """
+        self.status: dict[Enums.BoundTo, Enums.Status] = {
+            Enums.BoundTo.CLIENT: status, Enums.BoundTo.SERVER: status
+        }
+        self.compression_threshold = -1
+        self.codecs: list[Codec] = []
+        self.lazy_chunks = lazy_chunks
+        self.interner = interner
+
+        # dimension_type 注册表，下标即 dimension_type ID: (entry_id, min_y, height)
+        self.dimension_types: list[tuple[str, int, int]] = []
+        self.dimension_name: str | None = None
+        self.min_y, self.height = self.DEFAULT_DIMENSION
+
+    def __repr__(self):
+        return (
+            f"<ProtocolSession>(C:{self.status[Enums.BoundTo.CLIENT].name} S:{self.status[Enums.BoundTo.SERVER].name} "
+            f"threshold={self.compression_threshold} {self.dimension_name} height={self.height})"
+        )
+
+    @property
+    def section_count(self) -> int:
+        """
+            当前维度 Chunk Section 数量
+        :return:
+        """
+        return self.height >> 4
+
+    def attach(self, codec: Codec) -> Codec:
+        """
+            由会话维护 codec 压缩阈值
+        :param codec:
+        :return:
+        """
+        codec.compression_threshold = self.compression_threshold
+        self.codecs.append(codec)
+        return codec
+
+    def set_status(self, status: Enums.Status, bound_to: Enums.BoundTo | None = None) -> None:
+        """
+        :param status:
+        :param bound_to: None 为双向
+        :return:
+        """
+        for _ in (Enums.BoundTo.CLIENT, Enums.BoundTo.SERVER) if bound_to is None else (bound_to,):
+            self.status[_] = status
+
+    def set_compression_threshold(self, threshold: int) -> None:
+        self.compression_threshold = threshold
+        for codec in self.codecs:
+            codec.compression_threshold = threshold
+
+    def packet_cls(self, data_packet: DataPacket) -> type[Packet] | None:
+        return PacketFactoryV769.get_packet_by_dp(self.status[data_packet.bound_to], data_packet)
+
+    def decode(self, data_packet: DataPacket) -> Packet | None:
+        """
+            按当前 Status 解码并更新会话状态
+        :param data_packet:
+        :return: 未知包返回 None
+        """
+        packet_cls = self.packet_cls(data_packet)
+        if packet_cls is None:
+            return None
+
+        if packet_cls is PacketsV769.PCLevelChunkWithLight:
+            packet = packet_cls.decode(
+                data_packet, self.section_count, lazy=self.lazy_chunks, interner=self.interner
+            )
+        else:
+            packet = packet_cls.decode(data_packet)
+
+        self.observe(packet)
+        return packet
+
+    def feed(self, codec: Codec, raw_bytes: bytes) -> Iterable[tuple[DataPacket, Packet | None]]:
+        """
+            解码数据流，切换 Status/压缩阈值后继续解码同一批次中的后续包
+        :param codec: 已 attach 的 Codec
+        :param raw_bytes:
+        :return: (data_packet, packet)
+        """
+        for data_packet in codec.decode(raw_bytes):
+            yield data_packet, self.decode(data_packet)
+
+    def observe(self, packet: Any) -> None:
+        """
+            根据包更新会话状态，可用于自行解码的包
+        :param packet:
+        :return:
+        """
+        packet_cls = packet.__class__
+
+        transition = self.TRANSITIONS.get(packet_cls)
+        if transition is not None:
+            self.set_status(transition[1], transition[0])
+
+        elif packet_cls is PacketsV769.HSIntention:
+            status = self.INTENTIONS.get(packet.next_state.value)
+            if status is not None:
+                self.set_status(status)
+
+        elif packet_cls is PacketsV769.LCLoginCompression:
+            self.set_compression_threshold(packet.threshold.value)
+
+        elif packet_cls is PacketsV769.CCRegistryData:
+            if packet.registry_id.value == self.DIMENSION_TYPE_REGISTRY:
+                self.dimension_types = [self.dimension_type_height(_) for _ in packet.entries]
+
+        elif packet_cls is PacketsV769.PCLogin or packet_cls is PacketsV769.PCRespawn:
+            self.set_dimension(packet.dimension_type.value, packet.dimension_name.value)
+
+    def dimension_type_height(self, entry: PacketsV769.CCRegistryData.Entity) -> tuple[str, int, int]:
+        """
+            dimension_type 注册项 -> (entry_id, min_y, height)
+        :param entry:
+        :return:
+        """
+        entry_id = entry.entry_id.value
+        min_y, height = self.DIMENSION_HEIGHTS.get(entry_id, self.DEFAULT_DIMENSION)
+
+        nbt = entry.data.value
+        if nbt is not None:
+            compound = nbt.value
+            tag = compound.get('min_y')
+            if tag is not None:
+                min_y = tag.value
+            tag = compound.get('height')
+            if tag is not None:
+                height = tag.value
+        return entry_id, min_y, height
+
+    def set_dimension(self, dimension_type: int, dimension_name: str | None = None) -> None:
+        """
+            切换当前维度
+        :param dimension_type: dimension_type 注册表 ID
+        :param dimension_name:
+        :return:
+        """
+        self.dimension_name = dimension_name
+        if 0 <= dimension_type < len(self.dimension_types):
+            _, self.min_y, self.height = self.dimension_types[dimension_type]
+        else:
+            self.min_y, self.height = self.DIMENSION_HEIGHTS.get(dimension_name, self.DEFAULT_DIMENSION)
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+    subscription
+    ~~~~~~~~~~~~~~~~~~
+    按包订阅的选择性解码
+    仅解码已订阅的包，其余包以 DataPacket 原样放行、丢弃或转发，分发表在注册时构建
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建
+                                修正仅 session 关注的包未按 unsubscribed 放行/丢弃/转发
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+__all__ = [
+    'SubscriptionRegistry'
+]
+
+from typing import Any, Callable, Iterable
+
+from mymcp.data_types import DataPacket
+from mymcp.packets import Codec, Packet
+from mymcp.packets.enums import Enums
+from mymcp.packets.session import ProtocolSession
+from mymcp.packets.v769 import PacketsV769, PacketFactoryV769
+
+
+# (status, bound_to, pid) -> bool
+PidPredicate = Callable[[Enums.Status, Enums.BoundTo, int], bool]
+
+# 分发表项: (packet_cls 或 None (无需解码), 解码后处理函数, DataPacket 处理函数, 是否已订阅)
+# 未订阅但 session 关注的包解码后仍按 unsubscribed 处理
+Entry = tuple[
+    type[Packet] | None, tuple[Callable[[Packet], Any], ...], tuple[Callable[[DataPacket], Any], ...], bool
+]
+
+
+class SubscriptionRegistry:
+    """
+        订阅注册表
+        subscribe 按 Packet 类订阅，subscribe_pid 按 (status, bound_to, pid) 谓词订阅
+        未订阅的包按 unsubscribed 处理: PASS 返回 DataPacket，DROP 丢弃，FORWARD 交给 forward
+        传入 ProtocolSession 时其关注的包始终解码，Status 与 Chunk 高度由会话维护
+    """
+
+    PASS = 0
+    DROP = 1
+    FORWARD = 2
+
+    def __init__(
+            self, unsubscribed: int = PASS, forward: Callable[[DataPacket], Any] | None = None,
+            session: ProtocolSession | None = None
+    ):
+        """
+        :param unsubscribed: 未订阅包处理方式
+        :param forward: FORWARD 时调用
+        :param session: 协议会话
+        """
+        if unsubscribed == self.FORWARD and forward is None:
+            raise ValueError("FORWARD requires a forward callable")
+
+        self.unsubscribed = unsubscribed
+        self.forward = forward
+        self.session = session
+
+        self.handlers: list[tuple[type[Packet], Callable[[Packet], Any]]] = []
+        self.pid_handlers: list[tuple[PidPredicate, Callable[[Any], Any], bool]] = []
+
+        # [status][bound_to][pid] -> Entry | None，同 PacketFactoryV769.PACKETS
+        self.table: list[list[list[Entry | None]]] = []
+        self.build()
+
+    def __repr__(self):
+        return f"<SubscriptionRegistry>({len(self.handlers)} Handlers {len(self.pid_handlers)} Predicates)"
+
+    def subscribe(self, packet_cls: type[Packet], handler: Callable[[Packet], Any]) -> Callable[[Packet], Any]:
+        """
+            订阅 Packet 类，收到时解码并调用 handler(packet)
+        :param packet_cls:
+        :param handler:
+        :return: handler
+        """
+        self.handlers.append((packet_cls, handler))
+        self.build()
+        return handler
+
+    def subscribe_pid(
+            self, predicate: PidPredicate, handler: Callable[[Any], Any], raw: bool = False
+    ) -> Callable[[Any], Any]:
+        """
+            按 (status, bound_to, pid) 谓词订阅，注册时对全部 pid 求值
+        :param predicate:
+        :param handler:
+        :param raw: True 时不解码，handler(data_packet)，未知 pid 同样可订阅
+        :return: handler
+        """
+        self.pid_handlers.append((predicate, handler, raw))
+        self.build()
+        return handler
+
+    def unsubscribe(self, handler: Callable[[Any], Any]) -> None:
+        self.handlers = [_ for _ in self.handlers if _[1] is not handler]
+        self.pid_handlers = [_ for _ in self.pid_handlers if _[1] is not handler]
+        self.build()
+
+    def build(self) -> None:
+        """
+            重建分发表
+        :return:
+        """
+        observed = self.session.OBSERVED if self.session is not None else ()
+
+        table = []
+        for status in Enums.Status:
+            rows = []
+            for bound_to in Enums.BoundTo:
+                packets = PacketFactoryV769.PACKETS[status][bound_to]
+                row = []
+                for pid, packet_cls in enumerate(packets):
+                    handlers = [handler for cls, handler in self.handlers if cls is packet_cls]
+                    raw_handlers = []
+                    for predicate, handler, raw in self.pid_handlers:
+                        if (raw or packet_cls is not None) and predicate(status, bound_to, pid):
+                            (raw_handlers if raw else handlers).append(handler)
+
+                    decode = packet_cls is not None and (handlers or packet_cls in observed)
+                    row.append(
+                        (packet_cls if decode else None, tuple(handlers), tuple(raw_handlers),
+                         bool(handlers or raw_handlers))
+                        if decode or raw_handlers else None
+                    )
+                rows.append(row)
+            table.append(rows)
+        self.table = table
+
+    def decode(self, packet_cls: type[Packet], data_packet: DataPacket) -> Packet:
+        session = self.session
+        if session is None:
+            return packet_cls.decode(data_packet)
+
+        if packet_cls is PacketsV769.PCLevelChunkWithLight:
+            packet = packet_cls.decode(
+                data_packet, session.section_count, lazy=session.lazy_chunks, interner=session.interner
+            )
+        else:
+            packet = packet_cls.decode(data_packet)
+        session.observe(packet)
+        return packet
+
+    def dispatch(self, data_packet: DataPacket, status: Enums.Status | None = None) -> Packet | DataPacket | None:
+        """
+            分发单个包
+        :param data_packet:
+        :param status: 未传入时使用 session 的 Status
+        :return: 已解码的 Packet，仅 DataPacket 订阅或 PASS 时为 data_packet，DROP/FORWARD 时为 None
+        """
+        if status is None:
+            status = self.session.status[data_packet.bound_to]
+
+        pid = data_packet.pid
+        entry = self.table[status][data_packet.bound_to][pid] if 0 <= pid < PacketFactoryV769.PID_LIMIT else None
+
+        if entry is None:
+            return self.unsubscribed_packet(data_packet)
+
+        packet_cls, handlers, raw_handlers, subscribed = entry
+        if not subscribed:
+            # 仅 session 关注，解码以更新会话状态
+            self.decode(packet_cls, data_packet)
+            return self.unsubscribed_packet(data_packet)
+
+        for handler in raw_handlers:
+            handler(data_packet)
+
+        if packet_cls is None:
+            return data_packet
+
+        packet = self.decode(packet_cls, data_packet)
+        for handler in handlers:
+            handler(packet)
+        return packet
+
+    def unsubscribed_packet(self, data_packet: DataPacket) -> DataPacket | None:
+        """
+            按 unsubscribed 处理未订阅的包
+        :param data_packet:
+        :return: PASS 时为 data_packet
+        """
+        if self.unsubscribed == self.PASS:
+            return data_packet
+        if self.unsubscribed == self.FORWARD:
+            self.forward(data_packet)
+        return None
+
+    def dispatch_all(
+            self, data_packets: Iterable[DataPacket], status: Enums.Status | None = None
+    ) -> list[Packet | DataPacket]:
+        """
+            批量分发，丢弃/转发的包不返回
+        :param data_packets:
+        :param status:
+        :return:
+        """
+        results = []
+        for data_packet in data_packets:
+            result = self.dispatch(data_packet, status)
+            if result is not None:
+                results.append(result)
+        return results
+
+    def feed(self, codec: Codec, raw_bytes: bytes) -> Iterable[Packet | DataPacket]:
+        """
+            解码数据流并分发，需传入 session
+        :param codec: 已 attach 到 session 的 Codec
+        :param raw_bytes:
+        :return: 丢弃/转发的包不返回
+        """
+        for data_packet in codec.decode(raw_bytes):
+            result = self.dispatch(data_packet)
+            if result is not None:
+                yield result
@@ -6,6 +6,13 @@
     More Details see https://minecraft.wiki/w/Minecraft_Wiki:Projects/wiki.vg_merge/Protocol?oldid=2938097
 
     Log:
+        2026-10-19 0.2.1 Me2sY  PCLevelChunkWithLight 支持延迟解码
+                                PCChunksBiomes 修正为数组，PCSectionBlocksUpdate 支持批量解包/打包
+                                PCLevelChunkWithLight 支持内容驻留
+                                PCSetEntityData 修正为元数据数组，延迟解码，支持按下标过滤解码
+                                修正 PCSetEquipment 多装备项解码
+                                PacketFactoryV769 平坦分发表，decode/decode_all 一次调用解码
+
         2025-05-29 0.2.0 Me2sY  重构，完成全部 Protocol 编码/解码
 
         2025-05-23 0.1.0 Me2sY  创建
@@ -18,17 +25,18 @@ __all__ = ['PacketsV769', 'PacketFactoryV769']
 
 import datetime
 import json
+import struct
 from dataclasses import dataclass
 from io import BytesIO
-from typing import Optional, IO, Self, ClassVar, Union
+from typing import Optional, IO, Self, ClassVar, Union, Iterable, Callable
 
 from mymcp.data_types import *
-from mymcp.data_types.entity import EntityMetadata
+from mymcp.data_types.entity import EntityMetadata, LazyEntityMetadata
 from mymcp.data_types.protocol import AdvancementMapping, ProgressMapping, OptionalSignature256, Trade
 from mymcp.data_types.slot import Slot, RecipeDisplay, SlotDisplay
 from mymcp.data_types.particle import Particle
 from mymcp.data_types.nbt import TagCompound
-from mymcp.data_types.chunk import ChunkData, LightData
+from mymcp.data_types.chunk import ChunkData, LightData, ContentInterner
 from mymcp.packets import Packet
 from mymcp.packets.enums import V769 as ENUMS
 
@@ -1082,7 +1090,7 @@ class PacketsV769:
         BOUND_TO = ENUMS.BoundTo.CLIENT
         PACKET_ID_HEX = 0x0E
 
-        chunk_biome_data: Field | ChunkBiomeData
+        chunk_biome_data: Field | list[ChunkBiomeData]
 
 
     @dataclass(slots=True)
@@ -1554,18 +1562,23 @@ class PacketsV769:
             return f"PacketsV769 {self.PACKET_ID_HEX} <ChunkWithLight>({self.chunk_x}, {self.chunk_z})"
 
         @classmethod
-        def decode(cls, bytes_source: BytesIO | DataPacket | bytes, dimension_chunk_size: int = 24) -> Self:
+        def decode(
+                cls, bytes_source: BytesIO | DataPacket | bytes, dimension_chunk_size: int = 24, lazy: bool = False,
+                interner: ContentInterner | None = None
+        ) -> Self:
             """
                 不同世界 chunk size 不同
             :param bytes_source:
             :param dimension_chunk_size:
+            :param lazy: ChunkData 延迟解码
+            :param interner: 按内容共享 ChunkSection/LightArray
             :return:
             """
             bytes_io = cls.to_bytes_io(bytes_source)
             chunk_x = Int.decode(bytes_io)
             chunk_z = Int.decode(bytes_io)
-            data = ChunkData.decode(bytes_io, dimension_chunk_size)
-            light = LightData.decode(bytes_io)
+            data = ChunkData.decode(bytes_io, dimension_chunk_size, lazy=lazy, interner=interner)
+            light = LightData.decode(bytes_io, interner=interner)
             return cls(chunk_x=chunk_x, chunk_z=chunk_z, data=data, light=light)
 
 
@@ -2449,6 +2462,73 @@ class PacketsV769:
         chunk_section_position: Field | Long
         blocks: Field | list[VarLong]
 
+        @staticmethod
+        def unpack_section_position(value: int) -> tuple[int, int, int]:
+            """
+                Section 坐标 x 22 bits | z 22 bits | y 20 bits
+            :param value:
+            :return: (section_x, section_y, section_z)
+            """
+            y = value & 0xFFFFF
+            z = (value >> 20) & 0x3FFFFF
+            return (
+                value >> 42,
+                y - 0x100000 if y & 0x80000 else y,
+                z - 0x400000 if z & 0x200000 else z
+            )
+
+        @staticmethod
+        def pack_section_position(section_x: int, section_y: int, section_z: int) -> int:
+            """
+                unpack_section_position 的逆操作
+            :param section_x:
+            :param section_y:
+            :param section_z:
+            :return: signed long
+            """
+            value = ((section_x & 0x3FFFFF) << 42) | ((section_z & 0x3FFFFF) << 20) | (section_y & 0xFFFFF)
+            return value - (1 << 64) if value & (1 << 63) else value
+
+        @property
+        def section_position(self) -> tuple[int, int, int]:
+            return self.unpack_section_position(self.chunk_section_position.value)
+
+        @classmethod
+        def pack(cls, section_position: tuple[int, int, int], entries: Iterable[int]) -> bytes:
+            """
+                直接生成 payload，unpack 的逆操作
+            :param section_position: (section_x, section_y, section_z)
+            :param entries: block_state_id << 12 | (x << 8 | z << 4 | y)
+            :return:
+            """
+            entries = list(entries)
+            return cls.pack_encoded(section_position, len(entries), VarLong.pack_many(entries))
+
+        @classmethod
+        def pack_encoded(cls, section_position: tuple[int, int, int], count: int, encoded: bytes) -> bytes:
+            """
+                由已编码的连续 VarLong 生成 payload
+            :param section_position:
+            :param count:
+            :param encoded:
+            :return:
+            """
+            return struct.pack('>q', cls.pack_section_position(*section_position)) + VarInt.encode(count) + encoded
+
+        @classmethod
+        def unpack(cls, bytes_source: bytes | DataPacket) -> tuple[tuple[int, int, int], list[int]]:
+            """
+                直接由 payload 批量解包，不创建 VarLong 对象
+                每项为 block_state_id << 12 | (x << 8 | z << 4 | y)
+            :param bytes_source:
+            :return: ((section_x, section_y, section_z), [entry, ...])
+            """
+            data = bytes_source.data if isinstance(bytes_source, DataPacket) else bytes_source
+            (position,) = struct.unpack_from('>q', data, 0)
+            (count,), offset = VarInt.unpack_many(data, 1, 8)
+            entries, _ = VarLong.unpack_many(data, count, offset)
+            return cls.unpack_section_position(position), entries
+
 
     @dataclass(slots=True)
     class PCSelectAdvancementsTab(Packet):
@@ -2653,7 +2733,21 @@ class PacketsV769:
         PACKET_ID_HEX = 0x5D
 
         entity_id: Field | VarInt
-        metadata: Field | EntityMetadata
+        metadata: Field | LazyEntityMetadata
+
+        @classmethod
+        def unpack(
+                cls, bytes_source: bytes | DataPacket, indexes: Iterable[int] | None = None
+        ) -> tuple[int, dict[int, EntityMetadata]]:
+            """
+                直接由 payload 解码，仅解码 indexes 中的元数据，其余按长度跳过
+            :param bytes_source:
+            :param indexes: 需要的元数据下标，None 为全部
+            :return: (entity_id, {index: EntityMetadata})
+            """
+            bytes_io = cls.to_bytes_io(bytes_source)
+            entity_id = VarInt.decode(bytes_io).value
+            return entity_id, EntityMetadata.decode_many(bytes_io, indexes)
 
 
     @dataclass(slots=True)
@@ -2718,7 +2812,8 @@ class PacketsV769:
             while True:
                 equipment = cls.Equipment.decode(bytes_io)
                 equipments.append(equipment)
-                if equipment.slot.value < 64:
+                # 最高位为 1 时后续仍有装备项
+                if not equipment.slot.value & 0x80:
                     break
 
             return cls(entity_id=entity_id, equipments=equipments)
@@ -4591,8 +4686,25 @@ class PacketsV769:
 
 
 class PacketFactoryV769:
+    """
+        Packet 工厂
+        PACKETS/DECODERS 为预先展开的定长数组，按 [status][bound_to][pid] 直接下标查找
+    """
+
     PACKET_MAPPER = {}
 
+    PID_LIMIT: ClassVar[int] = 256
+
+    PACKETS: ClassVar[list[list[list[type[Packet] | None]]]] = []
+
+    # 可直接调用的解码函数，PCLevelChunkWithLight 按 24 个 Section 解码，其他高度见 ProtocolSession
+    DECODERS: ClassVar[list[list[list[Callable[[DataPacket], Packet] | None]]]] = []
+
+    # 下标依次为 Status / BoundTo(CLIENT, SERVER) / pid
+    for _status in ENUMS.Status:
+        PACKETS.append([[None] * PID_LIMIT, [None] * PID_LIMIT])
+        DECODERS.append([[None] * PID_LIMIT, [None] * PID_LIMIT])
+
     for cls_name, packet_cls in PacketsV769.__dict__.items():
         if cls_name.startswith('__'):
             continue
@@ -4602,6 +4714,8 @@ class PacketFactoryV769:
                 PACKET_MAPPER.setdefault(packet_cls.STATUS, {}).setdefault(packet_cls.BOUND_TO, {})[
                     packet_cls.PACKET_ID_HEX
                 ] = packet_cls
+                PACKETS[packet_cls.STATUS][packet_cls.BOUND_TO][packet_cls.PACKET_ID_HEX] = packet_cls
+                DECODERS[packet_cls.STATUS][packet_cls.BOUND_TO][packet_cls.PACKET_ID_HEX] = packet_cls.decode
         except TypeError:
             ...
 
@@ -4614,10 +4728,7 @@ class PacketFactoryV769:
         :param packet_id:
         :return:
         """
-        try:
-            return cls.PACKET_MAPPER[status][bound_to][packet_id]
-        except KeyError:
-            return None
+        return cls.PACKETS[status][bound_to][packet_id] if 0 <= packet_id < cls.PID_LIMIT else None
 
     @classmethod
     def get_packet_by_dp(cls, status: ENUMS.Status, data_packet: DataPacket) -> Packet | None:
@@ -4627,7 +4738,37 @@ class PacketFactoryV769:
         :param data_packet:
         :return:
         """
-        try:
-            return cls.PACKET_MAPPER[status][data_packet.bound_to][data_packet.pid]
-        except KeyError:
+        pid = data_packet.pid
+        return cls.PACKETS[status][data_packet.bound_to][pid] if 0 <= pid < cls.PID_LIMIT else None
+
+    @classmethod
+    def decode(cls, status: ENUMS.Status, data_packet: DataPacket) -> Packet | None:
+        """
+            查表并解码
+        :param status:
+        :param data_packet:
+        :return: 未知包返回 None
+        """
+        pid = data_packet.pid
+        if not 0 <= pid < cls.PID_LIMIT:
             return None
+        decoder = cls.DECODERS[status][data_packet.bound_to][pid]
+        return decoder(data_packet) if decoder is not None else None
+
+    @classmethod
+    def decode_all(cls, status: ENUMS.Status, data_packets: Iterable[DataPacket]) -> list[Packet | None]:
+        """
+            批量解码，同一 Status 的分发表只查找一次
+        :param status:
+        :param data_packets:
+        :return: 与 data_packets 一一对应，未知包为 None
+        """
+        decoders = cls.DECODERS[status]
+        limit = cls.PID_LIMIT
+
+        packets = []
+        for data_packet in data_packets:
+            pid = data_packet.pid
+            decoder = decoders[data_packet.bound_to][pid] if 0 <= pid < limit else None
+            packets.append(decoder(data_packet) if decoder is not None else None)
+        return packets
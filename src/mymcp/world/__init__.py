@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+"""
+    world
+    ~~~~~~~~~~~~~~~~~~
+    世界数据，存档读取
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+__all__ = []
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""
+    builder
+    ~~~~~~~~~~~~~~~~~~
+    服务端 PCLevelChunkWithLight 构建
+    由 ChunkColumn 数组直接序列化，最终帧 (含长度/压缩) 按 (chunk_x, chunk_z, 版本) LRU 缓存
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建
+                                encode 不经缓存构建帧
+                                Chunk 卸载时移除版本及缓存帧
+                                未 attach 且未指定版本时不缓存
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+__all__ = [
+    'ChunkPacketBuilder'
+]
+
+from collections import OrderedDict
+from typing import Any, Iterable
+
+from mymcp.data_types import Int, Short, VarInt, BitSet, NBT, DataPacket
+from mymcp.data_types.chunk import PalettedContainer, PalettedContainerBlocks, PalettedContainerBiomes, LightData
+from mymcp.data_types.nbt import TagCompoundNet
+from mymcp.packets import Codec
+from mymcp.packets.v769 import PacketsV769
+from mymcp.world.column import ChunkColumn
+from mymcp.world.store import ChunkStore, ChunkKey
+
+
+class ChunkPacketBuilder:
+    """
+        Chunk 包构建器
+        version 未指定时使用 attach 的 ChunkStore 变化计数，Chunk 内容变化后自动失效
+        Chunk 卸载后移除其版本与缓存帧
+    """
+
+    PACKET = PacketsV769.PCLevelChunkWithLight
+
+    EMPTY_HEIGHTMAPS = NBT(TagCompoundNet(value=[])).bytes
+
+    def __init__(self, compression_threshold: int = 256, max_frames: int = 4096):
+        """
+        :param compression_threshold: 压缩阈值，-1 为不压缩
+        :param max_frames: 最大缓存帧数
+        """
+        self.compression_threshold = compression_threshold
+        self.max_frames = max_frames
+        self.frames: OrderedDict[tuple[int, int, int], bytes] = OrderedDict()
+        self.versions: dict[ChunkKey, int] = {}
+        self._latest: dict[ChunkKey, int] = {}
+        self.store: ChunkStore | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return f"<ChunkPacketBuilder>({len(self.frames)} Frames hits={self.hits} misses={self.misses})"
+
+    def attach(self, store: ChunkStore) -> None:
+        """
+            监听 ChunkStore 变化，自动维护内容版本
+        :param store:
+        :return:
+        """
+        self.store = store
+        store.listeners.append(self.on_change)
+
+    def on_change(self, key: ChunkKey | None, section_index: int | None, states: Iterable[int] | None) -> None:
+        if key is None:
+            self.frames.clear()
+            self.versions.clear()
+            self._latest.clear()
+        elif section_index is None and self.store is not None and not self.store.is_loaded(*key):
+            self.versions.pop(key, None)
+            latest = self._latest.pop(key, None)
+            if latest is not None:
+                self.frames.pop((*key, latest), None)
+        else:
+            self.versions[key] = self.versions.get(key, 0) + 1
+
+    def invalidate(self, chunk_x: int, chunk_z: int) -> None:
+        """
+            内容版本 +1，下次构建时替换旧帧
+        :param chunk_x:
+        :param chunk_z:
+        :return:
+        """
+        self.on_change((chunk_x, chunk_z), None, None)
+
+    @staticmethod
+    def container_bytes(values: Any, container_cls: type[PalettedContainer]) -> bytes:
+        """
+            ID 数组 -> PalettedContainer bytes，自动选择最优 palette
+        :param values: int (单值) 或 ID 数组
+        :param container_cls:
+        :return:
+        """
+        if isinstance(values, int):
+            return container_cls.single_value(values).bytes
+        return container_cls.from_array(values).bytes
+
+    @classmethod
+    def sections_bytes(cls, column: ChunkColumn) -> bytes:
+        return b''.join(
+            Short.encode(block_count) +
+            cls.container_bytes(blocks, PalettedContainerBlocks) +
+            cls.container_bytes(biomes, PalettedContainerBiomes)
+            for block_count, blocks, biomes in zip(column.block_counts, column.blocks, column.biomes)
+        )
+
+    @staticmethod
+    def light_bytes(lights: dict[int, bytes]) -> tuple[bytes, bytes, bytes]:
+        """
+            Light 数组 -> (mask, empty_mask, arrays) bytes
+        :param lights:
+        :return:
+        """
+        indexes, empty_indexes, arrays = [], [], []
+        for index in sorted(lights):
+            light = lights[index]
+            if light is LightData.EMPTY or light == LightData.EMPTY:
+                empty_indexes.append(index)
+            else:
+                indexes.append(index)
+                arrays.append(VarInt.encode(len(light)) + light)
+        return (
+            BitSet.from_indexes(indexes).bytes,
+            BitSet.from_indexes(empty_indexes).bytes,
+            VarInt.encode(len(arrays)) + b''.join(arrays)
+        )
+
+    @classmethod
+    def payload(cls, column: ChunkColumn) -> bytes:
+        """
+            ChunkColumn -> PCLevelChunkWithLight payload
+        :param column:
+        :return:
+        """
+        column.sync_heightmaps()
+        heightmaps = column.heightmaps.bytes if column.heightmaps is not None else cls.EMPTY_HEIGHTMAPS
+        sections = cls.sections_bytes(column)
+
+        block_entities = column.block_entities
+        raw_block_entities = block_entities.bytes if hasattr(block_entities, 'bytes') else b''.join(
+            _.bytes for _ in block_entities
+        )
+
+        sky_mask, empty_sky_mask, sky_arrays = cls.light_bytes(column.sky_light)
+        block_mask, empty_block_mask, block_arrays = cls.light_bytes(column.block_light)
+
+        return b''.join((
+            Int.encode(column.chunk_x), Int.encode(column.chunk_z),
+            heightmaps, VarInt.encode(len(sections)), sections,
+            VarInt.encode(len(block_entities)), raw_block_entities,
+            sky_mask, block_mask, empty_sky_mask, empty_block_mask, sky_arrays, block_arrays
+        ))
+
+    def encode(self, column: ChunkColumn) -> bytes:
+        """
+            完整帧，不经缓存
+        :param column:
+        :return:
+        """
+        data = self.payload(column)
+        return Codec.encode_by_threshold(
+            self.compression_threshold,
+            DataPacket(len(data), self.PACKET.BOUND_TO, self.PACKET.PACKET_ID_HEX, data)
+        )
+
+    def frame(self, column: ChunkColumn, version: int | None = None) -> bytes:
+        """
+            完整帧 (长度 + 压缩)，可直接写入连接
+        :param column:
+        :param version: 内容版本，None 时使用 attach 维护的版本，未 attach 时不经缓存
+        :return:
+        """
+        if version is None:
+            if self.store is None:
+                self.misses += 1
+                return self.encode(column)
+            version = self.versions.get(column.key, 0)
+
+        key = (column.chunk_x, column.chunk_z, version)
+        frame = self.frames.get(key)
+        if frame is not None:
+            self.hits += 1
+            self.frames.move_to_end(key)
+            return frame
+
+        self.misses += 1
+        frame = self.encode(column)
+
+        # 同一 Chunk 仅保留最新版本
+        previous = self._latest.get(column.key)
+        if previous is not None and previous != version:
+            self.frames.pop((column.chunk_x, column.chunk_z, previous), None)
+        self._latest[column.key] = version
+
+        self.frames[key] = frame
+        if len(self.frames) > self.max_frames:
+            self.frames.popitem(last=False)
+        return frame
@@ -0,0 +1,574 @@
+# -*- coding: utf-8 -*-
+"""
+    cache
+    ~~~~~~~~~~~~~~~~~~
+    内存预算 Chunk 缓存
+    超出预算时按 LRU (优先视距外) 写入磁盘，读取时经 mmap 载入
+    磁盘数据按服务器/维度分目录保存，重连后可继续使用
+
+    磁盘格式 (小端):
+        chunks.dat  追加写入的 Chunk 记录
+        chunks.idx  chunk_x, chunk_z, offset, length
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建
+                                记录修改过的 Chunk，写出时跳过磁盘记录仍有效的 Chunk
+                                reset 清空磁盘数据，iter_columns 遍历时不载入内存
+                                载入时按 interner 重新驻留
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+__all__ = [
+    'ChunkCache'
+]
+
+from array import array
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from io import BytesIO
+import mmap
+import os
+import re
+import struct
+import sys
+from typing import Any, Iterator, Self
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from mymcp.data_types import LazyNBT
+from mymcp.data_types.chunk import ARRAY_TYPECODE, BlockEntity, ContentInterner, LazyArray
+from mymcp.world.column import ChunkColumn
+
+
+ChunkKey = tuple[int, int]
+
+
+class ChunkCache(MutableMapping):
+    """
+        Chunk 缓存，可作为 ChunkStore 的 columns 使用
+        未在内存中的 Chunk 访问时自动由磁盘载入
+        仅 dirty 中的 Chunk 在写出时追加记录，直接修改 ChunkColumn 后须调用 mark_dirty
+    """
+
+    MAGIC = b'MCCK'
+    FORMAT_VERSION = 1
+
+    DATA_FILE = 'chunks.dat'
+    INDEX_FILE = 'chunks.idx'
+
+    RECORD_HEAD = struct.Struct('<4sBiiH')
+    INDEX_ENTRY = struct.Struct('<iiQI')
+    SECTION_SINGLE = struct.Struct('<BH')
+    LIGHT_HEAD = struct.Struct('<H')
+    BLOB_HEAD = struct.Struct('<I')
+
+    KIND_SINGLE = 0
+    KIND_ARRAY = 1
+
+    # 对象开销估算
+    COLUMN_OVERHEAD = 1024
+
+    def __init__(
+            self,
+            directory: str | os.PathLike,
+            server: str = 'default',
+            dimension: str = 'minecraft:overworld',
+            memory_budget: int = 256 * 1024 * 1024,
+            interner: ContentInterner | None = None,
+    ):
+        """
+        :param directory: 缓存根目录
+        :param server: 服务器标识，如 host:port
+        :param dimension: 维度名称
+        :param memory_budget: 内存预算 bytes
+        :param interner: 由磁盘载入的 Chunk 重新驻留
+        """
+        self.directory = os.fspath(directory)
+        self.server = server
+        self.memory_budget = memory_budget
+        self.interner = interner
+
+        self.center: ChunkKey = (0, 0)
+        self.radius: int | None = None
+
+        self.memory: OrderedDict[ChunkKey, ChunkColumn] = OrderedDict()
+        self.memory_usage = 0
+        self._sizes: dict[ChunkKey, int] = {}
+        # 与磁盘记录不一致 (新增或已修改) 的内存 Chunk
+        self.dirty: set[ChunkKey] = set()
+
+        self.index: dict[ChunkKey, tuple[int, int]] = {}
+        self._data_file = None
+        self._mmap: mmap.mmap | None = None
+        self._stale = 0
+
+        self.dimension = None
+        self.switch_dimension(dimension)
+
+    def __repr__(self):
+        return (
+            f"<ChunkCache>({self.server} {self.dimension} "
+            f"memory={len(self.memory)} disk={len(self.index)} {self.memory_usage}/{self.memory_budget})"
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @staticmethod
+    def safe_name(name: str) -> str:
+        return re.sub(r'[^\w.-]', '_', name)
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.directory, self.safe_name(self.server), self.safe_name(self.dimension))
+
+    # ---------------- MutableMapping ----------------
+
+    def __getitem__(self, key: ChunkKey) -> ChunkColumn:
+        column = self.memory.get(key)
+        if column is not None:
+            self.memory.move_to_end(key)
+            return column
+
+        if key not in self.index:
+            raise KeyError(key)
+
+        column = self.load(key)
+        self._insert(key, column)
+        self._evict(key)
+        return column
+
+    def __setitem__(self, key: ChunkKey, column: ChunkColumn) -> None:
+        self._remove_memory(key)
+        self._insert(key, column)
+        self.dirty.add(key)
+        self._evict(key)
+
+    def __delitem__(self, key: ChunkKey) -> None:
+        in_memory = self._remove_memory(key)
+        self.dirty.discard(key)
+        location = self.index.pop(key, None)
+        if location is not None:
+            self._stale += location[1]
+        elif not in_memory:
+            raise KeyError(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.memory or key in self.index
+
+    def __iter__(self) -> Iterator[ChunkKey]:
+        yield from self.memory
+        for key in list(self.index):
+            if key not in self.memory:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self.memory) + sum(1 for _ in self.index if _ not in self.memory)
+
+    def clear(self) -> None:
+        """
+            已修改的内存 Chunk 写入磁盘后清空内存，磁盘数据保留
+        :return:
+        """
+        self.flush()
+        self.memory.clear()
+        self._sizes.clear()
+        self.memory_usage = 0
+
+    def reset(self) -> None:
+        """
+            清空内存及当前维度磁盘数据
+        :return:
+        """
+        self.memory.clear()
+        self._sizes.clear()
+        self.memory_usage = 0
+        self.dirty.clear()
+        self.index.clear()
+        self._stale = 0
+
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._data_file.truncate(0)
+        self._save_index()
+
+    def iter_columns(self) -> Iterator[ChunkColumn]:
+        """
+            遍历全部 Chunk，磁盘 Chunk 直接读取，不放入内存也不触发写出
+        :return:
+        """
+        yield from list(self.memory.values())
+        for key in list(self.index):
+            if key not in self.memory:
+                yield self.load(key)
+
+    # ---------------- 内存管理 ----------------
+
+    @classmethod
+    def estimate_size(cls, column: ChunkColumn) -> int:
+        """
+            估算 Column 内存占用，共享 (驻留) 数组按份计算
+        :param column:
+        :return:
+        """
+        size = cls.COLUMN_OVERHEAD
+        for section in column.blocks + column.biomes:
+            if not isinstance(section, int):
+                size += len(section) * section.itemsize
+        size += sum(len(_) for _ in column.sky_light.values())
+        size += sum(len(_) for _ in column.block_light.values())
+        return size
+
+    def _insert(self, key: ChunkKey, column: ChunkColumn) -> None:
+        size = self.estimate_size(column)
+        self.memory[key] = column
+        self._sizes[key] = size
+        self.memory_usage += size
+
+    def mark_dirty(self, key: ChunkKey) -> None:
+        """
+            内存 Chunk 已修改，写出时重新写入
+        :param key:
+        :return:
+        """
+        if key in self.memory:
+            self.dirty.add(key)
+
+    def _remove_memory(self, key: ChunkKey) -> bool:
+        if self.memory.pop(key, None) is None:
+            return False
+        self.memory_usage -= self._sizes.pop(key)
+        return True
+
+    def in_radius(self, key: ChunkKey) -> bool:
+        if self.radius is None:
+            return True
+        return max(abs(key[0] - self.center[0]), abs(key[1] - self.center[1])) <= self.radius
+
+    def _evict(self, keep: ChunkKey | None = None) -> None:
+        """
+            超出预算时先写出视距外 Chunk，再按 LRU 写出，最近使用的 Chunk 始终保留
+        :param keep: 本次访问的 Chunk
+        :return:
+        """
+        if self.memory_usage <= self.memory_budget:
+            return
+
+        for key in [_ for _ in self.memory if _ != keep and not self.in_radius(_)]:
+            if self.memory_usage <= self.memory_budget:
+                return
+            self.spill(key)
+
+        while self.memory_usage > self.memory_budget and len(self.memory) > 1:
+            self.spill(next(iter(self.memory)))
+
+    def spill(self, key: ChunkKey) -> bool:
+        """
+            移出内存，已修改或无磁盘记录时先写入磁盘
+        :param key:
+        :return:
+        """
+        column = self.memory.get(key)
+        if column is None:
+            return False
+        if key in self.dirty or key not in self.index:
+            self.write(column)
+        self._remove_memory(key)
+        return True
+
+    def forget(self, chunk_x: int, chunk_z: int) -> ChunkColumn | None:
+        """
+            服务器卸载 Chunk 时写入磁盘保留
+        :param chunk_x:
+        :param chunk_z:
+        :return:
+        """
+        key = (chunk_x, chunk_z)
+        column = self.memory.get(key)
+        self.spill(key)
+        return column
+
+    def set_center(self, chunk_x: int, chunk_z: int) -> None:
+        self.center = (chunk_x, chunk_z)
+        self._evict()
+
+    def set_radius(self, radius: int) -> None:
+        self.radius = radius
+        self._evict()
+
+    def apply_chunk_cache_center(self, packet: Any) -> None:
+        self.set_center(packet.chunk_x.value, packet.chunk_z.value)
+
+    def apply_chunk_cache_radius(self, packet: Any) -> None:
+        self.set_radius(packet.view_distance.value)
+
+    # ---------------- 磁盘 ----------------
+
+    def switch_dimension(self, dimension: str) -> None:
+        """
+            切换维度，内存 Chunk 写入当前维度目录后清空
+        :param dimension:
+        :return:
+        """
+        if dimension == self.dimension:
+            return
+
+        if self.dimension is not None:
+            self.clear()
+            self._close_files()
+
+        self.dimension = dimension
+        os.makedirs(self.path, exist_ok=True)
+        self._data_file = open(os.path.join(self.path, self.DATA_FILE), 'a+b')
+        self._load_index()
+
+    def _load_index(self) -> None:
+        self.index.clear()
+        self._stale = 0
+
+        data_size = os.fstat(self._data_file.fileno()).st_size
+        try:
+            with open(os.path.join(self.path, self.INDEX_FILE), 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            self._stale = data_size
+            return
+
+        used = 0
+        for offset in range(0, len(raw) - len(raw) % self.INDEX_ENTRY.size, self.INDEX_ENTRY.size):
+            chunk_x, chunk_z, data_offset, length = self.INDEX_ENTRY.unpack_from(raw, offset)
+            if data_offset + length <= data_size:
+                self.index[chunk_x, chunk_z] = (data_offset, length)
+                used += length
+        self._stale = data_size - used
+
+    def _save_index(self) -> None:
+        path = os.path.join(self.path, self.INDEX_FILE)
+        with open(path + '.tmp', 'wb') as f:
+            f.write(b''.join(
+                self.INDEX_ENTRY.pack(chunk_x, chunk_z, offset, length)
+                for (chunk_x, chunk_z), (offset, length) in self.index.items()
+            ))
+        os.replace(path + '.tmp', path)
+
+    def _view(self) -> mmap.mmap:
+        """
+            数据文件 mmap，文件增长后重新映射
+        :return:
+        """
+        size = os.fstat(self._data_file.fileno()).st_size
+        if self._mmap is None or len(self._mmap) < size:
+            if self._mmap is not None:
+                self._mmap.close()
+            self._mmap = mmap.mmap(self._data_file.fileno(), size, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def write(self, column: ChunkColumn) -> None:
+        """
+            追加写入磁盘记录
+        :param column:
+        :return:
+        """
+        self.dirty.discard(column.key)
+        record = self.encode(column)
+        self._data_file.seek(0, os.SEEK_END)
+        offset = self._data_file.tell()
+        self._data_file.write(record)
+        self._data_file.flush()
+
+        previous = self.index.get(column.key)
+        if previous is not None:
+            self._stale += previous[1]
+        self.index[column.key] = (offset, len(record))
+
+    def load(self, key: ChunkKey) -> ChunkColumn:
+        """
+            由磁盘载入，不放入内存，设置 interner 时重新驻留
+        :param key:
+        :return:
+        """
+        offset, length = self.index[key]
+        column = self.decode(self._view(), offset)
+        if self.interner is not None:
+            column.intern(self.interner)
+        return column
+
+    def flush(self) -> None:
+        """
+            已修改的内存 Chunk 写入磁盘并保存索引
+        :return:
+        """
+        for key in [_ for _ in self.memory if _ in self.dirty or _ not in self.index]:
+            self.write(self.memory[key])
+        self._save_index()
+
+    def compact(self) -> None:
+        """
+            重写数据文件，去除过期记录
+        :return:
+        """
+        view = self._view()
+        path = os.path.join(self.path, self.DATA_FILE)
+        index = {}
+        with open(path + '.tmp', 'wb') as f:
+            for key, (offset, length) in self.index.items():
+                index[key] = (f.tell(), length)
+                f.write(view[offset: offset + length])
+
+        self._close_files()
+        os.replace(path + '.tmp', path)
+        self.index = index
+        self._stale = 0
+        self._data_file = open(path, 'a+b')
+        self._save_index()
+
+    def _close_files(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._data_file is not None:
+            self._data_file.close()
+            self._data_file = None
+
+    def close(self) -> None:
+        """
+            写入磁盘并关闭，过期数据超过一半时压缩
+        :return:
+        """
+        if self._data_file is None:
+            return
+        self.flush()
+        if self._stale > sum(_[1] for _ in self.index.values()):
+            self.compact()
+        self._close_files()
+
+    # ---------------- 编码 ----------------
+
+    @staticmethod
+    def array_bytes(values: Any) -> bytes:
+        if np is not None and isinstance(values, np.ndarray):
+            return values.astype('<u2', copy=False).tobytes()
+        if sys.byteorder == 'big':
+            values = array(ARRAY_TYPECODE, values)
+            values.byteswap()
+        return values.tobytes()
+
+    @staticmethod
+    def bytes_array(buffer: Any, offset: int, count: int) -> Any:
+        if np is not None:
+            return np.frombuffer(buffer, dtype='<u2', count=count, offset=offset).astype(np.uint16)
+        values = array(ARRAY_TYPECODE)
+        values.frombytes(buffer[offset: offset + count * 2])
+        if sys.byteorder == 'big':
+            values.byteswap()
+        return values
+
+    @classmethod
+    def encode(cls, column: ChunkColumn) -> bytes:
+        """
+            ChunkColumn -> 磁盘记录
+        :param column:
+        :return:
+        """
+        parts = [cls.RECORD_HEAD.pack(
+            cls.MAGIC, cls.FORMAT_VERSION, column.chunk_x, column.chunk_z, len(column.blocks)
+        )]
+
+        for sections in (column.blocks, column.biomes):
+            for section in sections:
+                if isinstance(section, int):
+                    parts.append(cls.SECTION_SINGLE.pack(cls.KIND_SINGLE, section))
+                else:
+                    parts.append(cls.SECTION_SINGLE.pack(cls.KIND_ARRAY, len(section)))
+                    parts.append(cls.array_bytes(section))
+
+        parts.append(struct.pack(f'<{len(column.block_counts)}h', *column.block_counts))
+
+        for lights in (column.sky_light, column.block_light):
+            parts.append(cls.LIGHT_HEAD.pack(len(lights)))
+            for index, light in lights.items():
+                parts.append(cls.LIGHT_HEAD.pack(index))
+                parts.append(cls.BLOB_HEAD.pack(len(light)))
+                parts.append(light)
+
+        column.sync_heightmaps()
+        heightmaps = column.heightmaps.bytes if column.heightmaps is not None else b''
+        parts.append(cls.BLOB_HEAD.pack(len(heightmaps)))
+        parts.append(heightmaps)
+
+        block_entities = column.block_entities
+        if isinstance(block_entities, LazyArray):
+            raw = block_entities.bytes
+        else:
+            raw = b''.join(_.bytes for _ in block_entities)
+        parts.append(cls.BLOB_HEAD.pack(len(block_entities)))
+        parts.append(cls.BLOB_HEAD.pack(len(raw)))
+        parts.append(raw)
+
+        return b''.join(parts)
+
+    @classmethod
+    def decode(cls, buffer: Any, offset: int = 0) -> ChunkColumn:
+        """
+            磁盘记录 -> ChunkColumn，Heightmaps/BlockEntity 保持原始 bytes 延迟解码
+        :param buffer:
+        :param offset:
+        :return:
+        """
+        magic, version, chunk_x, chunk_z, section_count = cls.RECORD_HEAD.unpack_from(buffer, offset)
+        if magic != cls.MAGIC or version != cls.FORMAT_VERSION:
+            raise ValueError(f"Invalid chunk cache record at {offset}")
+        offset += cls.RECORD_HEAD.size
+
+        containers = []
+        for _ in range(2):
+            sections = []
+            for _ in range(section_count):
+                kind, value = cls.SECTION_SINGLE.unpack_from(buffer, offset)
+                offset += cls.SECTION_SINGLE.size
+                if kind == cls.KIND_SINGLE:
+                    sections.append(value)
+                else:
+                    sections.append(cls.bytes_array(buffer, offset, value))
+                    offset += value * 2
+            containers.append(sections)
+
+        block_counts = list(struct.unpack_from(f'<{section_count}h', buffer, offset))
+        offset += section_count * 2
+
+        light_maps = []
+        for _ in range(2):
+            (count,) = cls.LIGHT_HEAD.unpack_from(buffer, offset)
+            offset += cls.LIGHT_HEAD.size
+            lights = {}
+            for _ in range(count):
+                (index,) = cls.LIGHT_HEAD.unpack_from(buffer, offset)
+                (length,) = cls.BLOB_HEAD.unpack_from(buffer, offset + cls.LIGHT_HEAD.size)
+                offset += cls.LIGHT_HEAD.size + cls.BLOB_HEAD.size
+                lights[index] = bytes(buffer[offset: offset + length])
+                offset += length
+            light_maps.append(lights)
+
+        (length,) = cls.BLOB_HEAD.unpack_from(buffer, offset)
+        offset += cls.BLOB_HEAD.size
+        heightmaps = LazyNBT.decode(BytesIO(buffer[offset: offset + length])) if length else None
+        offset += length
+
+        count, length = struct.unpack_from('<II', buffer, offset)
+        offset += cls.BLOB_HEAD.size * 2
+        block_entities = LazyArray(bytes(buffer[offset: offset + length]), count, BlockEntity)
+
+        return ChunkColumn(
+            chunk_x, chunk_z, containers[0], containers[1], block_counts,
+            heightmaps=heightmaps, block_entities=block_entities,
+            sky_light=light_maps[0], block_light=light_maps[1]
+        )
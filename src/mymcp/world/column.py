@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+    column
+    ~~~~~~~~~~~~~~~~~~
+    紧凑 Chunk 列，由 PCLevelChunkWithLight 转换而来
+    Section 以 ID 数组保存，单值 Section 仅保存一个 int，可直接 pickle 跨进程传递
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建，支持内容驻留，Heightmap 解包缓存
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+__all__ = [
+    'ChunkColumn'
+]
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+from mymcp.data_types import NBT, DataPacket
+from mymcp.data_types.chunk import (
+    ChunkData, LightData, PalettedContainer, BlockEntity, LazyArray, ContentInterner, unpack_heightmap, pack_heightmap
+)
+from mymcp.data_types.nbt import TagLongArray
+from mymcp.packets.v769 import PacketsV769
+
+
+@dataclass(slots=True)
+class ChunkColumn:
+    """
+        紧凑 Chunk 列
+        blocks/biomes: 每个 Section 为 int (单值) 或 4096/64 长度 ID 数组 (ndarray uint16 或 array('H'))
+        sky_light/block_light: Light Mask 位下标 -> 2048 bytes Nibble 数组
+                               位 0 为世界最低 Section 下方一层
+                               empty 位为共享的 LightData.EMPTY，未包含的位不存在
+        heights: 已解包的 Heightmap，修改后由 sync_heightmaps 写回 heightmaps
+    """
+    chunk_x: int
+    chunk_z: int
+    blocks: list[Any]
+    biomes: list[Any]
+    block_counts: list[int]
+    heightmaps: NBT | None = None
+    block_entities: list[BlockEntity] | LazyArray = field(default_factory=list)
+    sky_light: dict[int, bytes] = field(default_factory=dict)
+    block_light: dict[int, bytes] = field(default_factory=dict)
+    heights: dict[str, Any] = field(default_factory=dict)
+
+    def __repr__(self):
+        return f"<ChunkColumn>({self.chunk_x}, {self.chunk_z} {len(self.blocks)} Sections)"
+
+    @property
+    def key(self) -> tuple[int, int]:
+        return self.chunk_x, self.chunk_z
+
+    @staticmethod
+    def compact_container(container: PalettedContainer) -> Any:
+        """
+            单值 -> int，其余 -> ID 数组
+        :param container:
+        :return:
+        """
+        if container.paletted_type == container.TYPE_SINGLE_VALUE:
+            return container.palette.value
+        return container.to_array()
+
+    @property
+    def height(self) -> int:
+        return len(self.blocks) * 16
+
+    def heightmap(self, name: str) -> Any:
+        """
+            解包并缓存 Heightmap，见 unpack_heightmap
+        :param name:
+        :return: 不存在时为 None
+        """
+        values = self.heights.get(name)
+        if values is None and self.heightmaps is not None:
+            tag = self.heightmaps.value.get(name)
+            if tag is not None:
+                values = self.heights[name] = unpack_heightmap(tag.value, self.height)
+        return values
+
+    def sync_heightmaps(self) -> None:
+        """
+            已解包 Heightmap 打包写回 heightmaps
+        :return:
+        """
+        if not self.heights or self.heightmaps is None:
+            return
+
+        compound = self.heightmaps.value
+        for name, values in self.heights.items():
+            longs = pack_heightmap(values, self.height)
+            tag = compound.get(name)
+            if tag is None:
+                compound.value.append(TagLongArray(name=name, value=longs))
+            else:
+                tag.value = longs
+
+    def intern(self, interner: ContentInterner) -> Self:
+        """
+            ID 数组及 Light 数组替换为共享实例
+        :param interner:
+        :return:
+        """
+        self.blocks = [interner.intern_buffer(_) for _ in self.blocks]
+        self.biomes = [interner.intern_buffer(_) for _ in self.biomes]
+        self.sky_light = {key: interner.intern_buffer(value) for key, value in self.sky_light.items()}
+        self.block_light = {key: interner.intern_buffer(value) for key, value in self.block_light.items()}
+        return self
+
+    @classmethod
+    def from_data(cls, chunk_x: int, chunk_z: int, data: ChunkData, light: LightData | None = None) -> Self:
+        """
+            ChunkData/LightData -> ChunkColumn
+        :param chunk_x:
+        :param chunk_z:
+        :param data:
+        :param light:
+        :return:
+        """
+        blocks, biomes, block_counts = [], [], []
+        for section in data.chunk_sections:
+            blocks.append(cls.compact_container(section.block_states))
+            biomes.append(cls.compact_container(section.biomes))
+            block_counts.append(section.block_count.value)
+
+        column = cls(
+            chunk_x, chunk_z, blocks, biomes, block_counts,
+            heightmaps=data.heightmaps, block_entities=data.block_entities
+        )
+
+        if light is not None:
+            column.sky_light = LightData.sections(
+                light.sky_light_mask, light.empty_sky_light_mask, light.sky_light_arrays
+            )
+            column.block_light = LightData.sections(
+                light.block_light_mask, light.empty_block_light_mask, light.block_light_arrays
+            )
+
+        return column
+
+    @classmethod
+    def from_packet(cls, packet: PacketsV769.PCLevelChunkWithLight) -> Self:
+        return cls.from_data(packet.chunk_x.value, packet.chunk_z.value, packet.data, packet.light)
+
+    @classmethod
+    def decode(cls, bytes_source: bytes | DataPacket, dimension_chunk_size: int = 24) -> Self:
+        """
+            直接由 PCLevelChunkWithLight payload 解码
+        :param bytes_source:
+        :param dimension_chunk_size:
+        :return:
+        """
+        # Heightmaps/BlockEntity 保持原始 bytes
+        return cls.from_packet(
+            PacketsV769.PCLevelChunkWithLight.decode(bytes_source, dimension_chunk_size, lazy=True)
+        )
@@ -0,0 +1,363 @@
+# -*- coding: utf-8 -*-
+"""
+    container
+    ~~~~~~~~~~~~~~~~~~
+    容器/背包状态
+    按窗口保存 Slot wire bytes 与 state_id，更新时按 bytes 比较，仅通知并解码实际变化的 Slot
+    由本地状态生成 PSContainerClick 变化列表
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+__all__ = [
+    'Window', 'ContainerManager', 'inventory_to_window_slot'
+]
+
+from io import BytesIO
+from typing import Any, Callable, ClassVar, Iterable
+
+from mymcp.data_types import Byte, Short, UnsignedByte, VarInt, DataPacket, Combined
+from mymcp.data_types.slot import Slot, SlotCache
+from mymcp.packets.v769 import PacketsV769
+
+
+EMPTY_SLOT = b'\x00'
+
+# 玩家背包窗口 ID
+PLAYER_WINDOW = 0
+
+# 玩家背包窗口 Slot 数量 (合成 5 + 盔甲 4 + 背包 27 + 快捷栏 9 + 副手 1)
+PLAYER_WINDOW_SIZE = 46
+
+# (window_id, 变化的 slot 下标)，window_id 为 None 时为光标物品变化
+ContainerListener = Callable[[int | None, list[int]], None]
+
+
+def inventory_to_window_slot(index: int) -> int:
+    """
+        PCSetPlayerInventory 背包下标 -> 玩家背包窗口下标
+        0-8 快捷栏 -> 36-44，9-35 不变，36-39 脚/腿/胸/头 -> 8-5，40 副手 -> 45
+    :param index:
+    :return:
+    """
+    if index < 9:
+        return index + 36
+    if index < 36:
+        return index
+    if index < 40:
+        return 44 - index
+    if index == 40:
+        return 45
+    raise ValueError(f"Unknown player inventory slot: {index}")
+
+
+def _slot_bytes(slot: Slot | bytes | None) -> bytes:
+    if slot is None:
+        return EMPTY_SLOT
+    if isinstance(slot, bytes):
+        return slot
+    return slot.bytes
+
+
+class Window:
+    """
+        单个窗口
+        raw 保存各 Slot wire bytes，items 为按需解码的 Slot
+    """
+
+    def __init__(self, window_id: int, window_type: int | None = None, title: Any = None, size: int = 0):
+        self.window_id = window_id
+        self.window_type = window_type
+        self.title = title
+        self.state_id = 0
+        self.raw: list[bytes] = [EMPTY_SLOT] * size
+        self._items: list[Slot | None] = [None] * size
+        self.properties: dict[int, int] = {}
+
+    def __repr__(self):
+        return f"<Window>({self.window_id} type={self.window_type} {len(self.raw)} Slots state_id={self.state_id})"
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def item(self, index: int) -> Slot:
+        """
+            获取 Slot，首次访问时解码
+        :param index:
+        :return:
+        """
+        item = self._items[index]
+        if item is None:
+            item = self._items[index] = Slot.decode(BytesIO(self.raw[index]))
+        return item
+
+    @property
+    def items(self) -> list[Slot]:
+        return [self.item(_) for _ in range(len(self.raw))]
+
+    def is_empty(self, index: int) -> bool:
+        return self.raw[index] == EMPTY_SLOT
+
+    def resize(self, size: int) -> None:
+        if size > len(self.raw):
+            self.raw.extend([EMPTY_SLOT] * (size - len(self.raw)))
+            self._items.extend([None] * (size - len(self._items)))
+        elif size < len(self.raw):
+            del self.raw[size:]
+            del self._items[size:]
+
+    def set(self, index: int, raw: bytes, item: Slot | None = None) -> bool:
+        """
+            设置 Slot
+        :param index:
+        :param raw: wire bytes
+        :param item: 已解码的 Slot，None 时按需解码
+        :return: 是否变化
+        """
+        if index >= len(self.raw):
+            self.resize(index + 1)
+        elif self.raw[index] == raw:
+            return False
+        self.raw[index] = raw
+        self._items[index] = item
+        return True
+
+    def diff(self, slots: dict[int, Slot | bytes | None]) -> dict[int, bytes]:
+        """
+            与当前状态比较
+        :param slots: {index: Slot}，None 为空
+        :return: 变化的 {index: wire bytes}
+        """
+        changes = {}
+        for index, slot in slots.items():
+            raw = _slot_bytes(slot)
+            if index >= len(self.raw) or self.raw[index] != raw:
+                changes[index] = raw
+        return changes
+
+
+class ContainerManager:
+    """
+        容器状态管理
+        PCContainerSetContent 可直接传入 payload，按 buffer 扫描各 Slot 长度，仅解码变化的 Slot
+    """
+
+    APPLIERS: ClassVar[dict[type, str]] = {
+        PacketsV769.PCOpenScreen: 'apply_open_screen',
+        PacketsV769.PCContainerClose: 'apply_container_close',
+        PacketsV769.PSContainerClose: 'apply_container_close',
+        PacketsV769.PCContainerSetContent: 'apply_set_content',
+        PacketsV769.PCContainerSetSlot: 'apply_set_slot',
+        PacketsV769.PCContainerSetData: 'apply_set_data',
+        PacketsV769.PCSetCursorItem: 'apply_set_cursor_item',
+        PacketsV769.PCSetPlayerInventory: 'apply_set_player_inventory',
+    }
+
+    def __init__(self):
+        self.windows: dict[int, Window] = {PLAYER_WINDOW: Window(PLAYER_WINDOW, size=PLAYER_WINDOW_SIZE)}
+        self.cursor_raw = EMPTY_SLOT
+        self._cursor: Slot | None = None
+        self.listeners: list[ContainerListener] = []
+
+    def __repr__(self):
+        return f"<ContainerManager>({len(self.windows)} Windows)"
+
+    def window(self, window_id: int) -> Window:
+        """
+            获取或创建窗口
+        :param window_id:
+        :return:
+        """
+        window = self.windows.get(window_id)
+        if window is None:
+            window = self.windows[window_id] = Window(window_id)
+        return window
+
+    @property
+    def player(self) -> Window:
+        return self.windows[PLAYER_WINDOW]
+
+    @property
+    def cursor(self) -> Slot:
+        if self._cursor is None:
+            self._cursor = Slot.decode(BytesIO(self.cursor_raw))
+        return self._cursor
+
+    def _notify(self, window_id: int | None, indexes: list[int]) -> None:
+        for listener in self.listeners:
+            listener(window_id, indexes)
+
+    def clear(self) -> None:
+        self.windows = {PLAYER_WINDOW: Window(PLAYER_WINDOW, size=PLAYER_WINDOW_SIZE)}
+        self.cursor_raw = EMPTY_SLOT
+        self._cursor = None
+
+    def set_cursor(self, raw: bytes, item: Slot | None = None) -> bool:
+        """
+            设置光标物品
+        :param raw:
+        :param item:
+        :return: 是否变化
+        """
+        if raw == self.cursor_raw:
+            return False
+        self.cursor_raw = raw
+        self._cursor = item
+        self._notify(None, [])
+        return True
+
+    def apply(self, packet: Any) -> Any:
+        """
+            按包类型应用，不支持的包返回 None
+        :param packet:
+        :return:
+        """
+        method_name = self.APPLIERS.get(packet.__class__)
+        if method_name is None:
+            return None
+        return getattr(self, method_name)(packet)
+
+    def apply_open_screen(self, packet: PacketsV769.PCOpenScreen) -> Window:
+        """
+            打开窗口，同 ID 重发时仅更新类型与标题
+        :param packet:
+        :return:
+        """
+        window = self.window(packet.window_id.value)
+        window.window_type = packet.window_type.value
+        window.title = packet.window_title
+        return window
+
+    def apply_container_close(
+            self, packet: PacketsV769.PCContainerClose | PacketsV769.PSContainerClose
+    ) -> Window | None:
+        """
+            关闭窗口，玩家背包保留
+        :param packet:
+        :return:
+        """
+        window_id = packet.window_id.value
+        if window_id == PLAYER_WINDOW:
+            return None
+        return self.windows.pop(window_id, None)
+
+    def _merge(self, window: Window, slots: Iterable[tuple[bytes, Slot | None]], size: int) -> list[int]:
+        window.resize(size)
+        changed = [index for index, (raw, item) in enumerate(slots) if window.set(index, raw, item)]
+        if changed:
+            self._notify(window.window_id, changed)
+        return changed
+
+    def apply_set_content(self, packet: PacketsV769.PCContainerSetContent | DataPacket | bytes) -> list[int]:
+        """
+            替换窗口全部内容
+        :param packet: 已解码包或 payload
+        :return: 变化的 slot 下标
+        """
+        if isinstance(packet, PacketsV769.PCContainerSetContent):
+            window = self.window(packet.window_id.value)
+            window.state_id = packet.state_id.value
+            changed = self._merge(
+                window, [(_.bytes, _) for _ in packet.slot_data], len(packet.slot_data)
+            )
+            self.set_cursor(packet.carried_item.bytes, packet.carried_item)
+            return changed
+
+        bytes_io = Combined.to_bytes_io(packet)
+        window = self.window(UnsignedByte.decode(bytes_io).value)
+        window.state_id = VarInt.decode(bytes_io).value
+        count = VarInt.decode(bytes_io).value
+
+        slots = []
+        with bytes_io.getbuffer() as buffer:
+            position = bytes_io.tell()
+            for _ in range(count + 1):
+                end = SlotCache.slot_end(bytes_io, buffer, position)
+                slots.append((bytes(buffer[position:end]), None))
+                position = end
+
+        changed = self._merge(window, slots[:count], count)
+        self.set_cursor(slots[count][0])
+        return changed
+
+    def apply_set_slot(self, packet: PacketsV769.PCContainerSetSlot) -> list[int]:
+        """
+            设置单个 Slot，window_id 为 -1 时为光标物品
+        :param packet:
+        :return: 变化的 slot 下标
+        """
+        window_id = packet.window_id.value
+        if window_id == -1:
+            self.set_cursor(packet.slot_data.bytes, packet.slot_data)
+            return []
+
+        window = self.window(window_id)
+        window.state_id = packet.state_id.value
+        index = packet.slot.value
+        if not window.set(index, packet.slot_data.bytes, packet.slot_data):
+            return []
+        self._notify(window_id, [index])
+        return [index]
+
+    def apply_set_player_inventory(self, packet: PacketsV769.PCSetPlayerInventory) -> list[int]:
+        """
+            设置玩家背包 Slot，不改变 state_id
+        :param packet:
+        :return: 变化的玩家背包窗口下标
+        """
+        index = inventory_to_window_slot(packet.slot.value)
+        if not self.player.set(index, packet.slot_data.bytes, packet.slot_data):
+            return []
+        self._notify(PLAYER_WINDOW, [index])
+        return [index]
+
+    def apply_set_cursor_item(self, packet: PacketsV769.PCSetCursorItem) -> bool:
+        return self.set_cursor(packet.carried_item.bytes, packet.carried_item)
+
+    def apply_set_data(self, packet: PacketsV769.PCContainerSetData) -> None:
+        self.window(packet.window_id.value).properties[packet.property.value] = packet.value.value
+
+    def click(
+            self, window_id: int, slot: int, button: int, mode: int,
+            slots: dict[int, Slot | None], carried_item: Slot | None = None, predict: bool = True
+    ) -> PacketsV769.PSContainerClick:
+        """
+            生成 PSContainerClick，changed_slots 仅包含与本地状态不同的 Slot
+        :param window_id:
+        :param slot: 点击的 slot，-999 为窗口外
+        :param button:
+        :param mode:
+        :param slots: 点击后预期的 {index: Slot}，None 为空
+        :param carried_item: 点击后预期的光标物品，None 为空
+        :param predict: 将预期状态写入本地
+        :return:
+        """
+        window = self.window(window_id)
+        changes = window.diff(slots)
+        carried_item = carried_item if carried_item is not None else Slot(VarInt(0))
+
+        packet = PacketsV769.PSContainerClick(
+            window_id=VarInt(window_id), state_id=VarInt(window.state_id),
+            slot=Short(slot), button=Byte(button), mode=VarInt(mode),
+            changed_slots=[
+                PacketsV769.PSContainerClick.ChangedSlot(
+                    Short(index), slots[index] if isinstance(slots[index], Slot) else Slot.decode(BytesIO(raw))
+                )
+                for index, raw in sorted(changes.items())
+            ],
+            carried_item=carried_item
+        )
+
+        if predict:
+            changed = [
+                index for index, raw in sorted(changes.items())
+                if window.set(index, raw, slots[index] if isinstance(slots[index], Slot) else None)
+            ]
+            if changed:
+                self._notify(window_id, changed)
+            self.set_cursor(carried_item.bytes, carried_item)
+        return packet
@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""
+    diff
+    ~~~~~~~~~~~~~~~~~~
+    最小方块差异编码
+    比较 Section 数组或变更记录，单方块 Section 生成 PCBlockUpdate，其余生成 PCSectionBlocksUpdate
+    差异帧大于整个 Chunk 帧时改为重发 Chunk
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建
+                                修正 builder 未 attach 时回退重发缓存的旧 Chunk 帧
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+__all__ = [
+    'diff_section', 'pack_entries', 'pack_varlongs',
+    'BlockChangeLog', 'BlockDiffEncoder'
+]
+
+import copy
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from mymcp.data_types import VarInt, VarLong, Position, DataPacket
+from mymcp.packets import Codec
+from mymcp.packets.v769 import PacketsV769
+from mymcp.world.builder import ChunkPacketBuilder
+from mymcp.world.column import ChunkColumn
+from mymcp.world.store import ChunkKey
+
+
+SECTION_BLOCKS = 4096
+
+# Section 下标 -> (indexes, states)，index 为 y << 8 | z << 4 | x
+SectionChanges = dict[int, tuple[Any, Any]]
+
+
+def diff_section(old: Any, new: Any) -> tuple[Any, Any]:
+    """
+        两个 Section 的差异
+    :param old: int (单值) 或 ID 数组
+    :param new: int (单值) 或 ID 数组
+    :return: (indexes, states)
+    """
+    if old is new:
+        return [], []
+
+    if isinstance(old, int) and isinstance(new, int):
+        return ([], []) if old == new else (list(range(SECTION_BLOCKS)), [new] * SECTION_BLOCKS)
+
+    if np is not None:
+        old_array = (
+            np.full(SECTION_BLOCKS, old, dtype=np.uint16) if isinstance(old, int)
+            else np.asarray(old, dtype=np.uint16)
+        )
+        new_array = (
+            np.full(SECTION_BLOCKS, new, dtype=np.uint16) if isinstance(new, int)
+            else np.asarray(new, dtype=np.uint16)
+        )
+        indexes = np.flatnonzero(old_array != new_array)
+        return indexes, new_array[indexes]
+
+    if isinstance(old, int):
+        indexes = [index for index, state in enumerate(new) if state != old]
+    elif isinstance(new, int):
+        indexes = [index for index, state in enumerate(old) if state != new]
+    else:
+        indexes = [index for index, (before, after) in enumerate(zip(old, new)) if before != after]
+    return indexes, [new] * len(indexes) if isinstance(new, int) else [new[index] for index in indexes]
+
+
+def pack_entries(indexes: Any, states: Any) -> Any:
+    """
+        (index, state) -> PCSectionBlocksUpdate 方块项 block_state_id << 12 | (x << 8 | z << 4 | y)
+    :param indexes: y << 8 | z << 4 | x
+    :param states:
+    :return:
+    """
+    if np is not None and isinstance(indexes, np.ndarray):
+        indexes = indexes.astype(np.int64)
+        return (
+            (np.asarray(states, dtype=np.int64) << 12) |
+            ((indexes & 0xF) << 8) | (indexes & 0xF0) | (indexes >> 8)
+        )
+    return [
+        (state << 12) | ((index & 0xF) << 8) | (index & 0xF0) | (index >> 8)
+        for index, state in zip(indexes, states)
+    ]
+
+
+def pack_varlongs(entries: Any) -> bytes:
+    """
+        批量编码为连续 VarLong，ndarray 向量化
+    :param entries: 非负整数
+    :return:
+    """
+    if np is None or not isinstance(entries, np.ndarray):
+        return VarLong.pack_many(entries)
+    if not len(entries):
+        return b''
+
+    values = entries.astype(np.uint64)
+    width = max(1, (int(values.max()).bit_length() + 6) // 7)
+
+    sizes = np.ones(len(values), dtype=np.int64)
+    for group in range(1, width):
+        sizes += values >= (1 << (7 * group))
+
+    positions = np.arange(width)
+    groups = (values[:, None] >> (positions.astype(np.uint64) * np.uint64(7))) & np.uint64(0x7F)
+    groups |= (positions < (sizes - 1)[:, None]).astype(np.uint64) << np.uint64(7)
+    return groups[positions < sizes[:, None]].astype(np.uint8).tobytes()
+
+
+class BlockChangeLog:
+    """
+        方块变更记录，按 Chunk/Section 分组，同一位置保留最后一次
+    """
+
+    def __init__(self, min_y: int = -64):
+        self.min_y = min_y
+        self.changes: dict[ChunkKey, dict[int, dict[int, int]]] = {}
+
+    def __repr__(self):
+        return f"<BlockChangeLog>({len(self.changes)} Chunks {len(self)} Blocks)"
+
+    def __len__(self) -> int:
+        return sum(len(_) for sections in self.changes.values() for _ in sections.values())
+
+    def keys(self) -> list[ChunkKey]:
+        return list(self.changes)
+
+    def record(self, x: int, y: int, z: int, state: int) -> None:
+        """
+            记录方块变更
+        :param x:
+        :param y:
+        :param z:
+        :param state:
+        :return:
+        """
+        relative_y = y - self.min_y
+        self.changes.setdefault((x >> 4, z >> 4), {}).setdefault(relative_y >> 4, {})[
+            ((relative_y & 15) << 8) | ((z & 15) << 4) | (x & 15)
+        ] = state
+
+    def sections(self, chunk_x: int, chunk_z: int) -> SectionChanges:
+        """
+            Chunk 变更
+        :param chunk_x:
+        :param chunk_z:
+        :return: {section_index: (indexes, states)}
+        """
+        return {
+            section_index: (list(blocks), list(blocks.values()))
+            for section_index, blocks in self.changes.get((chunk_x, chunk_z), {}).items()
+        }
+
+    def pop(self, chunk_x: int, chunk_z: int) -> SectionChanges:
+        """
+            取出并清除 Chunk 变更
+        :param chunk_x:
+        :param chunk_z:
+        :return:
+        """
+        sections = self.sections(chunk_x, chunk_z)
+        self.changes.pop((chunk_x, chunk_z), None)
+        return sections
+
+    def clear(self) -> None:
+        self.changes.clear()
+
+
+class BlockDiffEncoder:
+    """
+        方块差异编码器
+        frames 在差异帧总长超过 full_chunk_floor 时与 Chunk 帧比较，取较小者
+    """
+
+    BLOCK_UPDATE = PacketsV769.PCBlockUpdate
+    SECTION_BLOCKS_UPDATE = PacketsV769.PCSectionBlocksUpdate
+
+    def __init__(
+            self, min_y: int = -64, compression_threshold: int = 256,
+            builder: ChunkPacketBuilder | None = None, full_chunk_floor: int = 2048
+    ):
+        """
+        :param min_y: 世界最低 Y
+        :param compression_threshold: 压缩阈值，-1 为不压缩
+        :param builder: Chunk 帧构建器，用于回退重发
+        :param full_chunk_floor: 差异帧总长不超过该值时不考虑重发 Chunk
+        """
+        self.min_y = min_y
+        self.compression_threshold = compression_threshold
+        self.builder = builder if builder is not None else ChunkPacketBuilder(compression_threshold)
+        self.full_chunk_floor = full_chunk_floor
+        self.fallbacks = 0
+
+    def __repr__(self):
+        return f"<BlockDiffEncoder>(fallbacks={self.fallbacks})"
+
+    @staticmethod
+    def snapshot(column: ChunkColumn) -> list[Any]:
+        """
+            复制方块 Section，作为修改前状态
+        :param column:
+        :return:
+        """
+        return [_ if isinstance(_, int) else copy.copy(_) for _ in column.blocks]
+
+    @staticmethod
+    def diff_column(old_blocks: list[Any], new_blocks: list[Any]) -> SectionChanges:
+        """
+            Chunk 方块差异
+        :param old_blocks:
+        :param new_blocks:
+        :return: {section_index: (indexes, states)}
+        """
+        changes = {}
+        for section_index, (old, new) in enumerate(zip(old_blocks, new_blocks)):
+            indexes, states = diff_section(old, new)
+            if len(indexes):
+                changes[section_index] = (indexes, states)
+        return changes
+
+    def section_packet(
+            self, chunk_x: int, chunk_z: int, section_index: int, indexes: Any, states: Any
+    ) -> DataPacket:
+        """
+            单个 Section 变更 -> DataPacket
+        :param chunk_x:
+        :param chunk_z:
+        :param section_index:
+        :param indexes:
+        :param states:
+        :return:
+        """
+        if len(indexes) == 1:
+            index, state = int(indexes[0]), int(states[0])
+            data = Position.encode((
+                (chunk_x << 4) | (index & 15),
+                self.min_y + (section_index << 4) + (index >> 8),
+                (chunk_z << 4) | ((index >> 4) & 15)
+            )) + VarInt.encode(state)
+            packet = self.BLOCK_UPDATE
+        else:
+            data = self.SECTION_BLOCKS_UPDATE.pack_encoded(
+                (chunk_x, section_index + (self.min_y >> 4), chunk_z),
+                len(indexes), pack_varlongs(pack_entries(indexes, states))
+            )
+            packet = self.SECTION_BLOCKS_UPDATE
+        return DataPacket(len(data), packet.BOUND_TO, packet.PACKET_ID_HEX, data)
+
+    def packets(self, chunk_x: int, chunk_z: int, changes: SectionChanges) -> list[DataPacket]:
+        """
+            Chunk 变更 -> DataPackets，每个 Section 一个
+        :param chunk_x:
+        :param chunk_z:
+        :param changes:
+        :return:
+        """
+        return [
+            self.section_packet(chunk_x, chunk_z, section_index, indexes, states)
+            for section_index, (indexes, states) in sorted(changes.items()) if len(indexes)
+        ]
+
+    def frames(
+            self, chunk_x: int, chunk_z: int, changes: SectionChanges,
+            column: ChunkColumn | None = None, version: int | None = None
+    ) -> list[bytes]:
+        """
+            Chunk 变更 -> 完整帧，可直接写入连接
+        :param chunk_x:
+        :param chunk_z:
+        :param changes:
+        :param column: 变更后的 ChunkColumn，提供时差异较大则改为重发 Chunk
+        :param version: Chunk 内容版本，见 ChunkPacketBuilder.frame
+                        未指定且 builder 未 attach 时不使用帧缓存
+        :return:
+        """
+        frames = [
+            Codec.encode_by_threshold(self.compression_threshold, data_packet)
+            for data_packet in self.packets(chunk_x, chunk_z, changes)
+        ]
+
+        if column is not None:
+            size = sum(len(_) for _ in frames)
+            if size > self.full_chunk_floor:
+                # 未指定版本且 builder 未 attach 时版本不会变化，缓存帧可能为修改前内容
+                if version is None and self.builder.store is None:
+                    frame = self.builder.encode(column)
+                else:
+                    frame = self.builder.frame(column, version)
+                if len(frame) < size:
+                    self.fallbacks += 1
+                    return [frame]
+        return frames
+
+    def diff_frames(self, old_blocks: list[Any], column: ChunkColumn, version: int | None = None) -> list[bytes]:
+        """
+            比较修改前 Section (见 snapshot) 与当前 ChunkColumn
+        :param old_blocks:
+        :param column:
+        :param version:
+        :return:
+        """
+        return self.frames(
+            column.chunk_x, column.chunk_z, self.diff_column(old_blocks, column.blocks), column, version
+        )
@@ -0,0 +1,497 @@
+# -*- coding: utf-8 -*-
+"""
+    entities
+    ~~~~~~~~~~~~~~~~~~
+    实体位置追踪
+    位置/速度/朝向按列连续存储，实体 ID 经 slot map 映射到下标
+    相对移动包先入队，每 Tick flush 一次批量应用
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+__all__ = [
+    'EntityTracker'
+]
+
+from array import array
+import struct
+from typing import Any, Callable, ClassVar, Iterable, Iterator
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from mymcp.data_types import VarInt, DataPacket
+from mymcp.packets.v769 import PacketsV769
+
+
+# 相对移动: 12 位小数定点数
+DELTA_SCALE = 4096.0
+# Short 速度: 1/8000 方块每 Tick
+VELOCITY_SCALE = 8000.0
+# Angle: 1/256 圈
+ANGLE_SCALE = 360.0 / 256.0
+
+MOVE_POS = struct.Struct('>hhh?')
+MOVE_POS_ROT = struct.Struct('>hhhbb?')
+MOVE_ROT = struct.Struct('>bb?')
+ROTATE_HEAD = struct.Struct('>b')
+MOTION = struct.Struct('>hhh')
+
+# (slots, removed) 位置变化或移除的 slot，清空时 slots 为 None
+EntityListener = Callable[[Iterable[int] | None, bool], None]
+
+
+class EntityTracker:
+    """
+        实体追踪器
+        positions/velocities/rotations 为按 slot 平铺的 3 列数组 (slot * 3 + 轴)
+        rotations 为 (yaw, pitch, head_yaw) 角度，velocities 单位为方块每 Tick
+        PCMoveEntity*/PCRotateHead/PCSetEntityMotion 入队，flush 时向量化应用
+        其余包应用前先 flush，保证与入队移动的先后顺序
+        listeners 在实体添加/移除及位置变化后调用，用于维护外部索引
+    """
+
+    APPLIERS: ClassVar[dict[type, str]] = {
+        PacketsV769.PCAddEntity: 'apply_add_entity',
+        PacketsV769.PCRemoveEntities: 'apply_remove_entities',
+        PacketsV769.PCTeleportEntity: 'apply_teleport_entity',
+        PacketsV769.PCEntityPositionSync: 'apply_entity_position_sync',
+        PacketsV769.PCMoveEntityPos: 'queue_move_entity_pos',
+        PacketsV769.PCMoveEntityPosRot: 'queue_move_entity_pos_rot',
+        PacketsV769.PCMoveEntityRot: 'queue_move_entity_rot',
+        PacketsV769.PCRotateHead: 'queue_rotate_head',
+        PacketsV769.PCSetEntityMotion: 'queue_set_entity_motion',
+    }
+
+    # DataPacket 按 pid 分发
+    PID_APPLIERS: ClassVar[dict[int, type]] = {
+        packet.PACKET_ID_HEX: packet for packet in APPLIERS
+    }
+
+    # 直接解析 payload 入队，不创建包对象
+    RAW_APPLIERS: ClassVar[dict[type, str]] = {
+        PacketsV769.PCMoveEntityPos: 'feed_move_entity_pos',
+        PacketsV769.PCMoveEntityPosRot: 'feed_move_entity_pos_rot',
+        PacketsV769.PCMoveEntityRot: 'feed_move_entity_rot',
+        PacketsV769.PCRotateHead: 'feed_rotate_head',
+        PacketsV769.PCSetEntityMotion: 'feed_set_entity_motion',
+    }
+
+    def __init__(self, capacity: int = 256):
+        """
+        :param capacity: 初始容量，不足时翻倍
+        """
+        self.capacity = 0
+        self.slots: dict[int, int] = {}
+        self.free: list[int] = []
+
+        self.entity_ids = self._new('q', 0)
+        self.types = self._new('i', 0)
+        self.positions = self._new('d', 0)
+        self.velocities = self._new('d', 0)
+        self.rotations = self._new('f', 0)
+        self.on_ground = self._new('B', 0)
+        self._grow(capacity)
+
+        self._moves: tuple[list[int], list[int]] = ([], [])
+        self._turns: tuple[list[int], list[int]] = ([], [])
+        self._heads: tuple[list[int], list[int]] = ([], [])
+        self._motions: tuple[list[int], list[int]] = ([], [])
+        self._grounds: tuple[list[int], list[int]] = ([], [])
+
+        self.listeners: list[EntityListener] = []
+
+    def __repr__(self):
+        return f"<EntityTracker>({len(self.slots)} Entities {self.pending} Pending)"
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def __contains__(self, entity_id: int) -> bool:
+        return entity_id in self.slots
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.slots)
+
+    @staticmethod
+    def _new(typecode: str, size: int) -> Any:
+        if np is not None:
+            return np.zeros(size, dtype=np.dtype(typecode))
+        return array(typecode, bytes(size * array(typecode).itemsize))
+
+    def _grow(self, capacity: int) -> None:
+        """
+            扩容，新 slot 加入空闲列表
+        :param capacity:
+        :return:
+        """
+        extra = capacity - self.capacity
+        if extra <= 0:
+            return
+
+        for name, width in (
+                ('entity_ids', 1), ('types', 1), ('positions', 3), ('velocities', 3), ('rotations', 3),
+                ('on_ground', 1)
+        ):
+            column = getattr(self, name)
+            addition = self._new(column.typecode if np is None else column.dtype.char, extra * width)
+            setattr(self, name, np.concatenate((column, addition)) if np is not None else column + addition)
+
+        # 倒序加入，pop 时优先使用低位 slot
+        self.free.extend(range(capacity - 1, self.capacity - 1, -1))
+        self.capacity = capacity
+
+    def _notify(self, slots: Iterable[int] | None, removed: bool = False) -> None:
+        for listener in self.listeners:
+            listener(slots, removed)
+
+    @property
+    def pending(self) -> int:
+        return sum(len(_[0]) for _ in (self._moves, self._turns, self._heads, self._motions, self._grounds))
+
+    def slot(self, entity_id: int) -> int | None:
+        return self.slots.get(entity_id)
+
+    def active_slots(self) -> Any:
+        """
+            已使用 slot
+        :return: ndarray 或 list
+        """
+        slots = list(self.slots.values())
+        return np.asarray(slots, dtype=np.int64) if np is not None else slots
+
+    def add(
+            self, entity_id: int, entity_type: int, x: float, y: float, z: float,
+            yaw: float = 0.0, pitch: float = 0.0, head_yaw: float = 0.0,
+            velocity: tuple[float, float, float] = (0.0, 0.0, 0.0)
+    ) -> int:
+        """
+            添加实体，ID 已存在时覆盖
+        :param entity_id:
+        :param entity_type: minecraft:entity_type 注册表 ID
+        :param x:
+        :param y:
+        :param z:
+        :param yaw: 角度
+        :param pitch:
+        :param head_yaw:
+        :param velocity: 方块每 Tick
+        :return: slot
+        """
+        slot = self.slots.get(entity_id)
+        if slot is None:
+            if not self.free:
+                self._grow(max(self.capacity * 2, 16))
+            slot = self.slots[entity_id] = self.free.pop()
+
+        self.entity_ids[slot] = entity_id
+        self.types[slot] = entity_type
+        self.positions[slot * 3: slot * 3 + 3] = self._row('d', (x, y, z))
+        self.velocities[slot * 3: slot * 3 + 3] = self._row('d', velocity)
+        self.rotations[slot * 3: slot * 3 + 3] = self._row('f', (yaw, pitch, head_yaw))
+        self.on_ground[slot] = 0
+        if self.listeners:
+            self._notify((slot,))
+        return slot
+
+    @staticmethod
+    def _row(typecode: str, values: Any) -> Any:
+        return values if np is not None else array(typecode, values)
+
+    def remove(self, entity_id: int) -> bool:
+        slot = self.slots.pop(entity_id, None)
+        if slot is None:
+            return False
+        self.entity_ids[slot] = 0
+        self.free.append(slot)
+        if self.listeners:
+            self._notify((slot,), True)
+        return True
+
+    def clear(self) -> None:
+        self.slots.clear()
+        self.free = list(range(self.capacity - 1, -1, -1))
+        for queue in (self._moves, self._turns, self._heads, self._motions, self._grounds):
+            queue[0].clear()
+            queue[1].clear()
+        if self.listeners:
+            self._notify(None, True)
+
+    def position(self, entity_id: int) -> tuple[float, float, float] | None:
+        slot = self.slots.get(entity_id)
+        if slot is None:
+            return None
+        return tuple(float(_) for _ in self.positions[slot * 3: slot * 3 + 3])
+
+    def velocity(self, entity_id: int) -> tuple[float, float, float] | None:
+        slot = self.slots.get(entity_id)
+        if slot is None:
+            return None
+        return tuple(float(_) for _ in self.velocities[slot * 3: slot * 3 + 3])
+
+    def rotation(self, entity_id: int) -> tuple[float, float, float] | None:
+        """
+            朝向
+        :param entity_id:
+        :return: (yaw, pitch, head_yaw) 角度
+        """
+        slot = self.slots.get(entity_id)
+        if slot is None:
+            return None
+        return tuple(float(_) for _ in self.rotations[slot * 3: slot * 3 + 3])
+
+    def entity_type(self, entity_id: int) -> int | None:
+        slot = self.slots.get(entity_id)
+        return None if slot is None else int(self.types[slot])
+
+    def is_on_ground(self, entity_id: int) -> bool | None:
+        slot = self.slots.get(entity_id)
+        return None if slot is None else bool(self.on_ground[slot])
+
+    def apply(self, packet: Any) -> Any:
+        """
+            按包类型应用，DataPacket 按 pid 直接解析 payload
+        :param packet:
+        :return: 不支持的包返回 None
+        """
+        if isinstance(packet, DataPacket):
+            packet_cls = self.PID_APPLIERS.get(packet.pid)
+            if packet_cls is None:
+                return None
+            if packet_cls in self.RAW_APPLIERS:
+                return getattr(self, self.RAW_APPLIERS[packet_cls])(packet.data)
+            packet = packet_cls.decode(packet)
+
+        method_name = self.APPLIERS.get(packet.__class__)
+        if method_name is None:
+            return None
+        return getattr(self, method_name)(packet)
+
+    def _queue(self, queue: tuple[list[int], list[int]], entity_id: int, *values: int) -> None:
+        queue[0].append(entity_id)
+        queue[1].extend(values)
+
+    def queue_move_entity_pos(self, packet: PacketsV769.PCMoveEntityPos) -> None:
+        entity_id = packet.entity_id.value
+        self._queue(self._moves, entity_id, packet.delta_x.value, packet.delta_y.value, packet.delta_z.value)
+        self._queue(self._grounds, entity_id, packet.on_ground.value)
+
+    def queue_move_entity_pos_rot(self, packet: PacketsV769.PCMoveEntityPosRot) -> None:
+        entity_id = packet.entity_id.value
+        self._queue(self._moves, entity_id, packet.delta_x.value, packet.delta_y.value, packet.delta_z.value)
+        self._queue(self._turns, entity_id, packet.yaw.value, packet.pitch.value)
+        self._queue(self._grounds, entity_id, packet.on_ground.value)
+
+    def queue_move_entity_rot(self, packet: PacketsV769.PCMoveEntityRot) -> None:
+        entity_id = packet.entity_id.value
+        self._queue(self._turns, entity_id, packet.yaw.value, packet.pitch.value)
+        self._queue(self._grounds, entity_id, packet.on_ground.value)
+
+    def queue_rotate_head(self, packet: PacketsV769.PCRotateHead) -> None:
+        self._queue(self._heads, packet.entity_id.value, packet.head_yaw.value)
+
+    def queue_set_entity_motion(self, packet: PacketsV769.PCSetEntityMotion) -> None:
+        self._queue(
+            self._motions, packet.entity_id.value,
+            packet.velocity_x.value, packet.velocity_y.value, packet.velocity_z.value
+        )
+
+    def feed_move_entity_pos(self, data: bytes) -> None:
+        (entity_id,), offset = VarInt.unpack_many(data, 1)
+        delta_x, delta_y, delta_z, on_ground = MOVE_POS.unpack_from(data, offset)
+        self._queue(self._moves, entity_id, delta_x, delta_y, delta_z)
+        self._queue(self._grounds, entity_id, on_ground)
+
+    def feed_move_entity_pos_rot(self, data: bytes) -> None:
+        (entity_id,), offset = VarInt.unpack_many(data, 1)
+        delta_x, delta_y, delta_z, yaw, pitch, on_ground = MOVE_POS_ROT.unpack_from(data, offset)
+        self._queue(self._moves, entity_id, delta_x, delta_y, delta_z)
+        self._queue(self._turns, entity_id, yaw, pitch)
+        self._queue(self._grounds, entity_id, on_ground)
+
+    def feed_move_entity_rot(self, data: bytes) -> None:
+        (entity_id,), offset = VarInt.unpack_many(data, 1)
+        yaw, pitch, on_ground = MOVE_ROT.unpack_from(data, offset)
+        self._queue(self._turns, entity_id, yaw, pitch)
+        self._queue(self._grounds, entity_id, on_ground)
+
+    def feed_rotate_head(self, data: bytes) -> None:
+        (entity_id,), offset = VarInt.unpack_many(data, 1)
+        self._queue(self._heads, entity_id, *ROTATE_HEAD.unpack_from(data, offset))
+
+    def feed_set_entity_motion(self, data: bytes) -> None:
+        (entity_id,), offset = VarInt.unpack_many(data, 1)
+        self._queue(self._motions, entity_id, *MOTION.unpack_from(data, offset))
+
+    def _resolve(self, queue: tuple[list[int], list[int]], width: int) -> tuple[Any, Any]:
+        """
+            实体 ID -> slot，丢弃未知实体，清空队列
+        :param queue:
+        :param width: 每项数值个数
+        :return: (slots, values)，values 为 (n, width)
+        """
+        entity_ids, values = queue
+        get = self.slots.get
+        slots = [get(_, -1) for _ in entity_ids]
+        if np is not None:
+            slots = np.asarray(slots, dtype=np.int64)
+            values = np.asarray(values, dtype=np.float64).reshape(-1, width)
+            known = slots >= 0
+            if not known.all():
+                slots, values = slots[known], values[known]
+        else:
+            rows = [
+                (slot, values[index * width: index * width + width])
+                for index, slot in enumerate(slots) if slot >= 0
+            ]
+            slots, values = [_[0] for _ in rows], [_[1] for _ in rows]
+        entity_ids.clear()
+        queue[1].clear()
+        return slots, values
+
+    @staticmethod
+    def _last(slots: Any, values: Any) -> tuple[Any, Any]:
+        """
+            同一 slot 多次设置时保留最后一次
+        """
+        slots, last = np.unique(slots[::-1], return_index=True)
+        return slots, values[::-1][last]
+
+    def _set_columns(self, target: Any, slots: Any, values: Any, columns: tuple[int, ...]) -> None:
+        if np is not None:
+            if not len(slots):
+                return
+            slots, values = self._last(slots, values)
+            view = target.reshape(-1, 3)
+            for index, column in enumerate(columns):
+                view[slots, column] = values[:, index]
+        else:
+            for slot, row in zip(slots, values):
+                for index, column in enumerate(columns):
+                    target[slot * 3 + column] = row[index]
+
+    def flush(self) -> int:
+        """
+            批量应用入队的移动/朝向/速度
+        :return: 应用的相对移动数量
+        """
+        slots, deltas = self._resolve(self._moves, 3)
+        moved = len(slots)
+        if moved:
+            if np is not None:
+                np.add.at(self.positions.reshape(-1, 3), slots, deltas / DELTA_SCALE)
+            else:
+                positions = self.positions
+                for slot, (delta_x, delta_y, delta_z) in zip(slots, deltas):
+                    positions[slot * 3] += delta_x / DELTA_SCALE
+                    positions[slot * 3 + 1] += delta_y / DELTA_SCALE
+                    positions[slot * 3 + 2] += delta_z / DELTA_SCALE
+            if self.listeners:
+                self._notify(slots)
+
+        slots, values = self._resolve(self._turns, 2)
+        self._set_columns(self.rotations, slots, self._angles(values), (0, 1))
+
+        slots, values = self._resolve(self._heads, 1)
+        self._set_columns(self.rotations, slots, self._angles(values), (2,))
+
+        slots, values = self._resolve(self._motions, 3)
+        self._set_columns(
+            self.velocities, slots,
+            values / VELOCITY_SCALE if np is not None else [[_ / VELOCITY_SCALE for _ in row] for row in values],
+            (0, 1, 2)
+        )
+
+        slots, values = self._resolve(self._grounds, 1)
+        if np is not None:
+            if len(slots):
+                slots, values = self._last(slots, values)
+                self.on_ground[slots] = values[:, 0]
+        else:
+            for slot, (on_ground,) in zip(slots, values):
+                self.on_ground[slot] = on_ground
+
+        return moved
+
+    @staticmethod
+    def _angles(values: Any) -> Any:
+        """
+            Angle (有符号字节) -> 角度
+        """
+        if np is not None:
+            return values * ANGLE_SCALE
+        return [[_ * ANGLE_SCALE for _ in row] for row in values]
+
+    def apply_add_entity(self, packet: PacketsV769.PCAddEntity) -> int:
+        self.flush()
+        return self.add(
+            packet.entity_id.value, packet._type.value,
+            packet.x.value, packet.y.value, packet.z.value,
+            packet.yaw.value * ANGLE_SCALE, packet.pitch.value * ANGLE_SCALE, packet.head_yaw.value * ANGLE_SCALE,
+            (
+                packet.velocity_x.value / VELOCITY_SCALE,
+                packet.velocity_y.value / VELOCITY_SCALE,
+                packet.velocity_z.value / VELOCITY_SCALE
+            )
+        )
+
+    def apply_remove_entities(self, packet: PacketsV769.PCRemoveEntities) -> int:
+        """
+        :param packet:
+        :return: 移除数量
+        """
+        self.flush()
+        return sum(self.remove(_.value) for _ in packet.entity_ids)
+
+    def _set_absolute(
+            self, entity_id: int, position: tuple[float, float, float], velocity: tuple[float, float, float],
+            yaw: float, pitch: float, on_ground: bool, flags: int = 0
+    ) -> bool:
+        """
+            设置绝对位置，flags 为 TeleportFlags 相对位
+        """
+        slot = self.slots.get(entity_id)
+        if slot is None:
+            return False
+
+        base = slot * 3
+        for axis in range(3):
+            if flags & (1 << axis):
+                self.positions[base + axis] += position[axis]
+            else:
+                self.positions[base + axis] = position[axis]
+            if flags & (0x20 << axis):
+                self.velocities[base + axis] += velocity[axis]
+            else:
+                self.velocities[base + axis] = velocity[axis]
+
+        self.rotations[base] = self.rotations[base] + yaw if flags & 0x08 else yaw
+        self.rotations[base + 1] = self.rotations[base + 1] + pitch if flags & 0x10 else pitch
+        self.on_ground[slot] = on_ground
+        if self.listeners:
+            self._notify((slot,))
+        return True
+
+    def apply_teleport_entity(self, packet: PacketsV769.PCTeleportEntity) -> bool:
+        self.flush()
+        return self._set_absolute(
+            packet.entity_id.value,
+            (packet.x.value, packet.y.value, packet.z.value),
+            (packet.velocity_x.value, packet.velocity_y.value, packet.velocity_z.value),
+            packet.yaw.value, packet.pitch.value, packet.on_ground.value, packet.flags.value
+        )
+
+    def apply_entity_position_sync(self, packet: PacketsV769.PCEntityPositionSync) -> bool:
+        self.flush()
+        return self._set_absolute(
+            packet.entity_id.value,
+            (packet.x.value, packet.y.value, packet.z.value),
+            (packet.velocity_x.value, packet.velocity_y.value, packet.velocity_z.value),
+            packet.yam.value, packet.pitch.value, packet.on_ground.value
+        )
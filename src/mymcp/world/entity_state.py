@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+"""
+    entity_state
+    ~~~~~~~~~~~~~~~~~~
+    实体状态存储
+    原位合并 PCSetEntityData/PCUpdateAttributes/PCSetEquipment/PCUpdateMobEffect/PCRemoveMobEffect 增量
+    按字段过滤变化通知
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+__all__ = [
+    'EntityState', 'EntityStateStore'
+]
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Callable, ClassVar, Iterable
+
+from mymcp.data_types import DataPacket
+from mymcp.data_types.entity import EntityMetadata
+from mymcp.packets.v769 import PacketsV769
+
+
+METADATA = 'metadata'
+ATTRIBUTES = 'attributes'
+EQUIPMENT = 'equipment'
+EFFECTS = 'effects'
+
+# 主手/副手/脚/腿/胸/头/身体
+EQUIPMENT_SLOTS = 7
+
+# (entity_id, kind, {key: 新值})，移除的属性/效果值为 None
+StateListener = Callable[[int, str, dict[int, Any]], None]
+
+
+@dataclass(slots=True)
+class EntityState:
+    """
+        单个实体状态
+        metadata: 元数据下标 -> 值，metadata_types 同下标为类型 ID，-1 为未设置
+        attributes: 属性 ID -> (基础值, ((modifier_id, amount, operation), ...))
+        equipment: 装备槽 -> Slot
+        effects: 效果 ID -> (amplifier, duration, flags)
+    """
+    entity_id: int
+    metadata: list[Any] = field(default_factory=list)
+    metadata_types: array = field(default_factory=lambda: array('b'))
+    attributes: dict[int, tuple[float, tuple[tuple[str, float, int], ...]]] = field(default_factory=dict)
+    equipment: list[Any] = field(default_factory=lambda: [None] * EQUIPMENT_SLOTS)
+    effects: dict[int, tuple[int, int, int]] = field(default_factory=dict)
+
+    def __repr__(self):
+        return f"<EntityState>({self.entity_id} {sum(1 for _ in self.metadata_types if _ >= 0)} Metadata)"
+
+    def has_metadata(self, index: int) -> bool:
+        return index < len(self.metadata_types) and self.metadata_types[index] >= 0
+
+    def get_metadata(self, index: int, default: Any = None) -> Any:
+        return self.metadata[index] if self.has_metadata(index) else default
+
+    def set_metadata(self, index: int, type_id: int, value: Any) -> bool:
+        """
+            设置元数据
+        :param index:
+        :param type_id:
+        :param value:
+        :return: 是否变化
+        """
+        size = len(self.metadata_types)
+        if index >= size:
+            self.metadata.extend([None] * (index + 1 - size))
+            self.metadata_types.extend([-1] * (index + 1 - size))
+        elif self.metadata_types[index] == type_id and self.metadata[index] == value:
+            return False
+        self.metadata[index] = value
+        self.metadata_types[index] = type_id
+        return True
+
+
+class EntityStateStore:
+    """
+        实体状态存储
+        metadata_indexes 非 None 时仅保存其中的元数据下标，其余按长度跳过不解码
+        watch 注册按字段过滤的监听器，仅在关注的字段实际变化时调用
+    """
+
+    APPLIERS: ClassVar[dict[type, str]] = {
+        PacketsV769.PCSetEntityData: 'apply_set_entity_data',
+        PacketsV769.PCUpdateAttributes: 'apply_update_attributes',
+        PacketsV769.PCSetEquipment: 'apply_set_equipment',
+        PacketsV769.PCUpdateMobEffect: 'apply_update_mob_effect',
+        PacketsV769.PCRemoveMobEffect: 'apply_remove_mob_effect',
+        PacketsV769.PCRemoveEntities: 'apply_remove_entities',
+    }
+
+    def __init__(self, metadata_indexes: Iterable[int] | None = None):
+        """
+        :param metadata_indexes: 保存的元数据下标，None 为全部
+        """
+        self.metadata_indexes = None if metadata_indexes is None else frozenset(metadata_indexes)
+        self.states: dict[int, EntityState] = {}
+        # (kind, key) -> 监听器，key 为 None 时关注该类全部字段
+        self.watchers: dict[tuple[str, int | None], list[StateListener]] = {}
+
+    def __repr__(self):
+        return f"<EntityStateStore>({len(self.states)} Entities)"
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def __contains__(self, entity_id: int) -> bool:
+        return entity_id in self.states
+
+    def get(self, entity_id: int) -> EntityState | None:
+        return self.states.get(entity_id)
+
+    def state(self, entity_id: int) -> EntityState:
+        """
+            获取或创建实体状态
+        :param entity_id:
+        :return:
+        """
+        state = self.states.get(entity_id)
+        if state is None:
+            state = self.states[entity_id] = EntityState(entity_id)
+        return state
+
+    def remove(self, entity_id: int) -> EntityState | None:
+        return self.states.pop(entity_id, None)
+
+    def clear(self) -> None:
+        self.states.clear()
+
+    def watch(self, kind: str, listener: StateListener, keys: Iterable[int] | None = None) -> None:
+        """
+            注册监听器
+        :param kind: metadata / attributes / equipment / effects
+        :param listener: (entity_id, kind, {key: 新值})
+        :param keys: 关注的元数据下标/属性 ID/装备槽/效果 ID，None 为全部
+        :return:
+        """
+        for key in (None,) if keys is None else keys:
+            self.watchers.setdefault((kind, key), []).append(listener)
+
+    def unwatch(self, listener: StateListener) -> None:
+        for field_key in list(self.watchers):
+            listeners = self.watchers[field_key]
+            if listener in listeners:
+                listeners.remove(listener)
+            if not listeners:
+                del self.watchers[field_key]
+
+    def _notify(self, entity_id: int, kind: str, changes: dict[int, Any]) -> None:
+        """
+            按监听器汇总其关注的变化，每个监听器最多调用一次
+        :param entity_id:
+        :param kind:
+        :param changes:
+        :return:
+        """
+        if not changes or not self.watchers:
+            return
+
+        targets: dict[StateListener, dict[int, Any]] = {}
+        for listener in self.watchers.get((kind, None), ()):
+            targets[listener] = changes
+        for key, value in changes.items():
+            for listener in self.watchers.get((kind, key), ()):
+                if targets.get(listener) is not changes:
+                    targets.setdefault(listener, {})[key] = value
+
+        for listener, listener_changes in targets.items():
+            listener(entity_id, kind, listener_changes)
+
+    def apply(self, packet: Any) -> Any:
+        """
+            按包类型应用，不支持的包返回 None
+        :param packet:
+        :return:
+        """
+        method_name = self.APPLIERS.get(packet.__class__)
+        if method_name is None:
+            return None
+        return getattr(self, method_name)(packet)
+
+    def merge_metadata(self, entity_id: int, entries: Iterable[EntityMetadata]) -> dict[int, Any]:
+        """
+            合并元数据
+        :param entity_id:
+        :param entries:
+        :return: 变化的 {index: 值}
+        """
+        state = self.state(entity_id)
+        changes = {}
+        for entry in entries:
+            index = entry.index.value
+            value = entry.value
+            if state.set_metadata(index, entry.type_.value, value):
+                changes[index] = value
+        self._notify(entity_id, METADATA, changes)
+        return changes
+
+    def apply_set_entity_data(self, packet: PacketsV769.PCSetEntityData | DataPacket | bytes) -> dict[int, Any]:
+        """
+            合并元数据，可直接传入 payload，仅解码保存的下标
+        :param packet:
+        :return: 变化的 {index: 值}
+        """
+        if isinstance(packet, PacketsV769.PCSetEntityData):
+            metadata = packet.metadata
+            indexes = metadata if self.metadata_indexes is None else self.metadata_indexes.intersection(metadata)
+            return self.merge_metadata(packet.entity_id.value, [metadata[_] for _ in indexes])
+
+        entity_id, entries = PacketsV769.PCSetEntityData.unpack(packet, self.metadata_indexes)
+        return self.merge_metadata(entity_id, entries.values())
+
+    def apply_update_attributes(self, packet: PacketsV769.PCUpdateAttributes) -> dict[int, Any]:
+        """
+            合并属性，未包含的属性保持不变
+        :param packet:
+        :return: 变化的 {attribute_id: (基础值, modifiers)}
+        """
+        entity_id = packet.entity_id.value
+        attributes = self.state(entity_id).attributes
+        changes = {}
+        for prop in packet.properties:
+            value = (
+                prop.value.value,
+                tuple((_.id_.value, _.amount.value, _.operation.value) for _ in prop.modifiers)
+            )
+            if attributes.get(prop.id_.value) != value:
+                attributes[prop.id_.value] = changes[prop.id_.value] = value
+        self._notify(entity_id, ATTRIBUTES, changes)
+        return changes
+
+    def apply_set_equipment(self, packet: PacketsV769.PCSetEquipment) -> dict[int, Any]:
+        """
+            合并装备
+        :param packet:
+        :return: 变化的 {slot: Slot}
+        """
+        entity_id = packet.entity_id.value
+        equipment = self.state(entity_id).equipment
+        changes = {}
+        for entry in packet.equipments:
+            slot = entry.slot.value & 0x7F
+            if slot >= len(equipment):
+                equipment.extend([None] * (slot + 1 - len(equipment)))
+            if equipment[slot] != entry.item:
+                equipment[slot] = changes[slot] = entry.item
+        self._notify(entity_id, EQUIPMENT, changes)
+        return changes
+
+    def apply_update_mob_effect(self, packet: PacketsV769.PCUpdateMobEffect) -> dict[int, Any]:
+        """
+        :param packet:
+        :return: 变化的 {effect_id: (amplifier, duration, flags)}
+        """
+        entity_id = packet.entity_id.value
+        effects = self.state(entity_id).effects
+        effect_id = packet.effect_id.value
+        value = (packet.amplifier.value, packet.duration.value, packet.flags.value)
+        changes = {}
+        if effects.get(effect_id) != value:
+            effects[effect_id] = changes[effect_id] = value
+        self._notify(entity_id, EFFECTS, changes)
+        return changes
+
+    def apply_remove_mob_effect(self, packet: PacketsV769.PCRemoveMobEffect) -> dict[int, Any]:
+        """
+        :param packet:
+        :return: {effect_id: None}，效果不存在时为空
+        """
+        entity_id = packet.entity_id.value
+        state = self.states.get(entity_id)
+        changes = {}
+        if state is not None and state.effects.pop(packet.effect_id.value, None) is not None:
+            changes[packet.effect_id.value] = None
+        self._notify(entity_id, EFFECTS, changes)
+        return changes
+
+    def apply_remove_entities(self, packet: PacketsV769.PCRemoveEntities) -> int:
+        """
+        :param packet:
+        :return: 移除数量
+        """
+        return sum(self.remove(_.value) is not None for _ in packet.entity_ids)
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+    pipeline
+    ~~~~~~~~~~~~~~~~~~
+    多进程 Chunk 解码管线
+    PCLevelChunkWithLight 原始 payload 发送至进程池，解码为 ChunkColumn 后 pickle 返回
+    Free-threaded Python 下使用线程池
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+__all__ = [
+    'ChunkDecodePipeline', 'decode_chunk_payload'
+]
+
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+import queue
+import struct
+import sys
+import threading
+from typing import Callable, Self, Any
+
+from mymcp.data_types import DataPacket
+from mymcp.world.column import ChunkColumn
+
+
+ChunkKey = tuple[int, int]
+
+
+def decode_chunk_payload(data: bytes, dimension_chunk_size: int = 24) -> ChunkColumn:
+    """
+        进程池 Worker，须为模块级函数
+    :param data:
+    :param dimension_chunk_size:
+    :return:
+    """
+    return ChunkColumn.decode(data, dimension_chunk_size)
+
+
+class ChunkDecodePipeline:
+    """
+        Chunk 解码管线
+        结果以 ((chunk_x, chunk_z), ChunkColumn) 交给 callback，未设置 callback 时放入队列
+        解码失败时值为 Exception 实例
+    """
+
+    def __init__(
+            self,
+            dimension_chunk_size: int = 24,
+            max_workers: int | None = None,
+            callback: Callable[[ChunkKey, ChunkColumn | Exception], Any] | None = None,
+            use_threads: bool | None = None,
+            executor: Executor | None = None,
+    ):
+        """
+        :param dimension_chunk_size: 当前维度 Section 数量
+        :param max_workers:
+        :param callback: 在 Executor 回调线程中调用
+        :param use_threads: None 时自动判断，GIL 关闭时使用线程池
+        :param executor: 自定义 Executor
+        """
+        self.dimension_chunk_size = dimension_chunk_size
+        self.callback = callback
+        self.results: queue.Queue[tuple[ChunkKey, ChunkColumn | Exception]] = queue.Queue()
+
+        if use_threads is None:
+            use_threads = not getattr(sys, '_is_gil_enabled', lambda: True)()
+
+        if executor is not None:
+            self.executor = executor
+        elif use_threads:
+            self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        else:
+            self.executor = ProcessPoolExecutor(max_workers=max_workers)
+
+        self._lock = threading.Lock()
+        self._pending: set[Future] = set()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def submit(self, bytes_source: bytes | DataPacket) -> Future:
+        """
+            提交 PCLevelChunkWithLight payload
+        :param bytes_source:
+        :return:
+        """
+        data = bytes_source.data if isinstance(bytes_source, DataPacket) else bytes(bytes_source)
+        key = struct.unpack_from('>ii', data, 0)
+
+        future = self.executor.submit(decode_chunk_payload, data, self.dimension_chunk_size)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(lambda _future: self._on_done(key, _future))
+        return future
+
+    def submit_many(self, sources: list[bytes | DataPacket]) -> list[Future]:
+        return [self.submit(_) for _ in sources]
+
+    def _on_done(self, key: ChunkKey, future: Future) -> None:
+        with self._lock:
+            self._pending.discard(future)
+
+        if future.cancelled():
+            return
+
+        exception = future.exception()
+        result = future.result() if exception is None else exception
+
+        if self.callback is None:
+            self.results.put((key, result))
+        else:
+            self.callback(key, result)
+
+    def get(self, block: bool = True, timeout: float | None = None) -> tuple[ChunkKey, ChunkColumn | Exception]:
+        """
+            获取一个结果
+        :param block:
+        :param timeout:
+        :return:
+        """
+        return self.results.get(block, timeout)
+
+    def drain(self) -> list[tuple[ChunkKey, ChunkColumn | Exception]]:
+        """
+            取出当前已完成的全部结果
+        :return:
+        """
+        items = []
+        while True:
+            try:
+                items.append(self.results.get_nowait())
+            except queue.Empty:
+                return items
+
+    def close(self, wait: bool = True) -> None:
+        self.executor.shutdown(wait=wait)
@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+"""
+    region
+    ~~~~~~~~~~~~~~~~~~
+    Anvil 存档 Region (.mca) 文件读取
+    https://minecraft.wiki/w/Region_file_format
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建，mmap 读取，按需解压/解码 Chunk，多进程遍历
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+__all__ = [
+    'RegionFile', 'AnvilChunk', 'AnvilSection'
+]
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+import gzip
+from io import BytesIO
+import mmap
+import os
+import re
+import struct
+from typing import Any, Callable, Iterable, Iterator, Self, Sequence
+import zlib
+
+from mymcp.data_types import VarInt, UnsignedByte
+from mymcp.data_types.nbt import NBTFile, TagCompound
+from mymcp.data_types.chunk import (
+    PalettedContainer, PalettedContainerBlocks, PalettedContainerBiomes, PackedLongArray
+)
+
+
+@dataclass(slots=True)
+class AnvilSection:
+    """
+        存档中的 Chunk Section
+        block_states/biomes 复用 PalettedContainer，palette 为本 Section 调色板下标
+        即 block_palette[block_states.palette[i]] 为对应方块状态
+    """
+    y: int
+    block_palette: list[TagCompound]
+    block_states: PalettedContainerBlocks | None
+    biome_palette: list[str]
+    biomes: PalettedContainerBiomes | None
+    block_light: bytes | None = None
+    sky_light: bytes | None = None
+
+    @staticmethod
+    def to_paletted_container(
+            container_cls: type[PalettedContainer], palette_size: int, data: Sequence[int] | None
+    ) -> PalettedContainer:
+        """
+            存档 palette/data -> PalettedContainer
+            存档中不存在 Direct 模式，bits 可能超出 INDIRECT_MAX，此时仍为 TYPE_INDIRECT
+        :param container_cls:
+        :param palette_size:
+        :param data:
+        :return:
+        """
+        if palette_size <= 1 or not data:
+            return container_cls(
+                UnsignedByte(0), VarInt(0), PackedLongArray(b''), container_cls.TYPE_SINGLE_VALUE
+            )
+
+        bits = max(container_cls.INDIRECT_MIN, (palette_size - 1).bit_length())
+        return container_cls(
+            UnsignedByte(bits),
+            [VarInt(_) for _ in range(palette_size)],
+            PackedLongArray(struct.pack(f'>{len(data)}q', *data)),
+            container_cls.TYPE_INDIRECT
+        )
+
+    @classmethod
+    def from_nbt(cls, section: TagCompound) -> Self:
+        """
+            解析 sections 中单个 Compound
+        :param section:
+        :return:
+        """
+        y = section.get('Y')
+
+        block_palette, block_states = [], None
+        block_states_tag = section.get('block_states')
+        if block_states_tag is not None:
+            palette_tag = block_states_tag.get('palette')
+            block_palette = list(palette_tag.value) if palette_tag is not None else []
+            data_tag = block_states_tag.get('data')
+            block_states = cls.to_paletted_container(
+                PalettedContainerBlocks, len(block_palette), data_tag.value if data_tag is not None else None
+            )
+
+        biome_palette, biomes = [], None
+        biomes_tag = section.get('biomes')
+        if biomes_tag is not None:
+            palette_tag = biomes_tag.get('palette')
+            biome_palette = [_.value for _ in palette_tag.value] if palette_tag is not None else []
+            data_tag = biomes_tag.get('data')
+            biomes = cls.to_paletted_container(
+                PalettedContainerBiomes, len(biome_palette), data_tag.value if data_tag is not None else None
+            )
+
+        block_light = section.get('BlockLight')
+        sky_light = section.get('SkyLight')
+
+        return cls(
+            y=y.value if y is not None else 0,
+            block_palette=block_palette,
+            block_states=block_states,
+            biome_palette=biome_palette,
+            biomes=biomes,
+            block_light=struct.pack(f'>{len(block_light)}b', *block_light.value) if block_light else None,
+            sky_light=struct.pack(f'>{len(sky_light)}b', *sky_light.value) if sky_light else None,
+        )
+
+
+@dataclass(slots=True)
+class AnvilChunk:
+    """
+        存档 Chunk，nbt 为完整 Chunk NBT
+    """
+    chunk_x: int
+    chunk_z: int
+    timestamp: int
+    nbt: TagCompound
+
+    def __repr__(self):
+        return f"<AnvilChunk>({self.chunk_x}, {self.chunk_z})"
+
+    @property
+    def data_version(self) -> int | None:
+        tag = self.nbt.get('DataVersion')
+        return None if tag is None else tag.value
+
+    @property
+    def status(self) -> str | None:
+        tag = self.nbt.get('Status')
+        return None if tag is None else tag.value
+
+    @property
+    def sections(self) -> list[AnvilSection]:
+        """
+            解析全部 Section
+        :return:
+        """
+        tag = self.nbt.get('sections')
+        if tag is None or not isinstance(tag.value, list):
+            return []
+        return [AnvilSection.from_nbt(_) for _ in tag.value]
+
+
+class RegionFile:
+    """
+        Region 文件
+        前 4KiB 为位置表，每项 3 bytes 扇区偏移 + 1 byte 扇区数量
+        其后 4KiB 为时间戳表
+        Chunk 数据: 4 bytes 长度 + 1 byte 压缩类型 + 数据
+    """
+
+    SECTOR_SIZE = 4096
+    CHUNKS_PER_REGION = 1024
+
+    COMPRESSION_GZIP = 1
+    COMPRESSION_ZLIB = 2
+    COMPRESSION_NONE = 3
+    COMPRESSION_LZ4 = 4
+    COMPRESSION_EXTERNAL = 0x80
+
+    FILENAME_PATTERN = re.compile(r'r\.(-?\d+)\.(-?\d+)\.mca$')
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = os.fspath(path)
+
+        matched = self.FILENAME_PATTERN.search(os.path.basename(self.path))
+        self.region_x, self.region_z = (int(matched.group(1)), int(matched.group(2))) if matched else (0, 0)
+
+        self._file = open(self.path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+
+        if size < self.SECTOR_SIZE * 2:
+            # 空 Region 文件
+            self._mmap = None
+            self.locations = (0,) * self.CHUNKS_PER_REGION
+            self.timestamps = (0,) * self.CHUNKS_PER_REGION
+        else:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.locations = struct.unpack_from(f'>{self.CHUNKS_PER_REGION}I', self._mmap, 0)
+            self.timestamps = struct.unpack_from(f'>{self.CHUNKS_PER_REGION}i', self._mmap, self.SECTOR_SIZE)
+
+    def __repr__(self):
+        return f"<RegionFile>({self.region_x}, {self.region_z} {len(self)} Chunks)"
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.locations if _)
+
+    def __iter__(self) -> Iterator[AnvilChunk]:
+        return self.iter_chunks()
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    @staticmethod
+    def index_of(x: int, z: int) -> int:
+        """
+            Region 内 Chunk 下标，x/z 可为绝对 Chunk 坐标
+        :param x:
+        :param z:
+        :return:
+        """
+        return (x & 31) + (z & 31) * 32
+
+    def has_chunk(self, x: int, z: int) -> bool:
+        return self.locations[self.index_of(x, z)] != 0
+
+    def chunk_positions(self) -> Iterator[tuple[int, int]]:
+        """
+            存在的 Chunk 区域内坐标
+        :return:
+        """
+        for index, location in enumerate(self.locations):
+            if location:
+                yield index & 31, index >> 5
+
+    def read_raw(self, x: int, z: int) -> bytes | None:
+        """
+            读取并解压 Chunk NBT bytes
+        :param x:
+        :param z:
+        :return:
+        """
+        location = self.locations[self.index_of(x, z)]
+        if location == 0 or self._mmap is None:
+            return None
+
+        offset = (location >> 8) * self.SECTOR_SIZE
+        length, compression = struct.unpack_from('>IB', self._mmap, offset)
+
+        if compression & self.COMPRESSION_EXTERNAL:
+            # 超大 Chunk 存放于 c.x.z.mcc
+            external = os.path.join(
+                os.path.dirname(self.path),
+                f"c.{self.region_x * 32 + (x & 31)}.{self.region_z * 32 + (z & 31)}.mcc"
+            )
+            with open(external, 'rb') as f:
+                data = f.read()
+            compression &= ~self.COMPRESSION_EXTERNAL
+        else:
+            # length 包含压缩类型 1 byte
+            data = self._mmap[offset + 5: offset + 4 + length]
+
+        if compression == self.COMPRESSION_ZLIB:
+            return zlib.decompress(data)
+        elif compression == self.COMPRESSION_GZIP:
+            return gzip.decompress(data)
+        elif compression == self.COMPRESSION_NONE:
+            return bytes(data)
+        else:
+            raise ValueError(f"Unsupported chunk compression type {compression}")
+
+    def chunk(self, x: int, z: int) -> AnvilChunk | None:
+        """
+            读取并解码 Chunk
+        :param x:
+        :param z:
+        :return:
+        """
+        raw = self.read_raw(x, z)
+        if raw is None:
+            return None
+
+        return AnvilChunk(
+            chunk_x=self.region_x * 32 + (x & 31),
+            chunk_z=self.region_z * 32 + (z & 31),
+            timestamp=self.timestamps[self.index_of(x, z)],
+            nbt=NBTFile.decode(BytesIO(raw))
+        )
+
+    def iter_chunks(self) -> Iterator[AnvilChunk]:
+        """
+            遍历全部 Chunk
+        :return:
+        """
+        for x, z in self.chunk_positions():
+            yield self.chunk(x, z)
+
+    @classmethod
+    def map_region(cls, path: str | os.PathLike, func: Callable[[AnvilChunk], Any]) -> list[tuple[int, int, Any]]:
+        """
+            对单个 Region 内全部 Chunk 执行 func
+        :param path:
+        :param func:
+        :return: [(chunk_x, chunk_z, result), ...]
+        """
+        with cls(path) as region:
+            return [(chunk.chunk_x, chunk.chunk_z, func(chunk)) for chunk in region.iter_chunks()]
+
+    @classmethod
+    def map_regions(
+            cls, paths: Iterable[str | os.PathLike], func: Callable[[AnvilChunk], Any], max_workers: int | None = None
+    ) -> Iterator[tuple[str, list[tuple[int, int, Any]]]]:
+        """
+            多进程并行处理多个 Region，按完成顺序返回
+            func 须可被 pickle (模块级函数)
+        :param paths:
+        :param func:
+        :param max_workers:
+        :return: (path, [(chunk_x, chunk_z, result), ...])
+        """
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(cls.map_region, path, func): os.fspath(path) for path in paths
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""
+    search
+    ~~~~~~~~~~~~~~~~~~
+    方块搜索索引
+    按 Section 记录出现的方块状态，不含目标状态的 Section 直接跳过，其余向量化比较
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+__all__ = [
+    'BlockSearchIndex'
+]
+
+from typing import Any, Iterable, Iterator
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from mymcp.world.store import ChunkStore, ChunkKey
+
+
+class BlockSearchIndex:
+    """
+        方块搜索索引，注册为 ChunkStore 监听器并随方块变化更新
+        Section 状态集合按需计算，方块变化时只增不减 (超集)，refresh 可重新计算
+    """
+
+    def __init__(self, store: ChunkStore):
+        self.store = store
+        self.palettes: dict[ChunkKey, list[set[int] | None]] = {}
+        store.listeners.append(self.on_change)
+
+    def __repr__(self):
+        return f"<BlockSearchIndex>({len(self.palettes)} Chunks)"
+
+    def close(self) -> None:
+        """
+            取消监听
+        :return:
+        """
+        if self.on_change in self.store.listeners:
+            self.store.listeners.remove(self.on_change)
+        self.palettes.clear()
+
+    def on_change(self, key: ChunkKey | None, section_index: int | None, states: Iterable[int] | None) -> None:
+        """
+            ChunkStore 变化回调
+        :param key:
+        :param section_index:
+        :param states:
+        :return:
+        """
+        if key is None:
+            self.palettes.clear()
+        elif section_index is None:
+            self.palettes.pop(key, None)
+        else:
+            palettes = self.palettes.get(key)
+            if palettes is not None and palettes[section_index] is not None:
+                palettes[section_index].update(
+                    states.tolist() if np is not None and isinstance(states, np.ndarray) else states
+                )
+
+    def refresh(self, key: ChunkKey | None = None) -> None:
+        """
+            丢弃状态集合，下次搜索时重新计算
+        :param key: None 为全部
+        :return:
+        """
+        if key is None:
+            self.palettes.clear()
+        else:
+            self.palettes.pop(key, None)
+
+    @staticmethod
+    def section_palette(section: Any) -> set[int]:
+        """
+            Section 中出现的方块状态
+        :param section:
+        :return:
+        """
+        if isinstance(section, int):
+            return {section}
+        if np is not None and isinstance(section, np.ndarray):
+            return set(np.unique(section).tolist())
+        return set(section)
+
+    def palette(self, key: ChunkKey, section_index: int) -> set[int]:
+        palettes = self.palettes.get(key)
+        column = self.store.columns[key]
+        if palettes is None:
+            palettes = self.palettes[key] = [None] * len(column.blocks)
+
+        palette = palettes[section_index]
+        if palette is None:
+            palette = palettes[section_index] = self.section_palette(column.blocks[section_index])
+        return palette
+
+    def keys(self, center: ChunkKey | None = None, radius: int | None = None) -> list[ChunkKey]:
+        """
+            搜索范围内已加载 Chunk
+        :param center:
+        :param radius: 以 center 为中心的 Chunk 半径 (方形)
+        :return:
+        """
+        keys = self.store.loaded_keys()
+        if center is None or radius is None:
+            return keys
+        return [
+            key for key in keys if abs(key[0] - center[0]) <= radius and abs(key[1] - center[1]) <= radius
+        ]
+
+    def iter_sections(
+            self, states: Iterable[int], center: ChunkKey | None = None, radius: int | None = None
+    ) -> Iterator[tuple[ChunkKey, int, Any]]:
+        """
+            可能包含目标状态的 Section
+        :param states:
+        :param center:
+        :param radius:
+        :return: (chunk_key, section_index, section)
+        """
+        targets = set(states)
+        for key in self.keys(center, radius):
+            column = self.store.columns[key]
+            for section_index, section in enumerate(column.blocks):
+                if not targets.isdisjoint(self.palette(key, section_index)):
+                    yield key, section_index, section
+
+    def find(
+            self, states: Iterable[int], center: ChunkKey | None = None, radius: int | None = None
+    ) -> list[tuple[int, int, int]]:
+        """
+            查找方块坐标
+        :param states: 目标方块状态 ID
+        :param center: 中心 Chunk 坐标
+        :param radius: Chunk 半径
+        :return: [(x, y, z), ...]
+        """
+        targets = set(states)
+        target_array = np.fromiter(targets, dtype=np.uint16) if np is not None else None
+        min_y = self.store.min_y
+
+        positions = []
+        for (chunk_x, chunk_z), section_index, section in self.iter_sections(targets, center, radius):
+            base_x, base_y, base_z = chunk_x << 4, min_y + (section_index << 4), chunk_z << 4
+
+            if isinstance(section, int):
+                indexes = range(4096)
+            elif target_array is not None and isinstance(section, np.ndarray):
+                indexes = np.flatnonzero(np.isin(section, target_array)).tolist()
+            else:
+                indexes = [index for index, state in enumerate(section) if state in targets]
+
+            positions.extend(
+                (base_x + (index & 15), base_y + (index >> 8), base_z + ((index >> 4) & 15)) for index in indexes
+            )
+        return positions
+
+    def count(self, states: Iterable[int], center: ChunkKey | None = None, radius: int | None = None) -> int:
+        """
+            统计方块数量
+        :param states:
+        :param center:
+        :param radius:
+        :return:
+        """
+        targets = set(states)
+        target_array = np.fromiter(targets, dtype=np.uint16) if np is not None else None
+
+        total = 0
+        for _, _, section in self.iter_sections(targets, center, radius):
+            if isinstance(section, int):
+                total += 4096
+            elif target_array is not None and isinstance(section, np.ndarray):
+                total += int(np.count_nonzero(np.isin(section, target_array)))
+            else:
+                total += sum(1 for state in section if state in targets)
+        return total
+
+    def nearest(
+            self, states: Iterable[int], x: int, y: int, z: int, radius: int | None = None
+    ) -> tuple[int, int, int] | None:
+        """
+            最近的方块
+        :param states:
+        :param x:
+        :param y:
+        :param z:
+        :param radius: Chunk 半径
+        :return:
+        """
+        positions = self.find(states, (x >> 4, z >> 4), radius)
+        if not positions:
+            return None
+        return min(positions, key=lambda _: (_[0] - x) ** 2 + (_[1] - y) ** 2 + (_[2] - z) ** 2)
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+"""
+    spatial
+    ~~~~~~~~~~~~~~~~~~
+    实体空间索引
+    均匀网格哈希，随 EntityTracker 位置变化增量更新，支持半径/包围盒/最近邻查询
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+__all__ = [
+    'EntitySpatialIndex'
+]
+
+import math
+from typing import Any, Iterable
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from mymcp.world.entities import EntityTracker
+
+
+CellKey = tuple[int, int, int]
+
+
+class EntitySpatialIndex:
+    """
+        实体空间索引，注册为 EntityTracker 监听器
+        网格单元 -> slot 集合，仅跨越单元的实体需要更新
+    """
+
+    def __init__(self, tracker: EntityTracker, cell_size: float = 16.0):
+        """
+        :param tracker:
+        :param cell_size: 网格边长 (方块)
+        """
+        self.tracker = tracker
+        self.cell_size = float(cell_size)
+        self.cells: dict[CellKey, set[int]] = {}
+        self.slot_cells: dict[int, CellKey] = {}
+        # NumPy 下按 slot 保存所在单元，批量比较后仅处理跨越单元的实体
+        self._cell_array = np.zeros((0, 3), dtype=np.int64) if np is not None else None
+        self._placed = np.zeros(0, dtype=bool) if np is not None else None
+        tracker.listeners.append(self.on_change)
+        self.rebuild()
+
+    def __repr__(self):
+        return f"<EntitySpatialIndex>({len(self.slot_cells)} Entities {len(self.cells)} Cells)"
+
+    def __len__(self) -> int:
+        return len(self.slot_cells)
+
+    def close(self) -> None:
+        """
+            取消监听
+        :return:
+        """
+        if self.on_change in self.tracker.listeners:
+            self.tracker.listeners.remove(self.on_change)
+        self._reset()
+
+    def _reset(self) -> None:
+        self.cells.clear()
+        self.slot_cells.clear()
+        if self._placed is not None:
+            self._placed[:] = False
+
+    def cell(self, x: float, y: float, z: float) -> CellKey:
+        size = self.cell_size
+        return math.floor(x / size), math.floor(y / size), math.floor(z / size)
+
+    def rebuild(self) -> None:
+        """
+            由 tracker 全量重建
+        :return:
+        """
+        self._reset()
+        self._place(list(self.tracker.slots.values()))
+
+    def _remove(self, slot: int) -> None:
+        key = self.slot_cells.pop(slot, None)
+        if key is None:
+            return
+        members = self.cells[key]
+        members.discard(slot)
+        if not members:
+            del self.cells[key]
+        if self._placed is not None:
+            self._placed[slot] = False
+
+    def _changed_cells(self, slots: Any) -> tuple[list[int], list[CellKey]]:
+        """
+            所在单元发生变化的 slot，NumPy 下向量化计算并比较
+        :param slots:
+        :return: (slots, 新单元)
+        """
+        positions = self.tracker.positions
+        if np is None:
+            slots = list(slots)
+            keys = [self.cell(*positions[slot * 3: slot * 3 + 3]) for slot in slots]
+            return slots, keys
+
+        capacity = self.tracker.capacity
+        if len(self._placed) < capacity:
+            extra = capacity - len(self._placed)
+            self._cell_array = np.concatenate((self._cell_array, np.zeros((extra, 3), dtype=np.int64)))
+            self._placed = np.concatenate((self._placed, np.zeros(extra, dtype=bool)))
+
+        slots = np.unique(np.asarray(slots, dtype=np.int64))
+        keys = np.floor(positions.reshape(-1, 3)[slots] / self.cell_size).astype(np.int64)
+        changed = (keys != self._cell_array[slots]).any(axis=1) | ~self._placed[slots]
+        slots, keys = slots[changed], keys[changed]
+        self._cell_array[slots] = keys
+        return slots.tolist(), list(map(tuple, keys.tolist()))
+
+    def _place(self, slots: Any) -> int:
+        """
+            更新 slot 所在单元
+        :param slots:
+        :return: 跨越单元的数量
+        """
+        if not len(slots):
+            return 0
+
+        changed = 0
+        slot_cells = self.slot_cells
+        for slot, key in zip(*self._changed_cells(slots)):
+            previous = slot_cells.get(slot)
+            if previous == key:
+                continue
+            if previous is not None:
+                self._remove(slot)
+            slot_cells[slot] = key
+            self.cells.setdefault(key, set()).add(slot)
+            if self._placed is not None:
+                self._placed[slot] = True
+            changed += 1
+        return changed
+
+    def on_change(self, slots: Iterable[int] | None, removed: bool) -> None:
+        """
+            EntityTracker 变化回调
+        :param slots:
+        :param removed:
+        :return:
+        """
+        if slots is None:
+            self._reset()
+        elif removed:
+            for slot in slots:
+                self._remove(slot)
+        else:
+            self._place(slots)
+
+    def _candidates(self, low: CellKey, high: CellKey) -> list[int]:
+        """
+            包围盒覆盖单元中的 slot，单元数多于已占用单元时遍历已占用单元
+        :param low:
+        :param high:
+        :return:
+        """
+        volume = (high[0] - low[0] + 1) * (high[1] - low[1] + 1) * (high[2] - low[2] + 1)
+        slots = []
+        if volume > len(self.cells):
+            for (cell_x, cell_y, cell_z), members in self.cells.items():
+                if (
+                        low[0] <= cell_x <= high[0] and low[1] <= cell_y <= high[1] and low[2] <= cell_z <= high[2]
+                ):
+                    slots.extend(members)
+        else:
+            cells = self.cells
+            for cell_x in range(low[0], high[0] + 1):
+                for cell_y in range(low[1], high[1] + 1):
+                    for cell_z in range(low[2], high[2] + 1):
+                        members = cells.get((cell_x, cell_y, cell_z))
+                        if members:
+                            slots.extend(members)
+        return slots
+
+    def _filter(self, slots: list[int], predicate: Any, vectorized: Any) -> list[int]:
+        """
+            精确过滤候选 slot
+        :param slots:
+        :param predicate: pure-Python (x, y, z) -> bool
+        :param vectorized: NumPy (n, 3) -> mask
+        :return: entity_ids
+        """
+        if not slots:
+            return []
+        tracker = self.tracker
+        if np is not None:
+            slots = np.asarray(slots, dtype=np.int64)
+            slots = slots[vectorized(tracker.positions.reshape(-1, 3)[slots])]
+            return tracker.entity_ids[slots].tolist()
+
+        positions = tracker.positions
+        return [
+            int(tracker.entity_ids[slot]) for slot in slots if predicate(*positions[slot * 3: slot * 3 + 3])
+        ]
+
+    def query_box(
+            self, min_x: float, min_y: float, min_z: float, max_x: float, max_y: float, max_z: float
+    ) -> list[int]:
+        """
+            包围盒内实体 (含边界)
+        :param min_x:
+        :param min_y:
+        :param min_z:
+        :param max_x:
+        :param max_y:
+        :param max_z:
+        :return: entity_ids
+        """
+        low, high = (min_x, min_y, min_z), (max_x, max_y, max_z)
+        return self._filter(
+            self._candidates(self.cell(*low), self.cell(*high)),
+            lambda x, y, z: min_x <= x <= max_x and min_y <= y <= max_y and min_z <= z <= max_z,
+            lambda positions: ((positions >= low) & (positions <= high)).all(axis=1)
+        )
+
+    def query_radius(self, x: float, y: float, z: float, radius: float) -> list[int]:
+        """
+            球形范围内实体
+        :param x:
+        :param y:
+        :param z:
+        :param radius:
+        :return: entity_ids
+        """
+        center, limit = (x, y, z), radius * radius
+        return self._filter(
+            self._candidates(
+                self.cell(x - radius, y - radius, z - radius), self.cell(x + radius, y + radius, z + radius)
+            ),
+            lambda _x, _y, _z: (_x - x) ** 2 + (_y - y) ** 2 + (_z - z) ** 2 <= limit,
+            lambda positions: ((positions - center) ** 2).sum(axis=1) <= limit
+        )
+
+    def _distances(self, slots: list[int], x: float, y: float, z: float) -> list[tuple[float, int]]:
+        tracker = self.tracker
+        if np is not None:
+            slots = np.asarray(slots, dtype=np.int64)
+            distances = np.sqrt(((tracker.positions.reshape(-1, 3)[slots] - (x, y, z)) ** 2).sum(axis=1))
+            return list(zip(distances.tolist(), tracker.entity_ids[slots].tolist()))
+        positions = tracker.positions
+        return [
+            (math.dist(positions[slot * 3: slot * 3 + 3], (x, y, z)), int(tracker.entity_ids[slot])) for slot in slots
+        ]
+
+    def nearest(
+            self, x: float, y: float, z: float, k: int = 1, max_radius: float | None = None
+    ) -> list[tuple[int, float]]:
+        """
+            最近 k 个实体，搜索半径由一个单元起逐次翻倍
+        :param x:
+        :param y:
+        :param z:
+        :param k:
+        :param max_radius: 最大搜索半径，None 为不限
+        :return: [(entity_id, distance), ...] 由近到远
+        """
+        if k <= 0 or not self.slot_cells:
+            return []
+
+        radius = self.cell_size
+        while True:
+            if max_radius is not None:
+                radius = min(radius, max_radius)
+            low = self.cell(x - radius, y - radius, z - radius)
+            high = self.cell(x + radius, y + radius, z + radius)
+            candidates = self._candidates(low, high)
+
+            # 覆盖全部实体时不再受搜索半径限制
+            everything = len(candidates) == len(self.slot_cells)
+            limit = radius if not everything else (max_radius if max_radius is not None else math.inf)
+            found = [_ for _ in self._distances(candidates, x, y, z) if _[0] <= limit]
+
+            if len(found) >= k or everything or (max_radius is not None and radius >= max_radius):
+                found.sort()
+                return [(entity_id, distance) for distance, entity_id in found[:k]]
+            radius *= 2
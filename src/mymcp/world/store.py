@@ -0,0 +1,706 @@
+# -*- coding: utf-8 -*-
+"""
+    store
+    ~~~~~~~~~~~~~~~~~~
+    客户端 Chunk 存储
+    以 (chunk_x, chunk_z) 保存 ChunkColumn，O(1) 读写方块，增量应用方块/生物群系更新
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建，支持内容驻留及写时复制，可使用 ChunkCache 保存
+                                光照查询及 PCLightUpdate 增量更新
+                                Heightmap 查询及增量维护
+                                变化监听
+                                方块实体索引及 PCBlockEntityData 增量更新
+                                只读 ndarray (已清空的驻留表) 写前复制
+                                写时复制按 Section 自身只读标记判断
+                                原位修改时标记 ChunkCache dirty
+                                clear 清空 ChunkCache 磁盘数据，遍历不载入磁盘 Chunk
+                                卸载改为移除后通知，is_loaded
+                                clear 仅清空内存，purge 删除磁盘数据
+                                cache 未设置 interner 时使用 store 的 interner
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+__all__ = [
+    'ChunkStore'
+]
+
+from array import array
+from collections.abc import MutableMapping
+from io import BytesIO
+from typing import Any, Callable, ClassVar, Iterable, Iterator
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from mymcp.data_types import DataPacket, Position, VarInt, LazyNBT
+from mymcp.data_types.chunk import (
+    ARRAY_TYPECODE, PalettedContainerBlocks, PalettedContainerBiomes, ContentInterner, LightData, BlockEntity,
+    nibble_at, expand_nibbles
+)
+from mymcp.data_types.frozen import is_frozen, thaw
+from mymcp.packets.v769 import PacketsV769
+from mymcp.world.cache import ChunkCache
+from mymcp.world.column import ChunkColumn
+
+
+ChunkKey = tuple[int, int]
+BlockPosition = tuple[int, int, int]
+
+# (chunk_key, section_index, 新方块状态)
+# Chunk 加载/卸载或光照/生物群系整体变化时 section_index/states 为 None，清空时全部为 None
+# 卸载在移除后通知，可由 ChunkStore.is_loaded 区分
+ChangeListener = Callable[[ChunkKey | None, int | None, Iterable[int] | None], None]
+
+
+class ChunkStore:
+    """
+        Chunk 存储
+        Section 为 int (单值) 时，写入不同方块才展开为数组
+        设置 interner 时相同内容 Section/Light 数组共享，写入前复制
+        设置 cache 时 Chunk 保存于 ChunkCache，卸载的 Chunk 写入磁盘，仍可查询
+        heightmap_transparent 中的 Heightmap 随方块更新增量维护，默认仅 WORLD_SURFACE
+        listeners 在 Chunk 加载/卸载及方块变化后调用，用于维护外部索引
+        方块实体按 Chunk 建立世界坐标索引，首次查询时建立，NBT 保持原始 bytes 直至访问
+    """
+
+    APPLIERS: ClassVar[dict[type, str]] = {
+        PacketsV769.PCLevelChunkWithLight: 'apply_level_chunk',
+        PacketsV769.PCBlockUpdate: 'apply_block_update',
+        PacketsV769.PCSectionBlocksUpdate: 'apply_section_blocks_update',
+        PacketsV769.PCForgetLevelChunk: 'apply_forget_level_chunk',
+        PacketsV769.PCChunksBiomes: 'apply_chunks_biomes',
+        PacketsV769.PCLightUpdate: 'apply_light_update',
+        PacketsV769.PCSetChunkCacheCenter: 'apply_chunk_cache_center',
+        PacketsV769.PCSetChunkCacheRadius: 'apply_chunk_cache_radius',
+        PacketsV769.PCBlockEntityData: 'apply_block_entity_data',
+    }
+
+    def __init__(
+            self, min_y: int = -64, height: int = 384, air_states: Iterable[int] = (0,),
+            interner: ContentInterner | None = None, cache: ChunkCache | None = None,
+            heightmap_transparent: dict[str, Iterable[int]] | None = None
+    ):
+        """
+        :param min_y: 维度最低高度
+        :param height: 维度高度
+        :param air_states: 空气方块状态 ID，用于维护 block_count
+        :param interner: 内容驻留
+        :param cache: 内存预算缓存
+        :param heightmap_transparent: Heightmap 名称 -> 不计入该 Heightmap 的方块状态 ID
+        """
+        self.min_y = min_y
+        self.height = height
+        self.air_states = frozenset(air_states)
+        self.interner = interner
+        self.cache = cache
+        if cache is not None and cache.interner is None:
+            cache.interner = interner
+        self.heightmap_transparent = {
+            name: frozenset(states) for name, states in (
+                heightmap_transparent if heightmap_transparent is not None else {'WORLD_SURFACE': self.air_states}
+            ).items()
+        }
+        self.columns: MutableMapping[ChunkKey, ChunkColumn] = {} if cache is None else cache
+        self.listeners: list[ChangeListener] = []
+        # chunk_key -> (建立索引时的 block_entities，世界坐标 -> BlockEntity)
+        self._block_entities: dict[ChunkKey, tuple[Any, dict[BlockPosition, BlockEntity]]] = {}
+
+    def __repr__(self):
+        return f"<ChunkStore>({len(self.columns)} Chunks)"
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def __contains__(self, key: ChunkKey) -> bool:
+        return key in self.columns
+
+    def __iter__(self) -> Iterator[ChunkColumn]:
+        """
+            遍历全部 Chunk，有 cache 时磁盘 Chunk 不载入内存，对其修改不会保存
+        :return:
+        """
+        if self.cache is not None:
+            return self.cache.iter_columns()
+        return iter(self.columns.values())
+
+    def loaded_keys(self) -> list[ChunkKey]:
+        """
+            内存中的 Chunk，不触发 ChunkCache 磁盘载入
+        :return:
+        """
+        return list(self.cache.memory if self.cache is not None else self.columns)
+
+    def _notify(self, key: ChunkKey | None, section_index: int | None = None, states: Any = None) -> None:
+        for listener in self.listeners:
+            listener(key, section_index, states)
+
+    def _modified(self, key: ChunkKey, section_index: int | None = None, states: Any = None) -> None:
+        """
+            Chunk 已原位修改，标记 ChunkCache 并通知
+        :param key:
+        :param section_index:
+        :param states:
+        :return:
+        """
+        if self.cache is not None:
+            self.cache.mark_dirty(key)
+        if self.listeners:
+            self._notify(key, section_index, states)
+
+    @property
+    def dimension_chunk_size(self) -> int:
+        return self.height >> 4
+
+    @staticmethod
+    def expand(value: int, count: int) -> Any:
+        """
+            单值 Section 展开为数组
+        :param value:
+        :param count:
+        :return:
+        """
+        if np is not None:
+            return np.full(count, value, dtype=np.uint16)
+        return array(ARRAY_TYPECODE, [value]) * count
+
+    def column(self, chunk_x: int, chunk_z: int) -> ChunkColumn | None:
+        return self.columns.get((chunk_x, chunk_z))
+
+    def add_column(self, column: ChunkColumn) -> ChunkColumn:
+        if self.interner is not None:
+            column.intern(self.interner)
+        self.columns[column.key] = column
+        self._block_entities.pop(column.key, None)
+        if self.listeners:
+            self._notify(column.key)
+        return column
+
+    def writable_section(self, column: ChunkColumn, section_index: int) -> Any:
+        """
+            获取可写 Section 数组，单值展开，只读共享实例复制 (与驻留表状态无关)
+        :param column:
+        :param section_index:
+        :return:
+        """
+        section = column.blocks[section_index]
+        if isinstance(section, int):
+            section = column.blocks[section_index] = self.expand(section, PalettedContainerBlocks.ENTRIES)
+        elif is_frozen(section):
+            section = column.blocks[section_index] = thaw(section)
+        return section
+
+    def is_loaded(self, chunk_x: int, chunk_z: int) -> bool:
+        """
+            Chunk 是否已加载，ChunkCache 中仅保存于磁盘的 Chunk 视为已卸载
+        :param chunk_x:
+        :param chunk_z:
+        :return:
+        """
+        return (chunk_x, chunk_z) in (self.cache.memory if self.cache is not None else self.columns)
+
+    def unload(self, chunk_x: int, chunk_z: int) -> ChunkColumn | None:
+        """
+            卸载 Chunk，移除后通知 listeners
+        :param chunk_x:
+        :param chunk_z:
+        :return:
+        """
+        self._block_entities.pop((chunk_x, chunk_z), None)
+        if self.cache is not None:
+            column = self.cache.forget(chunk_x, chunk_z)
+        else:
+            column = self.columns.pop((chunk_x, chunk_z), None)
+        if self.listeners:
+            self._notify((chunk_x, chunk_z))
+        return column
+
+    def clear(self) -> None:
+        """
+            清空内存中的 Chunk，有 cache 时已修改的 Chunk 写入磁盘
+            磁盘数据保留 (重连后可继续使用)
+        :return:
+        """
+        self.columns.clear()
+        self._block_entities.clear()
+        if self.listeners:
+            self._notify(None)
+
+    def purge(self) -> None:
+        """
+            清空全部 Chunk，有 cache 时同时删除当前维度磁盘数据
+        :return:
+        """
+        if self.cache is not None:
+            self.cache.reset()
+        else:
+            self.columns.clear()
+        self._block_entities.clear()
+        if self.listeners:
+            self._notify(None)
+
+    def get_block(self, x: int, y: int, z: int) -> int | None:
+        """
+            获取方块状态 ID
+        :param x:
+        :param y:
+        :param z:
+        :return: 未加载或超出高度时为 None
+        """
+        column = self.columns.get((x >> 4, z >> 4))
+        if column is None:
+            return None
+
+        section_index = (y - self.min_y) >> 4
+        if not 0 <= section_index < len(column.blocks):
+            return None
+
+        section = column.blocks[section_index]
+        if isinstance(section, int):
+            return section
+        return int(section[((y & 15) << 8) | ((z & 15) << 4) | (x & 15)])
+
+    def set_block(self, x: int, y: int, z: int, state: int) -> int | None:
+        """
+            设置方块状态 ID
+        :param x:
+        :param y:
+        :param z:
+        :param state:
+        :return: 原方块状态 ID，未加载或超出高度时为 None
+        """
+        column = self.columns.get((x >> 4, z >> 4))
+        if column is None:
+            return None
+
+        section_index = (y - self.min_y) >> 4
+        if not 0 <= section_index < len(column.blocks):
+            return None
+
+        index = ((y & 15) << 8) | ((z & 15) << 4) | (x & 15)
+        section = column.blocks[section_index]
+        previous = section if isinstance(section, int) else int(section[index])
+        if previous == state:
+            return previous
+
+        self.writable_section(column, section_index)[index] = state
+        self._count_change(column, section_index, previous, state)
+        if self.heightmap_transparent:
+            self._update_heights(column, index & 0xFF, y - self.min_y, state)
+        self._modified(column.key, section_index, (state,))
+        return previous
+
+    def _count_change(self, column: ChunkColumn, section_index: int, previous: int, state: int) -> None:
+        was_air = previous in self.air_states
+        is_air = state in self.air_states
+        if was_air != is_air:
+            column.block_counts[section_index] += 1 if was_air else -1
+
+    def _update_heights(self, column: ChunkColumn, column_index: int, relative_y: int, state: int) -> None:
+        """
+            维护 Heightmap，方块已写入
+        :param column:
+        :param column_index: z * 16 + x
+        :param relative_y: 相对维度底部高度
+        :param state:
+        :return:
+        """
+        top = relative_y + 1
+        for name, transparent in self.heightmap_transparent.items():
+            heights = column.heightmap(name)
+            if heights is None:
+                continue
+
+            if state not in transparent:
+                if top > heights[column_index]:
+                    heights[column_index] = top
+            elif top == heights[column_index]:
+                heights[column_index] = self.scan_height(column, column_index, relative_y - 1, transparent)
+
+    @staticmethod
+    def scan_height(column: ChunkColumn, column_index: int, relative_y: int, transparent: frozenset[int]) -> int:
+        """
+            自 relative_y 向下查找第一个计入 Heightmap 的方块
+        :param column:
+        :param column_index: z * 16 + x
+        :param relative_y:
+        :param transparent:
+        :return: Heightmap 值，无方块时为 0
+        """
+        for section_index in range(relative_y >> 4, -1, -1):
+            section = column.blocks[section_index]
+            start = relative_y & 15 if section_index == relative_y >> 4 else 15
+
+            if isinstance(section, int):
+                if section not in transparent:
+                    return (section_index << 4) + start + 1
+                continue
+
+            values = section[column_index::256].tolist()
+            for local_y in range(start, -1, -1):
+                if values[local_y] not in transparent:
+                    return (section_index << 4) + local_y + 1
+        return 0
+
+    def heightmap(self, chunk_x: int, chunk_z: int, name: str = 'WORLD_SURFACE') -> Any:
+        """
+            Chunk 全部 256 列高度，下标为 z * 16 + x
+            值为最高方块上方第一格的绝对 Y 坐标
+        :param chunk_x:
+        :param chunk_z:
+        :param name:
+        :return:
+        """
+        column = self.columns.get((chunk_x, chunk_z))
+        heights = None if column is None else column.heightmap(name)
+        if heights is None:
+            return None
+        if np is not None:
+            return heights.astype(np.int32) + self.min_y
+        return array('i', [_ + self.min_y for _ in heights])
+
+    def get_height(self, x: int, z: int, name: str = 'WORLD_SURFACE') -> int | None:
+        """
+            最高方块上方第一格的绝对 Y 坐标
+        :param x:
+        :param z:
+        :param name:
+        :return:
+        """
+        column = self.columns.get((x >> 4, z >> 4))
+        heights = None if column is None else column.heightmap(name)
+        if heights is None:
+            return None
+        return int(heights[((z & 15) << 4) | (x & 15)]) + self.min_y
+
+    def surface_blocks(self, chunk_x: int, chunk_z: int, name: str = 'WORLD_SURFACE') -> Any:
+        """
+            每列最高方块状态 ID，下标为 z * 16 + x，无方块的列为 0
+        :param chunk_x:
+        :param chunk_z:
+        :param name:
+        :return:
+        """
+        column = self.columns.get((chunk_x, chunk_z))
+        heights = None if column is None else column.heightmap(name)
+        if heights is None:
+            return None
+
+        if np is not None:
+            tops = heights.astype(np.int32) - 1
+            states = np.zeros(256, dtype=np.uint16)
+            column_indexes = np.arange(256)
+            for section_index in np.unique(tops[tops >= 0] >> 4).tolist():
+                selected = (tops >> 4) == section_index
+                section = column.blocks[section_index]
+                if isinstance(section, int):
+                    states[selected] = section
+                else:
+                    states[selected] = section[((tops[selected] & 15) << 8) | column_indexes[selected]]
+            return states
+
+        states = array(ARRAY_TYPECODE, bytes(512))
+        for column_index, value in enumerate(heights):
+            if value:
+                section = column.blocks[(value - 1) >> 4]
+                states[column_index] = section if isinstance(section, int) else section[
+                    (((value - 1) & 15) << 8) | column_index
+                ]
+        return states
+
+    def get_biome(self, x: int, y: int, z: int) -> int | None:
+        """
+            获取生物群系 ID，精度 4x4x4
+        :param x:
+        :param y:
+        :param z:
+        :return:
+        """
+        column = self.columns.get((x >> 4, z >> 4))
+        if column is None:
+            return None
+
+        section_index = (y - self.min_y) >> 4
+        if not 0 <= section_index < len(column.biomes):
+            return None
+
+        section = column.biomes[section_index]
+        if isinstance(section, int):
+            return section
+        return int(section[(((y & 15) >> 2) << 4) | (((z & 15) >> 2) << 2) | ((x & 15) >> 2)])
+
+    def _light(self, lights_name: str, x: int, y: int, z: int) -> int | None:
+        column = self.columns.get((x >> 4, z >> 4))
+        if column is None:
+            return None
+        lights = getattr(column, lights_name).get(((y - self.min_y) >> 4) + 1)
+        if lights is None:
+            return None
+        return nibble_at(lights, ((y & 15) << 8) | ((z & 15) << 4) | (x & 15))
+
+    def get_sky_light(self, x: int, y: int, z: int) -> int | None:
+        """
+            天空光照等级
+        :param x:
+        :param y:
+        :param z:
+        :return: 未加载或服务器未发送时为 None
+        """
+        return self._light('sky_light', x, y, z)
+
+    def get_block_light(self, x: int, y: int, z: int) -> int | None:
+        return self._light('block_light', x, y, z)
+
+    def light_section(self, chunk_x: int, section_y: int, chunk_z: int, sky: bool = True) -> Any:
+        """
+            整个 Section 光照展开为 4096 长度数组，下标同方块
+        :param chunk_x:
+        :param section_y: Section 坐标 (y >> 4)
+        :param chunk_z:
+        :param sky:
+        :return:
+        """
+        column = self.columns.get((chunk_x, chunk_z))
+        if column is None:
+            return None
+        lights = (column.sky_light if sky else column.block_light).get(section_y - (self.min_y >> 4) + 1)
+        return None if lights is None else expand_nibbles(lights)
+
+    def block_entities(self, chunk_x: int, chunk_z: int) -> dict[BlockPosition, BlockEntity]:
+        """
+            Chunk 方块实体索引，Chunk 替换 (含 ChunkCache 重新载入) 后重建
+        :param chunk_x:
+        :param chunk_z:
+        :return: 世界坐标 -> BlockEntity，未加载时为空
+        """
+        column = self.columns.get((chunk_x, chunk_z))
+        if column is None:
+            return {}
+
+        entry = self._block_entities.get(column.key)
+        if entry is not None and entry[0] is column.block_entities:
+            return entry[1]
+
+        index = {_.position(chunk_x, chunk_z): _ for _ in column.block_entities}
+        self._block_entities[column.key] = (column.block_entities, index)
+        return index
+
+    def get_block_entity(self, x: int, y: int, z: int) -> BlockEntity | None:
+        """
+            获取方块实体，data 为 LazyNBT 时访问 value 才解码
+        :param x:
+        :param y:
+        :param z:
+        :return:
+        """
+        return self.block_entities(x >> 4, z >> 4).get((x, y, z))
+
+    def apply(self, packet: Any) -> Any:
+        """
+            按包类型应用更新，不支持的包返回 None
+        :param packet:
+        :return:
+        """
+        method_name = self.APPLIERS.get(packet.__class__)
+        if method_name is None:
+            return None
+        return getattr(self, method_name)(packet)
+
+    def apply_level_chunk(
+            self, packet: PacketsV769.PCLevelChunkWithLight | DataPacket | bytes
+    ) -> ChunkColumn:
+        """
+            加载 Chunk，可直接传入 payload
+        :param packet:
+        :return:
+        """
+        if isinstance(packet, PacketsV769.PCLevelChunkWithLight):
+            column = ChunkColumn.from_packet(packet)
+        else:
+            column = ChunkColumn.decode(packet, self.dimension_chunk_size)
+        return self.add_column(column)
+
+    def apply_block_update(self, packet: PacketsV769.PCBlockUpdate) -> int | None:
+        x, y, z = packet.location.value
+        return self.set_block(x, y, z, packet.block_id.value)
+
+    def apply_section_blocks_update(
+            self, packet: PacketsV769.PCSectionBlocksUpdate | DataPacket | bytes
+    ) -> int:
+        """
+            批量应用 Section 方块更新，可直接传入 payload 跳过 VarLong 对象创建
+        :param packet:
+        :return: 更新方块数量，Chunk 未加载时为 0
+        """
+        if isinstance(packet, PacketsV769.PCSectionBlocksUpdate):
+            (section_x, section_y, section_z), entries = packet.section_position, [_.value for _ in packet.blocks]
+        else:
+            (section_x, section_y, section_z), entries = PacketsV769.PCSectionBlocksUpdate.unpack(packet)
+
+        column = self.columns.get((section_x, section_z))
+        if column is None or not entries:
+            return 0
+
+        section_index = section_y - (self.min_y >> 4)
+        if not 0 <= section_index < len(column.blocks):
+            return 0
+
+        section = column.blocks[section_index]
+
+        if np is not None:
+            entries = np.asarray(entries, dtype=np.int64)
+            states = (entries >> 12).astype(np.uint16)
+            # x << 8 | z << 4 | y -> y << 8 | z << 4 | x
+            indexes = ((entries & 0xF) << 8) | (entries & 0xF0) | ((entries >> 8) & 0xF)
+
+            if isinstance(section, int) and (states == section).all():
+                return len(entries)
+            section = self.writable_section(column, section_index)
+
+            # 同一位置多次出现时保留最后一次
+            indexes, last = np.unique(indexes[::-1], return_index=True)
+            states = states[::-1][last]
+
+            if self.air_states:
+                air = np.fromiter(self.air_states, dtype=np.int64)
+                was_air = np.isin(section[indexes], air)
+                is_air = np.isin(states, air)
+                column.block_counts[section_index] += int(was_air.sum()) - int(is_air.sum())
+
+            section[indexes] = states
+            if self.heightmap_transparent:
+                base_y = section_index << 4
+                for index, state in zip(indexes.tolist(), states.tolist()):
+                    self._update_heights(column, index & 0xFF, base_y + (index >> 8), state)
+            self._modified(column.key, section_index, states)
+            return len(entries)
+
+        if isinstance(section, int) and all(entry >> 12 == section for entry in entries):
+            return len(entries)
+        section = self.writable_section(column, section_index)
+
+        for entry in entries:
+            state = entry >> 12
+            index = ((entry & 0xF) << 8) | (entry & 0xF0) | ((entry >> 8) & 0xF)
+            self._count_change(column, section_index, section[index], state)
+            section[index] = state
+
+        if self.heightmap_transparent:
+            base_y = section_index << 4
+            for entry in entries:
+                index = ((entry & 0xF) << 8) | (entry & 0xF0) | ((entry >> 8) & 0xF)
+                self._update_heights(column, index & 0xFF, base_y + (index >> 8), section[index])
+        self._modified(column.key, section_index, [entry >> 12 for entry in entries] if self.listeners else None)
+        return len(entries)
+
+    def apply_block_entity_data(
+            self, packet: PacketsV769.PCBlockEntityData | DataPacket | bytes
+    ) -> BlockEntity | None:
+        """
+            原位更新方块实体，可直接传入 payload，NBT 保持原始 bytes
+            NBT 为 TAG_End 时移除
+        :param packet:
+        :return: 更新后的 BlockEntity，Chunk 未加载或已移除时为 None
+        """
+        if isinstance(packet, PacketsV769.PCBlockEntityData):
+            (x, y, z), type_, data = packet.location.value, packet.type_.value, packet.nbt_data
+        else:
+            bytes_io = BytesIO(packet.data if isinstance(packet, DataPacket) else packet)
+            (x, y, z) = Position.decode(bytes_io).value
+            type_ = VarInt.decode(bytes_io).value
+            data = LazyNBT.decode(bytes_io)
+
+        column = self.columns.get((x >> 4, z >> 4))
+        if column is None:
+            return None
+
+        index = self.block_entities(column.chunk_x, column.chunk_z)
+        block_entity = index.get((x, y, z))
+        block_entities = None
+
+        if data.bytes == b'\x00':
+            if block_entity is None:
+                return None
+            # 增删项时 LazyArray 转为 list，已解码项保持不变
+            block_entities = [_ for _ in column.block_entities if _ is not block_entity]
+            del index[(x, y, z)]
+            block_entity = None
+
+        elif block_entity is not None:
+            block_entity.type_ = VarInt(type_)
+            block_entity.data = data
+
+        else:
+            block_entity = index[(x, y, z)] = BlockEntity.create(x, y, z, type_, data)
+            block_entities = list(column.block_entities) + [block_entity]
+
+        if block_entities is not None:
+            column.block_entities = block_entities
+            self._block_entities[column.key] = (block_entities, index)
+
+        self._modified(column.key)
+        return block_entity
+
+    def apply_forget_level_chunk(self, packet: PacketsV769.PCForgetLevelChunk) -> ChunkColumn | None:
+        return self.unload(packet.chunk_x.value, packet.chunk_z.value)
+
+    def apply_light_update(self, packet: PacketsV769.PCLightUpdate) -> bool:
+        """
+            仅替换 Mask 中包含的 Section 光照
+        :param packet:
+        :return: Chunk 是否已加载
+        """
+        column = self.columns.get((packet.chunk_x.value, packet.chunk_z.value))
+        if column is None:
+            return False
+
+        light = packet.data
+        for lights, updates in (
+                (column.sky_light, LightData.sections(
+                    light.sky_light_mask, light.empty_sky_light_mask, light.sky_light_arrays
+                )),
+                (column.block_light, LightData.sections(
+                    light.block_light_mask, light.empty_block_light_mask, light.block_light_arrays
+                )),
+        ):
+            if self.interner is not None:
+                updates = {key: self.interner.intern_buffer(value) for key, value in updates.items()}
+            lights.update(updates)
+
+        self._modified(column.key)
+        return True
+
+    def apply_chunk_cache_center(self, packet: PacketsV769.PCSetChunkCacheCenter) -> None:
+        if self.cache is not None:
+            self.cache.apply_chunk_cache_center(packet)
+
+    def apply_chunk_cache_radius(self, packet: PacketsV769.PCSetChunkCacheRadius) -> None:
+        if self.cache is not None:
+            self.cache.apply_chunk_cache_radius(packet)
+
+    def apply_chunks_biomes(self, packet: PacketsV769.PCChunksBiomes) -> int:
+        """
+            替换已加载 Chunk 的生物群系，不重新解码方块
+        :param packet:
+        :return: 更新 Chunk 数量
+        """
+        updated = 0
+        for biome_data in packet.chunk_biome_data:
+            column = self.columns.get((biome_data.chunk_x.value, biome_data.chunk_z.value))
+            if column is None:
+                continue
+
+            bytes_io = BytesIO(bytes(_.value & 0xFF for _ in biome_data.data))
+            column.biomes = [
+                ChunkColumn.compact_container(PalettedContainerBiomes.decode(bytes_io))
+                for _ in range(len(column.biomes))
+            ]
+            if self.interner is not None:
+                column.biomes = [self.interner.intern_buffer(_) for _ in column.biomes]
+            self._modified(column.key)
+            updated += 1
+        return updated
@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+"""
+    conftest
+    ~~~~~~~~~~~~~~~~~~
+    MYMCP_NO_NUMPY=1 时屏蔽 NumPy，测试纯 Python 实现
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+import os
+import sys
+
+if os.environ.get('MYMCP_NO_NUMPY'):
+    sys.modules['numpy'] = None
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+    test_builder
+    ~~~~~~~~~~~~~~~~~~
+    ChunkPacketBuilder 版本与缓存帧
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+from mymcp.world.builder import ChunkPacketBuilder
+from mymcp.world.cache import ChunkCache
+from mymcp.world.column import ChunkColumn
+from mymcp.world.store import ChunkStore
+
+
+def load_and_unload(store: ChunkStore, builder: ChunkPacketBuilder, count: int) -> None:
+    for chunk_x in range(count):
+        column = store.add_column(ChunkColumn(chunk_x, 0, [0] * 24, [0] * 24, [0] * 24))
+        store.set_block(chunk_x * 16, 0, 0, 1)
+        builder.frame(column)
+        store.unload(chunk_x, 0)
+
+
+def test_unload_drops_versions_and_frames():
+    store = ChunkStore()
+    builder = ChunkPacketBuilder(256)
+    builder.attach(store)
+
+    load_and_unload(store, builder, 8)
+    assert not builder.versions and not builder._latest and not builder.frames
+
+
+def test_unload_with_cache_drops_versions_and_frames(tmp_path):
+    with ChunkCache(tmp_path) as cache:
+        store = ChunkStore(cache=cache)
+        builder = ChunkPacketBuilder(256)
+        builder.attach(store)
+
+        load_and_unload(store, builder, 8)
+        assert not builder.versions and not builder._latest and not builder.frames
+
+        column = store.column(3, 0)
+        assert store.get_block(48, 0, 0) == 1
+        assert builder.frame(column) == builder.encode(column)
+
+
+def test_frame_without_store_or_version_is_current():
+    store = ChunkStore()
+    column = store.add_column(ChunkColumn(0, 0, [0] * 24, [0] * 24, [0] * 24))
+    builder = ChunkPacketBuilder(256)
+
+    first = builder.frame(column)
+    store.set_block(0, 0, 0, 1)
+    assert builder.frame(column) == builder.encode(column) != first
+    assert not builder.frames
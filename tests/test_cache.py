@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+    test_cache
+    ~~~~~~~~~~~~~~~~~~
+    ChunkCache 写出与 ChunkStore 配合
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+from array import array
+import os
+
+from mymcp.data_types.chunk import ARRAY_TYPECODE, ContentInterner
+from mymcp.world.cache import ChunkCache
+from mymcp.world.column import ChunkColumn
+from mymcp.world.store import ChunkStore
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def data_size(cache: ChunkCache) -> int:
+    return os.path.getsize(os.path.join(cache.path, cache.DATA_FILE))
+
+
+def add_columns(store: ChunkStore, count: int) -> None:
+    for chunk_x in range(count):
+        store.add_column(ChunkColumn(chunk_x, 0, [0] * 24, [0] * 24, [0] * 24))
+
+
+def test_flush_writes_only_dirty_columns(tmp_path):
+    with ChunkCache(tmp_path) as cache:
+        store = ChunkStore(cache=cache)
+        add_columns(store, 3)
+        cache.flush()
+        size = data_size(cache)
+
+        cache.flush()
+        cache.clear()
+        assert data_size(cache) == size
+
+        store.set_block(16, 0, 0, 1)
+        cache.flush()
+        assert data_size(cache) > size
+        assert not cache.dirty
+
+
+def test_spill_keeps_clean_record(tmp_path):
+    with ChunkCache(tmp_path, memory_budget=0) as cache:
+        store = ChunkStore(cache=cache)
+        add_columns(store, 2)
+        store.get_block(0, 0, 0)
+        size = data_size(cache)
+
+        for _ in range(3):
+            assert store.get_block(0, 0, 0) == 0
+            assert store.get_block(16, 0, 0) == 0
+        assert data_size(cache) == size
+
+        store.set_block(0, 0, 0, 5)
+        store.get_block(16, 0, 0)
+        assert data_size(cache) > size
+        assert store.get_block(0, 0, 0) == 5
+
+
+def test_store_clear_keeps_disk_columns(tmp_path):
+    with ChunkCache(tmp_path, memory_budget=0) as cache:
+        store = ChunkStore(cache=cache)
+        add_columns(store, 3)
+        store.set_block(0, 0, 0, 5)
+        assert len(list(store)) == 3
+        assert len(cache.memory) == 1
+
+        store.clear()
+        assert not cache.memory
+        assert len(store) == 3
+        assert store.get_block(0, 0, 0) == 5
+
+    with ChunkCache(tmp_path) as cache:
+        assert len(cache) == 3
+
+
+def test_store_purge_drops_disk_columns(tmp_path):
+    with ChunkCache(tmp_path, memory_budget=0) as cache:
+        store = ChunkStore(cache=cache)
+        add_columns(store, 3)
+
+        store.purge()
+        assert len(store) == 0
+        assert store.get_block(0, 0, 0) is None
+        assert data_size(cache) == 0
+
+    with ChunkCache(tmp_path) as cache:
+        assert len(cache) == 0
+
+
+def test_reloaded_columns_are_interned(tmp_path):
+    interner = ContentInterner()
+    with ChunkCache(tmp_path, memory_budget=0) as cache:
+        store = ChunkStore(interner=interner, cache=cache)
+        for chunk_x in range(2):
+            blocks = [0] * 24
+            blocks[4] = array(ARRAY_TYPECODE, [1, 2] * 2048) if np is None else np.array([1, 2] * 2048, np.uint16)
+            store.add_column(ChunkColumn(chunk_x, 0, blocks, [0] * 24, [0] * 24))
+
+        shared = store.column(1, 0).blocks[4]
+        assert store.column(0, 0).blocks[4] is shared
+        assert store.column(1, 0).blocks[4] is shared
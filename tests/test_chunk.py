@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+    test_chunk
+    ~~~~~~~~~~~~~~~~~~
+    PalettedContainer 单值容器及驻留 ChunkSection 只读
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+from dataclasses import FrozenInstanceError
+from io import BytesIO
+
+import pytest
+
+from mymcp.data_types import Short, VarInt
+from mymcp.data_types.chunk import ChunkSection, ContentInterner, PalettedContainerBiomes, PalettedContainerBlocks
+from mymcp.data_types.frozen import is_frozen, thaw
+
+
+def test_single_value_containers_are_independent():
+    first = PalettedContainerBlocks.decode(b'\x00\x00\x00')
+    second = PalettedContainerBlocks.from_array([0] * PalettedContainerBlocks.ENTRIES)
+    assert first is not second
+
+    first.palette = VarInt(9)
+    assert second.palette.value == 0
+    assert PalettedContainerBlocks.single_value(0).palette.value == 0
+
+
+def test_interned_sections_are_frozen():
+    section = ChunkSection(
+        Short(4096), PalettedContainerBlocks.from_array([1, 2] * 2048), PalettedContainerBiomes.single_value(3)
+    )
+    raw = section.bytes
+    interner = ContentInterner()
+
+    first = interner.decode(ChunkSection, BytesIO(raw))
+    second = interner.decode(ChunkSection, BytesIO(raw))
+    assert first is second and is_frozen(first)
+    assert first == ChunkSection.decode(BytesIO(raw))
+    assert first.bytes == raw
+
+    with pytest.raises(FrozenInstanceError):
+        first.block_states.palette[0].value = 9
+    with pytest.raises(TypeError):
+        first.block_states.palette.append(VarInt(9))
+
+    copy = thaw(first)
+    copy.block_states.palette[0].value = 9
+    assert first.bytes == raw and copy.bytes != raw
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+    test_container
+    ~~~~~~~~~~~~~~~~~~
+    ContainerManager 按 wire bytes 比较的 Slot 变化，payload 与已解码包结果一致
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+from io import BytesIO
+
+import pytest
+
+from mymcp.data_types import Byte, Short, UnsignedByte, VarInt
+from mymcp.data_types.slot import Slot
+from mymcp.packets.v769 import PacketsV769
+from mymcp.world.container import (
+    PLAYER_WINDOW, PLAYER_WINDOW_SIZE, ContainerManager, inventory_to_window_slot
+)
+
+WINDOW = 3
+SIZE = 63
+
+
+def slot_bytes(item_id: int, count: int = 1) -> bytes:
+    return VarInt.encode(count) + VarInt.encode(item_id) + VarInt.encode(0) + VarInt.encode(0)
+
+
+STONE = slot_bytes(1, 64)
+
+
+def set_content_payload(state_id: int = 7) -> bytes:
+    """
+        偶数下标为 STONE，奇数为空，光标为 STONE
+    :param state_id:
+    :return:
+    """
+    slots = b''.join(STONE if index % 2 == 0 else b'\x00' for index in range(SIZE))
+    return UnsignedByte.encode(WINDOW) + VarInt.encode(state_id) + VarInt.encode(SIZE) + slots + STONE
+
+
+def manager() -> tuple[ContainerManager, list]:
+    events = []
+    containers = ContainerManager()
+    containers.listeners.append(lambda window_id, indexes: events.append((window_id, list(indexes))))
+    return containers, events
+
+
+@pytest.mark.parametrize('decoded', [False, True])
+def test_set_content_reports_only_changed_slots(decoded):
+    containers, events = manager()
+    payload = set_content_payload()
+    packet = PacketsV769.PCContainerSetContent.decode(payload) if decoded else payload
+
+    changed = containers.apply_set_content(packet)
+    window = containers.windows[WINDOW]
+    assert changed == list(range(0, SIZE, 2))
+    assert (len(window), window.state_id) == (SIZE, 7)
+    assert window.raw[0] == STONE and window.is_empty(1)
+    assert window.item(0) == Slot.decode(BytesIO(STONE))
+    assert events == [(WINDOW, changed), (None, [])]
+    assert containers.cursor_raw == STONE
+
+    # 内容不变时不再通知
+    assert containers.apply_set_content(packet) == []
+    assert len(events) == 2
+
+    packet = PacketsV769.PCContainerSetContent.decode(payload)
+    packet.slot_data[5] = Slot.decode(BytesIO(slot_bytes(2, 3)))
+    assert containers.apply(packet) == [5]
+    assert window.item(5).item_id.value == 2 and window.item(5).item_count.value == 3
+
+
+def test_payload_and_decoded_packet_agree():
+    payload = set_content_payload()
+    raw_manager, _ = manager()
+    decoded_manager, _ = manager()
+    raw_manager.apply_set_content(payload)
+    decoded_manager.apply_set_content(PacketsV769.PCContainerSetContent.decode(payload))
+
+    assert raw_manager.windows[WINDOW].raw == decoded_manager.windows[WINDOW].raw
+    assert raw_manager.windows[WINDOW].items == decoded_manager.windows[WINDOW].items
+    assert raw_manager.cursor == decoded_manager.cursor
+
+
+def test_set_slot_player_inventory_and_cursor():
+    containers, events = manager()
+    containers.apply_set_content(set_content_payload())
+    events.clear()
+
+    packet = PacketsV769.PCContainerSetSlot.decode(
+        Byte.encode(WINDOW) + VarInt.encode(8) + Short.encode(1) + slot_bytes(9)
+    )
+    assert containers.apply(packet) == [1]
+    assert containers.apply(packet) == []
+    assert containers.windows[WINDOW].state_id == 8
+
+    packet = PacketsV769.PCSetPlayerInventory.decode(VarInt.encode(0) + STONE)
+    assert containers.apply(packet) == [inventory_to_window_slot(0)] == [36]
+    assert len(containers.player) == PLAYER_WINDOW_SIZE
+    assert events == [(WINDOW, [1]), (PLAYER_WINDOW, [36])]
+
+    cursor = slot_bytes(5, 2)
+    assert containers.apply(PacketsV769.PCSetCursorItem.decode(cursor)) is True
+    assert containers.apply(PacketsV769.PCSetCursorItem.decode(cursor)) is False
+    assert containers.cursor.item_id.value == 5
+
+    assert [inventory_to_window_slot(_) for _ in (0, 8, 9, 35, 36, 39, 40)] == [36, 44, 9, 35, 8, 5, 45]
+    with pytest.raises(ValueError):
+        inventory_to_window_slot(41)
+
+
+def test_click_sends_only_local_differences():
+    containers, events = manager()
+    containers.apply_set_content(set_content_payload())
+    events.clear()
+
+    # 下标 2 与本地相同，不包含在 changed_slots 中
+    same = Slot.decode(BytesIO(STONE))
+    click = containers.click(WINDOW, 0, 0, 0, {0: None, 1: Slot.decode(BytesIO(slot_bytes(2))), 2: same})
+    assert [_.slot_number.value for _ in click.changed_slots] == [0, 1]
+    assert click.changed_slots[0].slot_data.item_count.value == 0
+    assert click.state_id.value == 7
+    assert PacketsV769.PSContainerClick.decode(bytes(click)) == click
+
+    window = containers.windows[WINDOW]
+    assert window.is_empty(0) and window.item(1).item_id.value == 2
+    assert events == [(WINDOW, [0, 1]), (None, [])]
+
+    # 已预测，再次点击无变化
+    assert containers.click(WINDOW, 0, 0, 0, {0: None}, predict=False).changed_slots == []
+
+
+def test_close_keeps_player_window():
+    containers, _ = manager()
+    containers.apply_set_content(set_content_payload())
+    containers.apply(PacketsV769.PCContainerSetData.decode(
+        UnsignedByte.encode(WINDOW) + Short.encode(0) + Short.encode(100)
+    ))
+    assert containers.windows[WINDOW].properties == {0: 100}
+
+    assert containers.apply(PacketsV769.PSContainerClose.decode(VarInt.encode(WINDOW))).window_id == WINDOW
+    assert containers.apply(PacketsV769.PSContainerClose.decode(VarInt.encode(PLAYER_WINDOW))) is None
+    assert list(containers.windows) == [PLAYER_WINDOW]
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+    test_diff
+    ~~~~~~~~~~~~~~~~~~
+    BlockDiffEncoder 回退重发 Chunk
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+import random
+
+from mymcp.world.builder import ChunkPacketBuilder
+from mymcp.world.column import ChunkColumn
+from mymcp.world.diff import BlockDiffEncoder
+from mymcp.world.store import ChunkStore
+
+
+def make_store() -> tuple[ChunkStore, ChunkColumn]:
+    store = ChunkStore()
+    column = store.add_column(ChunkColumn(2, -3, [0] * 24, [0] * 24, [0] * 24))
+    return store, column
+
+
+def fill_section(store: ChunkStore, seed: int) -> None:
+    random.seed(seed)
+    for y in range(16):
+        for z in range(16):
+            for x in range(16):
+                store.set_block(32 + x, y, -48 + z, random.randrange(1, 500))
+
+
+def test_fallback_without_attached_builder_is_current():
+    store, column = make_store()
+    encoder = BlockDiffEncoder(compression_threshold=256)
+
+    stale = encoder.builder.frame(column)
+    before = encoder.snapshot(column)
+    fill_section(store, 1)
+
+    frames = encoder.diff_frames(before, column)
+    assert encoder.fallbacks == 1
+    assert frames == [encoder.builder.encode(column)]
+    assert frames[0] != stale
+
+
+def test_fallback_with_attached_builder_uses_store_version():
+    store, column = make_store()
+    builder = ChunkPacketBuilder(256)
+    builder.attach(store)
+    encoder = BlockDiffEncoder(compression_threshold=256, builder=builder)
+
+    stale = builder.frame(column)
+    before = encoder.snapshot(column)
+    fill_section(store, 2)
+
+    frames = encoder.diff_frames(before, column)
+    assert encoder.fallbacks == 1
+    assert frames == [builder.encode(column)]
+    assert frames[0] != stale
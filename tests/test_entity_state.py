@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+    test_entity_state
+    ~~~~~~~~~~~~~~~~~~
+    EntityStateStore 增量合并、字段过滤通知与元数据下标过滤
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+import pytest
+
+from mymcp.data_types import Byte, Double, Float, Identifier, VarInt
+from mymcp.packets.v769 import PacketsV769
+from mymcp.world.entity_state import ATTRIBUTES, EFFECTS, EQUIPMENT, METADATA, EntityStateStore
+
+ENTITY_ID = 5
+
+# 0: Byte 2，9: 生命值 Float 20.0，6: Pose VarInt 0 (STANDING)
+METADATA_BYTES = (
+    bytes([0]) + VarInt.encode(0) + Byte.encode(2)
+    + bytes([9]) + VarInt.encode(3) + Float.encode(20.0)
+    + bytes([6]) + VarInt.encode(21) + VarInt.encode(0)
+    + b'\xff'
+)
+
+
+def health(value: float) -> bytes:
+    return bytes([9]) + VarInt.encode(3) + Float.encode(value)
+
+
+def entity_data(entity_id: int, metadata: bytes) -> bytes:
+    return VarInt.encode(entity_id) + metadata
+
+
+@pytest.mark.parametrize('decoded', [False, True])
+def test_metadata_merge_reports_changes(decoded):
+    store = EntityStateStore()
+
+    def apply(payload: bytes):
+        if decoded:
+            return store.apply(PacketsV769.PCSetEntityData.decode(payload))
+        return store.apply_set_entity_data(payload)
+
+    assert apply(entity_data(ENTITY_ID, METADATA_BYTES)) == {0: 2, 9: 20.0, 6: 0}
+    assert apply(entity_data(ENTITY_ID, health(20.0) + b'\xff')) == {}
+    unchanged_flags = bytes([0]) + VarInt.encode(0) + Byte.encode(2)
+    assert apply(entity_data(ENTITY_ID, health(12.0) + unchanged_flags + b'\xff')) == {9: 12.0}
+
+    state = store.get(ENTITY_ID)
+    assert [state.get_metadata(_) for _ in (0, 6, 9)] == [2, 0, 12.0]
+    assert not state.has_metadata(7) and state.get_metadata(7, 'x') == 'x'
+    assert list(state.metadata_types) == [0, -1, -1, -1, -1, -1, 21, -1, -1, 3]
+
+
+@pytest.mark.parametrize('decoded', [False, True])
+def test_metadata_indexes_filter(decoded):
+    store = EntityStateStore(metadata_indexes=[9])
+    payload = entity_data(ENTITY_ID, METADATA_BYTES)
+    packet = PacketsV769.PCSetEntityData.decode(payload) if decoded else payload
+
+    assert store.apply_set_entity_data(packet) == {9: 20.0}
+    state = store.get(ENTITY_ID)
+    assert not state.has_metadata(0) and not state.has_metadata(6)
+
+
+def test_watch_filters_by_kind_and_key():
+    store = EntityStateStore()
+    calls = []
+    store.watch(METADATA, lambda entity_id, kind, changes: calls.append(('health', entity_id, changes)), keys=[9])
+
+    def everything(entity_id, kind, changes):
+        calls.append(('all', entity_id, changes))
+
+    store.watch(METADATA, everything)
+    store.watch(EFFECTS, lambda entity_id, kind, changes: calls.append(('effects', entity_id, changes)))
+
+    store.apply_set_entity_data(entity_data(ENTITY_ID, METADATA_BYTES))
+    assert calls == [('all', ENTITY_ID, {0: 2, 9: 20.0, 6: 0}), ('health', ENTITY_ID, {9: 20.0})]
+
+    calls.clear()
+    store.apply_set_entity_data(entity_data(ENTITY_ID, bytes([0]) + VarInt.encode(0) + Byte.encode(3) + b'\xff'))
+    assert calls == [('all', ENTITY_ID, {0: 3})]
+
+    calls.clear()
+    store.apply(PacketsV769.PCUpdateMobEffect.decode(
+        VarInt.encode(ENTITY_ID) + VarInt.encode(1) + VarInt.encode(0) + VarInt.encode(200) + Byte.encode(2)
+    ))
+    store.apply(PacketsV769.PCRemoveMobEffect.decode(VarInt.encode(ENTITY_ID) + VarInt.encode(1)))
+    store.apply(PacketsV769.PCRemoveMobEffect.decode(VarInt.encode(ENTITY_ID) + VarInt.encode(1)))
+    assert calls == [('effects', ENTITY_ID, {1: (0, 200, 2)}), ('effects', ENTITY_ID, {1: None})]
+
+    store.unwatch(everything)
+    assert (METADATA, None) not in store.watchers and (METADATA, 9) in store.watchers
+
+
+def test_attributes_and_equipment_merge():
+    store = EntityStateStore()
+    calls = []
+    store.watch(ATTRIBUTES, lambda entity_id, kind, changes: calls.append(kind))
+    store.watch(EQUIPMENT, lambda entity_id, kind, changes: calls.append(kind), keys=[5])
+
+    attributes = PacketsV769.PCUpdateAttributes.decode(
+        VarInt.encode(ENTITY_ID) + VarInt.encode(2)
+        + VarInt.encode(16) + Double.encode(20.0) + VarInt.encode(0)
+        + VarInt.encode(21) + Double.encode(0.1) + VarInt.encode(1)
+        + Identifier.encode('minecraft:sprint') + Double.encode(0.3) + Byte.encode(2)
+    )
+    assert store.apply(attributes) == {16: (20.0, ()), 21: (0.1, (('minecraft:sprint', 0.3, 2),))}
+    assert store.apply(attributes) == {}
+
+    item = VarInt.encode(1) + VarInt.encode(812) + VarInt.encode(0) + VarInt.encode(0)
+    payload = VarInt.encode(ENTITY_ID) + Byte.encode(-128) + item + Byte.encode(5) + VarInt.encode(0)
+    equipment = PacketsV769.PCSetEquipment.decode(payload)
+    assert bytes(equipment) == payload
+
+    changes = store.apply(equipment)
+    assert sorted(changes) == [0, 5]
+    assert changes[0].item_id.value == 812 and changes[5].item_count.value == 0
+    assert store.apply(equipment) == {}
+    assert calls == [ATTRIBUTES, EQUIPMENT]
+
+    assert store.apply(PacketsV769.PCRemoveEntities.decode(VarInt.encode(1) + VarInt.encode(ENTITY_ID))) == 1
+    assert ENTITY_ID not in store and len(store) == 0
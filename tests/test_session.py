@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+    test_session
+    ~~~~~~~~~~~~~~~~~~
+    ProtocolSession 状态切换、压缩阈值与维度高度
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+from mymcp.data_types import (
+    Boolean, Byte, Identifier, Int, Long, NBT, OptionalNBT, String, UnsignedByte, UnsignedShort, UUID, VarInt
+)
+from mymcp.data_types.nbt import TagCompoundNet, TagInt
+from mymcp.packets import Codec
+from mymcp.packets.enums import Enums
+from mymcp.packets.session import ProtocolSession
+from mymcp.packets.v769 import PacketsV769
+from mymcp.world.builder import ChunkPacketBuilder
+from mymcp.world.column import ChunkColumn
+
+THRESHOLD = 256
+
+
+def frame(packet, threshold: int = THRESHOLD) -> bytes:
+    return Codec.encode_by_threshold(threshold, packet.data_packet)
+
+
+def registry() -> PacketsV769.CCRegistryData:
+    nether = NBT(TagCompoundNet(value=[TagInt(name='min_y', value=0), TagInt(name='height', value=256)]))
+    return PacketsV769.CCRegistryData(Identifier(ProtocolSession.DIMENSION_TYPE_REGISTRY), [
+        PacketsV769.CCRegistryData.Entity(Identifier('minecraft:overworld'), OptionalNBT(None)),
+        PacketsV769.CCRegistryData.Entity(Identifier('minecraft:the_nether'), OptionalNBT(nether)),
+    ])
+
+
+def login(dimension_type: int, dimension_name: str) -> PacketsV769.PCLogin:
+    return PacketsV769.PCLogin(
+        Int(1), Boolean(False), [Identifier(dimension_name)], VarInt(20), VarInt(10), VarInt(10),
+        Boolean(False), Boolean(True), Boolean(False), VarInt(dimension_type), Identifier(dimension_name),
+        Long(0), UnsignedByte(0), Byte(-1), Boolean(False), Boolean(False), Boolean(False), None, None,
+        VarInt(0), VarInt(63), Boolean(False)
+    )
+
+
+def client_stream() -> bytes:
+    column = ChunkColumn(1, 2, [1] * 16, [0] * 16, [0] * 16)
+    return (
+        frame(PacketsV769.LCLoginCompression(VarInt(THRESHOLD)), -1)
+        + frame(PacketsV769.LCLoginFinished(UUID(), String('me'), []))
+        + frame(registry())
+        + frame(PacketsV769.CCFinishConfiguration())
+        + frame(login(1, 'minecraft:the_nether'))
+        + ChunkPacketBuilder(THRESHOLD).encode(column)
+    )
+
+
+def test_client_stream_switches_status_threshold_and_dimension():
+    session = ProtocolSession(Enums.Status.LOGIN)
+    codec = session.attach(Codec(Enums.BoundTo.CLIENT))
+    stream = client_stream()
+
+    # 在压缩包中间截断，后半部分由下一批次继续解码
+    packets = [packet for _, packet in session.feed(codec, stream[:50])]
+    packets += [packet for _, packet in session.feed(codec, stream[50:])]
+
+    assert [_.__class__ for _ in packets] == [
+        PacketsV769.LCLoginCompression, PacketsV769.LCLoginFinished, PacketsV769.CCRegistryData,
+        PacketsV769.CCFinishConfiguration, PacketsV769.PCLogin, PacketsV769.PCLevelChunkWithLight
+    ]
+    assert session.status == {Enums.BoundTo.CLIENT: Enums.Status.PLAY, Enums.BoundTo.SERVER: Enums.Status.LOGIN}
+    assert session.compression_threshold == codec.compression_threshold == THRESHOLD
+    assert session.dimension_types == [('minecraft:overworld', -64, 384), ('minecraft:the_nether', 0, 256)]
+    assert (session.dimension_name, session.min_y, session.height) == ('minecraft:the_nether', 0, 256)
+
+    chunk = packets[-1]
+    assert (chunk.chunk_x.value, chunk.chunk_z.value) == (1, 2)
+    assert len(chunk.data.chunk_sections) == session.section_count == 16
+
+
+def test_server_stream_follows_intention_and_acknowledgements():
+    session = ProtocolSession()
+    codec = session.attach(Codec(Enums.BoundTo.SERVER))
+
+    intention = PacketsV769.HSIntention(VarInt(769), String('localhost'), UnsignedShort(25565), VarInt(2))
+    stream = frame(intention, -1) + frame(PacketsV769.LSLoginAcknowledged(), -1)
+    assert [_.__class__ for _ in (packet for _, packet in session.feed(codec, stream))] == [
+        PacketsV769.HSIntention, PacketsV769.LSLoginAcknowledged
+    ]
+    assert session.status == {
+        Enums.BoundTo.CLIENT: Enums.Status.LOGIN, Enums.BoundTo.SERVER: Enums.Status.CONFIGURATION
+    }
+
+    session.observe(PacketsV769.CSFinishConfiguration())
+    assert session.status[Enums.BoundTo.SERVER] is Enums.Status.PLAY
+    session.observe(PacketsV769.PSConfigurationAcknowledged())
+    assert session.status[Enums.BoundTo.SERVER] is Enums.Status.CONFIGURATION
+
+
+def test_respawn_without_registry_uses_builtin_heights():
+    session = ProtocolSession(Enums.Status.PLAY)
+    session.observe(login(3, 'minecraft:the_end'))
+    assert (session.min_y, session.height, session.section_count) == (0, 256, 16)
+
+    session.set_dimension(0, 'minecraft:custom')
+    assert (session.min_y, session.height) == ProtocolSession.DEFAULT_DIMENSION
+
+
+def test_attach_applies_current_threshold():
+    session = ProtocolSession()
+    session.set_compression_threshold(64)
+    codec = session.attach(Codec(Enums.BoundTo.CLIENT))
+    assert codec.compression_threshold == 64
+
+    session.set_compression_threshold(-1)
+    assert codec.compression_threshold == -1
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+    test_slot
+    ~~~~~~~~~~~~~~~~~~
+    SlotCache 安装后的 Slot.decode，缓存 Slot 只读，缓存/延迟/完整解码结果一致
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+from dataclasses import FrozenInstanceError
+from io import BytesIO
+
+import pytest
+
+from mymcp.data_types import VarInt
+from mymcp.data_types.frozen import is_frozen, thaw
+from mymcp.data_types.slot import LazyComponent, Slot, SlotCache
+
+# 1 个 minecraft:stone，max_stack_size = 16
+SLOT_BYTES = b'\x01\x01\x01\x00\x01\x10'
+
+NBT_BYTES = b'\x0a\x08\x00\x01a\x00\x01b\x00'
+
+# 嵌套 Slot 的 container Component
+INNER_SLOT_BYTES = (
+    VarInt.encode(1) + VarInt.encode(5) + VarInt.encode(1) + VarInt.encode(0)
+    + VarInt.encode(0) + NBT_BYTES
+)
+
+# custom_data (NBT) + container (27 个嵌套 Slot) + damage，移除 1 个 Component
+COMPLEX_SLOT_BYTES = (
+    VarInt.encode(1) + VarInt.encode(812) + VarInt.encode(3) + VarInt.encode(1)
+    + VarInt.encode(0) + NBT_BYTES
+    + VarInt.encode(62) + VarInt.encode(27) + (INNER_SLOT_BYTES + b'\x00') * 13 + INNER_SLOT_BYTES
+    + VarInt.encode(3) + VarInt.encode(5)
+    + VarInt.encode(7)
+)
+
+SLOTS = [b'\x00', SLOT_BYTES, INNER_SLOT_BYTES, COMPLEX_SLOT_BYTES]
+
+
+def test_installed_lazy_cache_used_by_default_decode():
+    cache = SlotCache(lazy=True).install()
+    try:
+        slot = Slot.decode(BytesIO(SLOT_BYTES))
+        assert Slot.decode(BytesIO(SLOT_BYTES)) is slot
+        assert isinstance(slot.components_to_add[0], LazyComponent)
+        assert cache.hits == 1 and cache.misses == 1
+
+        eager = Slot.decode(BytesIO(SLOT_BYTES), lazy=False)
+        assert eager is not slot
+        assert not isinstance(eager.components_to_add[0], LazyComponent)
+    finally:
+        cache.uninstall()
+
+
+def test_cached_slot_is_frozen():
+    cache = SlotCache()
+    slot = cache.get(SLOT_BYTES)
+    assert cache.get(SLOT_BYTES) is slot and is_frozen(slot)
+    assert slot == Slot.decode_uncached(BytesIO(SLOT_BYTES))
+
+    with pytest.raises(FrozenInstanceError):
+        slot.item_count = VarInt(2)
+    with pytest.raises(FrozenInstanceError):
+        slot.item_count.value = 2
+    with pytest.raises(TypeError):
+        slot.components_to_add.append(slot.components_to_add[0])
+
+    copy = thaw(slot)
+    copy.item_count.value = 2
+    copy.components_to_add.clear()
+    assert cache.get(SLOT_BYTES).bytes == SLOT_BYTES
+    assert copy.bytes != SLOT_BYTES
+
+
+def test_cached_lazy_component_not_written_back():
+    cache = SlotCache(lazy=True)
+    component = cache.get(SLOT_BYTES).components_to_add[0]
+    eager = Slot.decode_uncached(BytesIO(SLOT_BYTES)).components_to_add[0]
+
+    data = component.data
+    assert component.data is data and is_frozen(data)
+    assert data == eager.data
+    assert not component.decoded
+    assert cache.get(SLOT_BYTES).bytes == SLOT_BYTES
+
+
+@pytest.mark.parametrize('raw', SLOTS)
+def test_cached_decode_equals_uncached(raw):
+    eager = Slot.decode_uncached(BytesIO(raw))
+    assert eager.bytes == raw
+
+    cache = SlotCache()
+    for _ in range(2):
+        bytes_io = BytesIO(raw + b'XY')
+        slot = cache.decode(bytes_io)
+        assert bytes_io.read() == b'XY'
+        assert slot == eager and slot.bytes == raw
+    assert cache.hits == 1 and cache.misses == 1
+
+
+@pytest.mark.parametrize('raw', SLOTS)
+def test_lazy_decode_equals_eager(raw):
+    eager = Slot.decode_uncached(BytesIO(raw))
+    lazy = Slot.decode(BytesIO(raw), lazy=True)
+    cached = SlotCache(lazy=True).get(raw)
+
+    for slot in (lazy, cached):
+        assert slot.bytes == raw and slot == eager
+        components = slot.components_to_add or []
+        assert all(isinstance(_, LazyComponent) for _ in components)
+        assert [_.name for _ in components] == [_.name for _ in eager.components_to_add or []]
+        assert [_.data for _ in components] == [_.data for _ in eager.components_to_add or []]
+        # 访问 data 后仍按原始 bytes 编码
+        assert slot.bytes == raw
+
+
+def test_lazy_component_reencodes_after_assignment():
+    lazy = Slot.decode(BytesIO(COMPLEX_SLOT_BYTES), lazy=True)
+    lazy.components_to_add[2].data = VarInt(9)
+
+    eager = Slot.decode_uncached(BytesIO(COMPLEX_SLOT_BYTES))
+    eager.components_to_add[2].data = VarInt(9)
+    assert lazy.bytes == eager.bytes != COMPLEX_SLOT_BYTES
+    assert Slot.decode(BytesIO(lazy.bytes), lazy=True) == lazy
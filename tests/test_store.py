@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+    test_store
+    ~~~~~~~~~~~~~~~~~~
+    ChunkStore 内容驻留与写时复制
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+from array import array
+
+from mymcp.data_types.chunk import ARRAY_TYPECODE, ContentInterner
+from mymcp.world.column import ChunkColumn
+from mymcp.world.store import ChunkStore
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def section(value: int):
+    values = [value] * 4095 + [value + 1]
+    return array(ARRAY_TYPECODE, values) if np is None else np.array(values, dtype=np.uint16)
+
+
+def test_set_block_after_interner_eviction():
+    interner = ContentInterner(max_size=1)
+    store = ChunkStore(interner=interner)
+    blocks = [0] * 24
+    blocks[4], blocks[5] = section(1), section(2)
+    column = store.add_column(ChunkColumn(0, 0, blocks, [0] * 24, [0] * 24))
+
+    assert len(interner) == 1
+    store.set_block(0, 0, 0, 7)
+    store.set_block(0, 16, 0, 7)
+    assert store.get_block(0, 0, 0) == 7 and store.get_block(0, 16, 0) == 7
+
+
+def test_set_block_after_interner_clear():
+    interner = ContentInterner()
+    store = ChunkStore(interner=interner)
+    blocks = [0] * 24
+    blocks[4] = section(1)
+    store.add_column(ChunkColumn(0, 0, blocks, [0] * 24, [0] * 24))
+
+    interner.clear()
+    store.set_block(0, 0, 0, 7)
+    assert store.get_block(0, 0, 0) == 7
+
+
+def test_interner_evicts_least_recently_used():
+    interner = ContentInterner(max_size=2)
+    first, second, third = (interner.intern_buffer(section(_)) for _ in (1, 2, 3))
+    assert interner.intern_buffer(section(1)) is not first
+    assert len(interner) == 2 and interner.misses == 4
+
+    assert interner.intern_buffer(section(3)) is third
+    assert interner.hits == 1
+
+
+def test_shared_section_copied_after_interner_clear():
+    interner = ContentInterner()
+    store = ChunkStore(interner=interner)
+    for chunk_x in range(2):
+        blocks = [0] * 24
+        blocks[4] = section(1)
+        store.add_column(ChunkColumn(chunk_x, 0, blocks, [0] * 24, [0] * 24))
+    assert store.column(0, 0).blocks[4] is store.column(1, 0).blocks[4]
+
+    interner.clear()
+    store.set_block(0, 0, 0, 7)
+    assert store.get_block(0, 0, 0) == 7
+    assert store.get_block(16, 0, 0) == 1
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+    test_subscription
+    ~~~~~~~~~~~~~~~~~~
+    SubscriptionRegistry 选择性解码与未订阅包处理
+
+    Log:
+        2026-10-19 0.2.1 Me2sY  创建
+"""
+
+__author__ = 'Me2sY'
+__version__ = '0.2.1'
+
+import pytest
+
+from mymcp.data_types import Boolean, Byte, DataPacket, Identifier, Int, Long, UnsignedByte, VarInt
+from mymcp.packets import Codec
+from mymcp.packets.enums import Enums
+from mymcp.packets.session import ProtocolSession
+from mymcp.packets.subscription import SubscriptionRegistry
+from mymcp.packets.v769 import PacketsV769
+from mymcp.world.builder import ChunkPacketBuilder
+from mymcp.world.column import ChunkColumn
+
+THRESHOLD = 256
+
+
+def play_stream() -> bytes:
+    """
+        PCLogin (下界，未订阅但由 session 关注) + 16 Section Chunk + PCKeepAlive
+    :return:
+    """
+    login = PacketsV769.PCLogin(
+        Int(1), Boolean(False), [Identifier('minecraft:the_nether')], VarInt(20), VarInt(10), VarInt(10),
+        Boolean(False), Boolean(True), Boolean(False), VarInt(1), Identifier('minecraft:the_nether'),
+        Long(0), UnsignedByte(0), Byte(-1), Boolean(False), Boolean(False), Boolean(False), None, None,
+        VarInt(0), VarInt(63), Boolean(False)
+    )
+    column = ChunkColumn(1, 2, [1] * 16, [0] * 16, [0] * 16)
+    return (
+        Codec.encode_by_threshold(THRESHOLD, login.data_packet)
+        + ChunkPacketBuilder(THRESHOLD).encode(column)
+        + Codec.encode_by_threshold(THRESHOLD, PacketsV769.PCKeepAlive(Long(7)).data_packet)
+    )
+
+
+def registry(unsubscribed: int, forwarded: list) -> tuple[SubscriptionRegistry, Codec]:
+    session = ProtocolSession(Enums.Status.PLAY)
+    session.set_compression_threshold(THRESHOLD)
+    codec = session.attach(Codec(Enums.BoundTo.CLIENT))
+    return SubscriptionRegistry(unsubscribed, forward=forwarded.append, session=session), codec
+
+
+@pytest.mark.parametrize('unsubscribed, expected, forwarded_count', [
+    (SubscriptionRegistry.PASS, [DataPacket, PacketsV769.PCLevelChunkWithLight, DataPacket], 0),
+    (SubscriptionRegistry.DROP, [PacketsV769.PCLevelChunkWithLight], 0),
+    (SubscriptionRegistry.FORWARD, [PacketsV769.PCLevelChunkWithLight], 2),
+])
+def test_unsubscribed_modes(unsubscribed, expected, forwarded_count):
+    forwarded, chunks = [], []
+    subscriptions, codec = registry(unsubscribed, forwarded)
+    subscriptions.subscribe(PacketsV769.PCLevelChunkWithLight, chunks.append)
+
+    results = list(subscriptions.feed(codec, play_stream()))
+    assert [_.__class__ for _ in results] == expected
+    assert len(forwarded) == forwarded_count
+    assert all(isinstance(_, DataPacket) for _ in forwarded)
+
+    # PCLogin 仅由 session 关注，仍须解码以切换维度高度
+    session = subscriptions.session
+    assert (session.dimension_name, session.height) == ('minecraft:the_nether', 256)
+    assert len(chunks) == 1 and len(chunks[0].data.chunk_sections) == 16
+    assert (chunks[0].chunk_x.value, chunks[0].chunk_z.value) == (1, 2)
+
+
+def test_raw_pid_subscription_skips_decoding():
+    raw, decoded = [], []
+    subscriptions, codec = registry(SubscriptionRegistry.DROP, [])
+    subscriptions.subscribe_pid(
+        lambda status, bound_to, pid: (
+            status is Enums.Status.PLAY and bound_to is Enums.BoundTo.CLIENT
+            and pid == PacketsV769.PCKeepAlive.PACKET_ID_HEX
+        ),
+        raw.append, raw=True
+    )
+    subscriptions.subscribe(PacketsV769.PCKeepAlive, decoded.append)
+
+    results = list(subscriptions.feed(codec, play_stream()))
+    assert [_.__class__ for _ in results] == [PacketsV769.PCKeepAlive]
+    assert len(raw) == 1 and raw[0].pid == PacketsV769.PCKeepAlive.PACKET_ID_HEX
+    assert decoded == results
+
+
+def test_unsubscribe_rebuilds_table():
+    subscriptions, codec = registry(SubscriptionRegistry.PASS, [])
+    handler = subscriptions.subscribe(PacketsV769.PCLevelChunkWithLight, lambda packet: None)
+    subscriptions.unsubscribe(handler)
+
+    assert not subscriptions.handlers
+    assert all(isinstance(_, DataPacket) for _ in subscriptions.feed(codec, play_stream()))
+    assert subscriptions.session.height == 256
+
+
+def test_forward_requires_callable():
+    with pytest.raises(ValueError):
+        SubscriptionRegistry(SubscriptionRegistry.FORWARD)